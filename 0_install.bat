@@ -30,6 +30,7 @@ call venv\Scripts\activate.bat
 
 if not exist "requirements.txt" (
     echo requests^>=2.31.0>requirements.txt
+    echo urllib3^>=2.0>>requirements.txt
     echo beautifulsoup4^>=4.12.0>>requirements.txt
     echo lxml^>=4.9.0>>requirements.txt
     echo tqdm^>=4.66.0>>requirements.txt
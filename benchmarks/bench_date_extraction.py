@@ -0,0 +1,146 @@
+"""
+Benchmark de la recherche de dates : les 14 expressions appliquées une à une
+avec analyse floue de dateutil (ancienne méthode) contre le DateScanner compilé.
+
+Usage:
+    python benchmarks/bench_date_extraction.py [nombre_d_extraits]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import datetime
+from dateutil.parser import parse as parse_date
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.date_scanner import DateScanner
+
+FRENCH_MONTHS = [
+    "janvier",
+    "février",
+    "mars",
+    "avril",
+    "mai",
+    "juin",
+    "juillet",
+    "août",
+    "septembre",
+    "octobre",
+    "novembre",
+    "décembre",
+]
+ENGLISH_MONTHS = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+# Expressions de l'ancienne implémentation de DateExtractor
+LEGACY_PATTERNS = [
+    r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})",
+    r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})",
+    r"(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})",
+    r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})",
+    r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",
+    r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})",
+    r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),\s+(\d{4})",
+    r"(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{1,2}),?\s+(\d{4})",
+    r"(\d{4})(\d{2})(\d{2})",
+    r"(\d{4})[/-](\d{2})[/-](\d{2})T\d{2}:\d{2}",
+    r"(\d{4})[/-](\d{2})[/-](\d{2})T\d{2}:\d{2}:\d{2}",
+    r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",
+    r"(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})",
+    r"(lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche),?\s+(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})",
+]
+FRENCH_TO_ENGLISH = dict(
+    zip(FRENCH_MONTHS, [month.lower() for month in ENGLISH_MONTHS])
+)
+
+
+def legacy_normalize(date_str):
+    """Ancienne normalisation : traduction des mois puis dateutil fuzzy"""
+    try:
+        for fr_month, en_month in FRENCH_TO_ENGLISH.items():
+            if fr_month in date_str.lower():
+                date_str = date_str.lower().replace(fr_month, en_month)
+        date_str = re.sub(r"[^\w\s\-:/.]", "", date_str.strip())
+        dt = parse_date(date_str, fuzzy=True)
+        if dt.year < 1990 or dt.year > datetime.datetime.now().year + 1:
+            return None
+        return dt.strftime("%Y-%m-%d")
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def legacy_scan(text):
+    """Ancienne recherche : chaque expression, puis normalisation de chaque occurrence"""
+    dates = []
+    for pattern in LEGACY_PATTERNS:
+        for match in re.findall(pattern, text):
+            if isinstance(match, tuple):
+                match = " ".join(match)
+            date = legacy_normalize(match)
+            if date:
+                dates.append(date)
+    return dates
+
+
+def build_snippets(count, seed=0):
+    """Génère des extraits de texte contenant chacun une date dans un format courant"""
+    rng = random.Random(seed)
+    snippets = []
+    for _ in range(count):
+        year = rng.randint(2000, 2024)
+        month = rng.randint(1, 12)
+        day = rng.randint(1, 28)
+        date = rng.choice(
+            [
+                f"{year}-{month:02d}-{day:02d}",
+                f"{year}-{month:02d}-{day:02d}T08:30:00",
+                f"{day:02d}/{month:02d}/{year}",
+                f"{day} {FRENCH_MONTHS[month - 1]} {year}",
+                f"{day} {ENGLISH_MONTHS[month - 1]} {year}",
+                f"{ENGLISH_MONTHS[month - 1]} {day}, {year}",
+            ]
+        )
+        snippets.append(f"Publié le {date} par la rédaction")
+    return snippets
+
+
+def bench(name, scan, snippets):
+    """Mesure le débit d'une fonction de recherche"""
+    start = time.perf_counter()
+    found = sum(len(scan(snippet)) for snippet in snippets)
+    elapsed = time.perf_counter() - start
+    # L'ancienne méthode compte plusieurs fois une même date reconnue par
+    # plusieurs expressions : le débit en extraits/s est la mesure comparable
+    print(
+        f"{name:<22} {len(snippets) / elapsed:>10.0f} extraits/s"
+        f" {found / elapsed:>10.0f} dates/s  ({elapsed:.2f}s, {found} dates)"
+    )
+    return elapsed
+
+
+if __name__ == "__main__":
+    snippet_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    snippets = build_snippets(snippet_count)
+
+    print("=== BENCHMARK RECHERCHE DE DATES ===")
+    print(f"{snippet_count} extraits de texte\n")
+
+    legacy_time = bench("regex + dateutil", legacy_scan, snippets)
+    scanner_time = bench("DateScanner", DateScanner().scan, snippets)
+
+    print(f"\nAccélération: x{legacy_time / scanner_time:.1f}")
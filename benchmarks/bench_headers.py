@@ -0,0 +1,65 @@
+"""
+Benchmark de la génération des en-têtes HTTP : un UserAgent() construit à
+chaque requête (ancienne méthode) contre le pool de profils partagé.
+
+Usage:
+    python benchmarks/bench_headers.py [nombre_d_en_tetes] [threads]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fake_useragent import UserAgent
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.common_utils import BROWSER_HEADERS, HeaderProfilePool
+
+
+def legacy_headers():
+    """Ancienne méthode : chargement des données de fake_useragent à chaque appel"""
+    return dict(BROWSER_HEADERS, **{"User-Agent": UserAgent().random})
+
+
+def bench(name, generate, count, threads=1):
+    """Mesure le nombre d'en-têtes générés par seconde"""
+    start = time.perf_counter()
+    if threads == 1:
+        for _ in range(count):
+            generate()
+    else:
+        # Chaque thread génère sa part d'en-têtes en boucle
+        def worker(share):
+            for _ in range(share):
+                generate()
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(worker, [count // threads] * threads))
+        count = (count // threads) * threads
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {count / elapsed:>12.0f} en-têtes/s  ({elapsed:.2f}s)")
+    return count / elapsed
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    legacy_count = max(1, min(count, 50))
+
+    print("=== BENCHMARK GÉNÉRATION DES EN-TÊTES ===")
+    print(
+        f"{count} en-têtes ({legacy_count} pour l'ancienne méthode), {threads} threads\n"
+    )
+
+    legacy_rate = bench("UserAgent() par requête", legacy_headers, legacy_count)
+
+    pool = HeaderProfilePool()
+    start = time.perf_counter()
+    pool.next()
+    print(f"{'Chargement du pool':<28} {time.perf_counter() - start:>12.3f} s")
+
+    pool_rate = bench("Pool de profils", pool.next, count)
+    bench(f"Pool de profils ({threads} threads)", pool.next, count, threads)
+
+    print(f"\nAccélération: x{pool_rate / legacy_rate:.0f}")
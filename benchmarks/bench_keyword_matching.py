@@ -0,0 +1,119 @@
+"""
+Benchmark de la recherche de mots-clés : une regex par mot-clé (findall puis
+finditer) contre l'automate multi-motifs de KeywordMatcher.
+
+Usage:
+    python benchmarks/bench_keyword_matching.py [nombre_de_pages] [nombre_de_mots_cles]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.keyword_matcher import KeywordMatcher, ahocorasick
+
+WORDS = [
+    "prix",
+    "marché",
+    "gouvernement",
+    "publication",
+    "entreprise",
+    "économie",
+    "élection",
+    "santé",
+    "Europe",
+    "région",
+    "projet",
+    "culture",
+    "sport",
+    "transport",
+    "énergie",
+    "climat",
+    "budget",
+    "réforme",
+    "emploi",
+    "logement",
+]
+
+
+def build_keywords(count, seed=0):
+    """Génère des mots-clés : mots courants et termes composés plus rares"""
+    rng = random.Random(seed)
+    keywords = list(WORDS[: min(count, len(WORDS))])
+    while len(keywords) < count:
+        keywords.append(
+            f"{rng.choice(WORDS)} {rng.choice(WORDS).lower()}{rng.randint(1, 999)}"
+        )
+    return keywords
+
+
+def build_text(words_per_page, seed=0):
+    """Construit le texte d'une page synthétique (après get_text)"""
+    rng = random.Random(seed)
+    filler = ["le", "la", "de", "des", "et", "pour", "avec", "dans", "sur", "une"]
+    vocabulary = filler * 4 + WORDS + [w.upper() for w in WORDS[:5]]
+    return " ".join(rng.choice(vocabulary) for _ in range(words_per_page))
+
+
+def regex_loop(keywords, case_sensitive):
+    """Reproduit l'ancienne recherche : une regex compilée par mot-clé"""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    patterns = {k: re.compile(re.escape(k), flags) for k in keywords}
+
+    def search(text):
+        found = {}
+        for keyword in keywords:
+            pattern = patterns[keyword]
+            count = len(pattern.findall(text))
+            if count:
+                spans = []
+                for match in pattern.finditer(text):
+                    if len(spans) >= 5:
+                        break
+                    spans.append(match.span())
+                found[keyword] = (count, spans)
+        return found
+
+    return search
+
+
+def bench(name, search, texts):
+    """Mesure le débit d'une fonction de recherche"""
+    start = time.perf_counter()
+    results = [search(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {len(texts) / elapsed:>10.1f} pages/s  ({elapsed:.2f}s)")
+    return elapsed, results
+
+
+if __name__ == "__main__":
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    keyword_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    keywords = build_keywords(keyword_count)
+    texts = [build_text(3000, seed) for seed in range(page_count)]
+    size_kb = sum(len(text) for text in texts) / len(texts) / 1024
+
+    print("=== BENCHMARK RECHERCHE DE MOTS-CLÉS ===")
+    print(
+        f"{page_count} pages, ~{size_kb:.0f} Ko de texte/page, {keyword_count} mots-clés"
+    )
+    print(f"Automate: {'pyahocorasick' if ahocorasick else 'Python pur'}\n")
+
+    for case_sensitive in (False, True):
+        print(f"Casse respectée: {'oui' if case_sensitive else 'non'}")
+        regex_time, regex_results = bench(
+            "regex par mot-clé", regex_loop(keywords, case_sensitive), texts
+        )
+        matcher = KeywordMatcher(keywords, case_sensitive)
+        matcher_time, matcher_results = bench("automate", matcher.scan, texts)
+
+        identical = regex_results == matcher_results
+        print(
+            f"Accélération: x{regex_time / matcher_time:.1f} - "
+            f"résultats identiques: {'oui' if identical else 'NON'}\n"
+        )
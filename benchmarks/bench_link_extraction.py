@@ -0,0 +1,72 @@
+"""
+Benchmark de l'extraction des liens : pages par seconde pour chaque parseur.
+
+Usage:
+    python benchmarks/bench_link_extraction.py [nombre_de_pages] [liens_par_page]
+"""
+
+import os
+import sys
+import time
+import random
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.link_extractor import extract_links_lxml, extract_links_soup
+
+
+def build_page(links_per_page, seed=0):
+    """Construit une page HTML synthétique proche d'un article de presse"""
+    rng = random.Random(seed)
+    head = "".join(
+        f'<link rel="stylesheet" href="/static/css/style{i}.css">' for i in range(5)
+    )
+    paragraphs = "".join(
+        f"<p>Paragraphe {i} : "
+        + " ".join(
+            rng.choice(["lorem", "ipsum", "dolor", "sit", "amet"]) for _ in range(60)
+        )
+        + "</p>"
+        for i in range(30)
+    )
+    links = "".join(
+        f'<li><a href="/rubrique/{rng.randint(1, 50)}/article-{rng.randint(1, 100000)}.html">'
+        f"Article {i}</a></li>"
+        for i in range(links_per_page)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Page de test</title>"
+        f"{head}</head><body><nav><ul>{links}</ul></nav>"
+        f"<article>{paragraphs}</article></body></html>"
+    )
+
+
+def bench(name, extract, pages, base_url):
+    """Mesure le débit d'une fonction d'extraction"""
+    start = time.perf_counter()
+    total_links = 0
+    for page in pages:
+        total_links += len(extract(page, base_url))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:<12} {len(pages) / elapsed:>10.1f} pages/s  "
+        f"({elapsed:.2f}s, {total_links} liens)"
+    )
+    return elapsed
+
+
+if __name__ == "__main__":
+    page_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    links_per_page = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    base_url = "https://www.example.com/rubrique/article.html"
+    pages = [build_page(links_per_page, seed) for seed in range(page_count)]
+    size_kb = sum(len(page) for page in pages) / len(pages) / 1024
+
+    print("=== BENCHMARK EXTRACTION DES LIENS ===")
+    print(f"{page_count} pages, {links_per_page} liens/page, ~{size_kb:.0f} Ko/page\n")
+
+    soup_time = bench("html.parser", extract_links_soup, pages, base_url)
+    lxml_time = bench("lxml", extract_links_lxml, pages, base_url)
+
+    print(f"\nAccélération lxml: x{soup_time / lxml_time:.1f}")
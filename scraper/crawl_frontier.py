@@ -0,0 +1,53 @@
+"""
+Module contenant la classe CrawlFrontier, la file des URLs restant à visiter.
+"""
+
+from collections import deque
+
+
+class CrawlFrontier:
+    def __init__(self, urls=None):
+        """
+        Initialise la frontière du crawl.
+
+        La file (deque) conserve l'ordre de découverte et un ensemble parallèle
+        permet de tester la présence d'une URL : ajout, retrait et
+        déduplication se font en temps constant.
+
+        Args:
+            urls (iterable, optional): URLs initiales à placer dans la file
+        """
+        self._queue = deque()
+        self._queued = set()
+
+        for url in urls or ():
+            self.add(url)
+
+    def add(self, url):
+        """
+        Ajoute une URL en fin de file si elle n'y est pas déjà.
+
+        Returns:
+            bool: True si l'URL a été ajoutée, False si elle était déjà en attente
+        """
+        if url in self._queued:
+            return False
+
+        self._queue.append(url)
+        self._queued.add(url)
+        return True
+
+    def pop(self):
+        """Retire et renvoie la plus ancienne URL de la file"""
+        url = self._queue.popleft()
+        self._queued.discard(url)
+        return url
+
+    def __contains__(self, url):
+        return url in self._queued
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
@@ -0,0 +1,118 @@
+"""
+Module contenant la classe CrawlState pour sauvegarder et reprendre un crawl.
+"""
+
+import os
+import sqlite3
+import threading
+import datetime
+
+
+class CrawlState:
+    def __init__(self, db_path):
+        """
+        Initialise le stockage SQLite de l'état du crawl.
+
+        Les URLs visitées sont ajoutées de manière incrémentale à chaque point
+        de sauvegarde, tandis que la frontière (URLs à visiter) est réécrite en
+        entier. Les URLs trouvées ne sont pas stockées ici : le fichier de
+        sortie du scraper fait foi.
+
+        Args:
+            db_path (str): Chemin du fichier SQLite
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS visited (url TEXT PRIMARY KEY)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS frontier (position INTEGER PRIMARY KEY, url TEXT)"
+            )
+
+    def _get_meta(self, key):
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key, value):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def can_resume(self, start_url):
+        """
+        Indique si un crawl interrompu peut être repris pour cette URL de départ.
+
+        Il faut que la phase sitemap soit terminée et qu'il reste des URLs à visiter.
+        """
+        with self.lock:
+            if self._get_meta("start_url") != start_url:
+                return False
+            if self._get_meta("phase") != "crawl":
+                return False
+            row = self.conn.execute("SELECT 1 FROM frontier LIMIT 1").fetchone()
+            return row is not None
+
+    def load(self):
+        """
+        Charge l'état sauvegardé.
+
+        Returns:
+            tuple: (ensemble des URLs visitées, liste ordonnée des URLs à visiter)
+        """
+        with self.lock:
+            visited = {row[0] for row in self.conn.execute("SELECT url FROM visited")}
+            frontier = [
+                row[0]
+                for row in self.conn.execute(
+                    "SELECT url FROM frontier ORDER BY position"
+                )
+            ]
+        return visited, frontier
+
+    def reset(self, start_url):
+        """Efface l'état précédent et démarre un nouveau crawl"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM visited")
+            self.conn.execute("DELETE FROM frontier")
+            self.conn.execute("DELETE FROM meta")
+            self._set_meta("start_url", start_url)
+            self._set_meta("phase", "sitemap")
+            self._set_meta("started_at", datetime.datetime.now().isoformat())
+
+    def checkpoint(self, visited_urls, frontier_urls):
+        """
+        Enregistre un point de sauvegarde.
+
+        Args:
+            visited_urls (iterable): URLs visitées depuis le dernier point de sauvegarde
+            frontier_urls (iterable): Totalité des URLs restant à visiter, dans l'ordre
+        """
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO visited (url) VALUES (?)",
+                ((url,) for url in visited_urls),
+            )
+            self.conn.execute("DELETE FROM frontier")
+            self.conn.executemany(
+                "INSERT INTO frontier (position, url) VALUES (?, ?)",
+                enumerate(frontier_urls),
+            )
+            self._set_meta("phase", "crawl")
+            self._set_meta("checkpoint_at", datetime.datetime.now().isoformat())
+
+    def close(self):
+        """Ferme la connexion SQLite"""
+        with self.lock:
+            self.conn.close()
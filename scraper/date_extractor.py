@@ -5,24 +5,62 @@ Module contenant la classe DateExtractor pour extraire les dates de publication
 import requests
 import re
 import time
-import random
 import json
 import csv
 import os
 import logging
 import threading
 import datetime
+from email.utils import parsedate_to_datetime
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dateutil.parser import parse as parse_date
-from fake_useragent import UserAgent
 from tqdm import tqdm
-from utils.common_utils import extract_domain, ensure_data_directory
+from utils.common_utils import (
+    extract_domain,
+    ensure_data_directory,
+    get_random_headers,
+)
+from utils.host_scheduler import get_shared_scheduler
+from utils.http_client import (
+    MAX_PAGE_BYTES,
+    get_shared_client,
+    is_html_response,
+    read_page,
+)
+from utils.http_metadata import HttpMetadataStore
+from utils.page_cache import PageCache
+from utils.work_window import run_in_window
+from utils.parse_pool import ParsePool, decode_content
+from scraper.date_scanner import DateScanner, MONTH_MAP
+
+# Taille des blocs lus en mode de téléchargement partiel
+STREAM_CHUNK_SIZE = 8192
+
+# Octets lus au plus avant d'abandonner la recherche de </head>
+MAX_HEAD_BYTES = 128 * 1024
 
 
 class DateExtractor:
-    def __init__(self, input_file, output_file=None, max_threads=10):
+    def __init__(
+        self,
+        input_file,
+        output_file=None,
+        max_threads=10,
+        revalidate=True,
+        use_page_cache=True,
+        cache_max_age=None,
+        confidence_threshold=0.8,
+        partial_fetch=True,
+        partial_extra_bytes=16 * 1024,
+        max_page_bytes=MAX_PAGE_BYTES,
+        cheap_mode=False,
+        parse_workers_per_core=0,
+        http2=False,
+        max_per_host=None,
+        requests_per_second=None,
+    ):
         """
         Initialise l'extracteur de dates.
 
@@ -30,6 +68,36 @@ class DateExtractor:
             input_file (str): Fichier contenant les URLs à traiter
             output_file (str, optional): Fichier CSV où enregistrer les résultats
             max_threads (int, optional): Nombre maximum de threads à utiliser
+            revalidate (bool, optional): Envoyer des requêtes conditionnelles
+                (ETag / Last-Modified) et réutiliser la date des pages inchangées
+            use_page_cache (bool, optional): Lire les pages dans le cache disque
+                rempli par le scraper avant de les télécharger
+            cache_max_age (float, optional): Âge maximum en secondes d'une page
+                lue dans le cache ; au-delà elle est retéléchargée (None = pas
+                de limite)
+            confidence_threshold (float, optional): Confiance à partir de
+                laquelle la première date trouvée est retenue sans interroger
+                les sources moins fiables (1.0 pour toutes les interroger)
+            partial_fetch (bool, optional): Lire les pages au fil de l'eau et
+                s'arrêter dès qu'une date fiable est trouvée dans le début de
+                la page, sans télécharger le reste du corps
+            partial_extra_bytes (int, optional): Octets lus après </head> avant
+                de se rabattre sur le corps complet
+            max_page_bytes (int, optional): Octets lus au plus par page ; au-delà
+                la page est analysée tronquée (0 pour tout lire)
+            cheap_mode (bool, optional): Dater d'abord les URLs sans télécharger
+                les pages (<lastmod> du sitemap, date dans l'URL, en-tête
+                Last-Modified d'une requête HEAD) ; seules les URLs restées
+                sans date sont téléchargées
+            parse_workers_per_core (float, optional): Processus d'analyse HTML
+                par cœur ; 0 pour analyser les pages dans les threads de
+                téléchargement
+            http2 (bool, optional): Télécharger en HTTP/2 (httpx) : les
+                requêtes simultanées vers un hôte partagent une connexion
+            max_per_host (int, optional): Requêtes simultanées par hôte
+                (par défaut le nombre de threads)
+            requests_per_second (float, optional): Débit maximum par hôte
+                (par défaut calculé à partir du nombre de threads)
         """
         self.input_file = input_file
 
@@ -64,85 +132,146 @@ class DateExtractor:
         self.max_threads = max_threads
         self.urls = []
         self.results = []
+        self.dates_found = 0  # Compteur tenu à jour à chaque résultat
         self.lock = threading.Lock()
+        self.results_lock = threading.Lock()
         self.logger = self._setup_logger()
 
-        # Chargement des modèles de date
-        self.date_patterns = [
-            # Formats explicites communs
-            r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})",  # YYYY-MM-DD or YYYY/MM/DD
-            r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})",  # DD-MM-YYYY or DD/MM/YYYY
-            r"(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})",  # DD Month YYYY (français)
-            r"(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})",  # DD Mon YYYY (anglais abrégé)
-            r"(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",  # DD Month YYYY (anglais)
-            r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),\s+(\d{4})",  # Month DD, YYYY (anglais)
-            r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{1,2}),\s+(\d{4})",  # Mon DD, YYYY (anglais abrégé)
-            r"(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{1,2}),?\s+(\d{4})",  # Month DD YYYY (français)
-            # Formats ISO et autres formats techniques
-            r"(\d{4})(\d{2})(\d{2})",  # YYYYMMDD
-            r"(\d{4})[/-](\d{2})[/-](\d{2})T\d{2}:\d{2}",  # YYYY-MM-DDThh:mm (ISO 8601)
-            r"(\d{4})[/-](\d{2})[/-](\d{2})T\d{2}:\d{2}:\d{2}",  # YYYY-MM-DDThh:mm:ss (ISO 8601)
-            # Formats avec jour de la semaine
-            r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s+(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})",  # Weekday, DD Month YYYY (anglais)
-            r"(Mon|Tue|Wed|Thu|Fri|Sat|Sun),\s+(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+(\d{4})",  # Abbreviated Weekday, DD Mon YYYY (anglais)
-            r"(lundi|mardi|mercredi|jeudi|vendredi|samedi|dimanche),?\s+(\d{1,2})\s+(janvier|février|mars|avril|mai|juin|juillet|août|septembre|octobre|novembre|décembre)\s+(\d{4})",  # Weekday DD Month YYYY (français)
+        # Client HTTP partagé (connexions keep-alive, pools à la taille des threads)
+        self.http_client = get_shared_client(max_threads, http2=http2)
+
+        # Politesse par hôte partagée avec les autres modules
+        self.scheduler = get_shared_scheduler(
+            max_threads, max_per_host, requests_per_second
+        )
+
+        # Métadonnées HTTP pour les recrawls (réponses 304), partagées avec le
+        # scraper à côté du fichier d'URLs (data/<domaine>/)
+        self.http_metadata = (
+            HttpMetadataStore.for_directory(
+                os.path.dirname(os.path.abspath(input_file))
+            )
+            if revalidate
+            else None
+        )
+        self.unchanged_pages = 0
+
+        # Cache disque des pages rempli par le scraper (dossier du fichier d'URLs)
+        self.page_cache = (
+            PageCache.for_directory(
+                os.path.dirname(os.path.abspath(input_file)), max_age=cache_max_age
+            )
+            if use_page_cache
+            else None
+        )
+        self.cached_pages = 0
+
+        # Téléchargement partiel : début de page (<head> + N octets) d'abord
+        self.partial_fetch = partial_fetch
+        self.partial_extra_bytes = partial_extra_bytes
+        self.partial_pages = 0
+
+        # Budget d'octets par page : le corps n'est lu qu'après vérification
+        # de Content-Type, et jamais au-delà de max_page_bytes
+        self.max_page_bytes = max_page_bytes
+        self.truncated_pages = 0
+
+        # Mode rapide : métadonnées du sitemap enregistrées par le scraper à
+        # côté du fichier d'URLs (<fichier>-sitemap.csv)
+        self.cheap_mode = cheap_mode
+        self.sitemap_metadata_file = (
+            f"{os.path.splitext(os.path.abspath(input_file))[0]}-sitemap.csv"
+        )
+        self.sitemap_dates = {}
+        self.cheap_dates = {"sitemap_lastmod": 0, "url_date": 0, "last_modified": 0}
+
+        # Attributs HTML susceptibles de contenir une date de publication
+        self.date_attributes = [
+            "article:published_time",
+            "og:published_time",
+            "datePublished",
+            "dateCreated",
+            "pubdate",
+            "publishdate",
+            "publish-date",
+            "publication_date",
+            "DC.date.issued",
+            "dc.date",
+            "date",
+            "datetime",
+            "sailthru.date",
+            "parsely-pub-date",
         ]
 
+        # Noms de mois français vers anglais pour dateutil
+        self.french_months = {
+            "janvier": "january",
+            "février": "february",
+            "mars": "march",
+            "avril": "april",
+            "mai": "may",
+            "juin": "june",
+            "juillet": "july",
+            "août": "august",
+            "septembre": "september",
+            "octobre": "october",
+            "novembre": "november",
+            "décembre": "december",
+        }
+
         # Mapping des mois en français et anglais vers leur numéro
-        self.month_map = {
-            # Français
-            "janvier": "01",
-            "février": "02",
-            "mars": "03",
-            "avril": "04",
-            "mai": "05",
-            "juin": "06",
-            "juillet": "07",
-            "août": "08",
-            "septembre": "09",
-            "octobre": "10",
-            "novembre": "11",
-            "décembre": "12",
-            # Anglais
-            "january": "01",
-            "february": "02",
-            "march": "03",
-            "april": "04",
-            "may": "05",
-            "june": "06",
-            "july": "07",
-            "august": "08",
-            "september": "09",
-            "october": "10",
-            "november": "11",
-            "december": "12",
-            # Abréviation anglais
-            "jan": "01",
-            "feb": "02",
-            "mar": "03",
-            "apr": "04",
-            "jun": "06",
-            "jul": "07",
-            "aug": "08",
-            "sep": "09",
-            "oct": "10",
-            "nov": "11",
-            "dec": "12",
+        self.month_map = dict(MONTH_MAP)
+
+        # Moteur de recherche des dates compilé une fois (tous formats en un passage)
+        self.date_scanner = DateScanner(self.month_map)
+
+        # Clés JSON-LD contenant une date
+        self.json_ld_date_keys = {
+            "datepublished",
+            "datecreated",
+            "datemodified",
+            "date",
+            "published",
+            "created",
         }
 
-    def __del__(self):
-        """Ferme les sessions HTTP lorsque l'objet est détruit"""
-        if hasattr(self, "session_pool"):
-            for session in self.session_pool:
-                try:
-                    session.close()
-                except:
-                    pass
-        elif hasattr(self, "session"):
-            try:
-                self.session.close()
-            except:
-                pass
+        # Sources de dates par ordre de confiance décroissante
+        self.confidence_threshold = confidence_threshold
+        self._init_date_sources()
+
+        # Analyse des pages dans un pool de processus (démarré par run())
+        self.parse_workers_per_core = parse_workers_per_core
+        self.parse_pool = None
+
+    # Attributs copiés dans les processus d'analyse : de quoi extraire une
+    # date d'une page, sans sessions, verrous, bases ni barre de progression
+    _PARSE_STATE = (
+        "date_attributes",
+        "french_months",
+        "month_map",
+        "date_scanner",
+        "json_ld_date_keys",
+        "confidence_threshold",
+    )
+
+    def __getstate__(self):
+        return {name: self.__dict__[name] for name in self._PARSE_STATE}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.parse_pool = None
+        self._init_date_sources()
+
+    def _init_date_sources(self):
+        self.date_sources = [
+            (0.95, self._dates_from_json_ld),
+            (0.9, self._dates_from_meta),
+            (0.8, self._dates_from_element_attributes),
+            (0.7, self._dates_from_element_text),
+            (0.6, self._dates_from_date_classes),
+            (0.5, self._dates_from_document),
+            (0.4, self._dates_from_url),
+        ]
 
     def _setup_logger(self):
         """Configure le logger pour cette classe"""
@@ -170,45 +299,17 @@ class DateExtractor:
 
         return logger
 
-    def __del__(self):
-        """Ferme les sessions HTTP lorsque l'objet est détruit"""
-        for session in self.session_pool:
-            session.close()
-
     def get_random_headers(self):
-        """Génère des en-têtes HTTP aléatoires qui imitent un navigateur"""
-        try:
-            ua = UserAgent()
-            return {
-                "User-Agent": ua.random,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "DNT": "1",
-            }
-        except:
-            # Fallback
-            return {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Referer": "https://www.google.com/",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-
-    def get_session(self):
-        """Obtient une session du pool de manière thread-safe"""
-        with self.session_lock:
-            session = self.session_pool[self.session_index]
-            self.session_index = (self.session_index + 1) % len(self.session_pool)
-            return session
+        """Génère des en-têtes HTTP qui imitent un navigateur (pool partagé)"""
+        return get_random_headers()
 
     def normalize_date(self, date_str):
         """Normalise une date trouvée dans différents formats"""
+        # Formats usuels convertis directement, sans analyse floue
+        date = self.date_scanner.first(date_str)
+        if date:
+            return date
+
         try:
             # Remplacer les noms de mois français
             for fr_month, en_month in self.french_months.items():
@@ -251,14 +352,221 @@ class DateExtractor:
 
         return None
 
+    def extract_date_from_content(self, content, encoding, url):
+        """Extrait la date de publication du corps brut (bytes) d'une page"""
+        return self.extract_date_from_html(decode_content(content, encoding), url)
+
+    def _extract_date(self, content, encoding, url):
+        """Extrait la date d'un corps brut, dans le pool de processus s'il est actif"""
+        if self.parse_pool is not None:
+            return self.parse_pool.call(
+                "extract_date_from_content", content, encoding, url
+            )
+        return self.extract_date_from_content(content, encoding, url)
+
     def extract_date_from_html(self, html, url):
         """Extrait la date de publication d'une page HTML"""
-        soup = BeautifulSoup(html, "html.parser")
+        return self.extract_date_from_soup(BeautifulSoup(html, "html.parser"), url)
+
+    def extract_date_from_soup(self, soup, url):
+        """
+        Extrait la date de publication d'une page déjà analysée.
+
+        Les sources sont interrogées par ordre de confiance décroissante et
+        l'extraction s'arrête dès qu'une source de confiance au moins égale à
+        confidence_threshold fournit une date valide : la recherche coûteuse
+        dans tout le document n'a lieu que sur les pages sans date structurée.
+        En dessous du seuil, toutes les sources restantes sont interrogées et
+        les candidats triés par confiance puis par date.
+
+        Args:
+            soup (BeautifulSoup): Document HTML analysé (non modifié)
+            url (str): URL de la page
+        """
         possible_dates = []
 
-        # 1. META tags
-        meta_tags = soup.find_all("meta")
-        for meta in meta_tags:
+        for confidence, source in self.date_sources:
+            dates = source(soup, url)
+            if dates and confidence >= self.confidence_threshold:
+                # À confiance égale, la date la plus récente l'emporte
+                return max(dates)
+            possible_dates.extend((date, confidence) for date in dates)
+
+        if not possible_dates:
+            return None
+
+        # Tri par confiance puis par date
+        possible_dates.sort(key=lambda x: (-x[1], -int(x[0].replace("-", ""))))
+
+        return possible_dates[0][0]
+
+    def extract_trusted_date(self, soup, url):
+        """
+        Extrait une date uniquement à partir des sources de confiance au moins
+        égale à confidence_threshold (utilisé sur un début de page).
+
+        Returns:
+            str | None: Date au format YYYY-MM-DD, ou None
+        """
+        for confidence, source in self.date_sources:
+            if confidence < self.confidence_threshold:
+                break
+            dates = source(soup, url)
+            if dates:
+                return max(dates)
+        return None
+
+    def _trusted_date_from_prefix(self, prefix, encoding, url):
+        """Cherche une date fiable dans le début d'une page (octets)"""
+        # Couper après la dernière balise complète pour ne pas lire un
+        # attribut tronqué
+        end = prefix.rfind(b">")
+        if end == -1:
+            return None
+        html = bytes(prefix[: end + 1]).decode(encoding, errors="replace")
+        return self.extract_trusted_date(BeautifulSoup(html, "html.parser"), url)
+
+    def _extract_date_from_stream(self, url, response):
+        """
+        Extrait la date d'une réponse lue au fil de l'eau.
+
+        La recherche porte d'abord sur <head>, puis sur <head> suivi de
+        partial_extra_bytes octets ; le reste du corps n'est téléchargé que si
+        aucune date fiable n'y a été trouvée. Seules les pages lues en entier
+        sont enregistrées dans le cache. La lecture s'arrête à max_page_bytes.
+
+        Args:
+            url (str): URL de la page
+            response (requests.Response): Réponse ouverte avec stream=True
+        """
+        encoding = response.encoding or "utf-8"
+        chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+        body = bytearray()
+        head_end = None
+        head_checked = False
+        truncated = False
+        publication_date = None
+
+        def over_budget():
+            return self.max_page_bytes and len(body) > self.max_page_bytes
+
+        try:
+            for chunk in chunks:
+                search_from = max(0, len(body) - len(b"</head>"))
+                body += chunk
+                if over_budget():
+                    truncated = True
+                    break
+
+                if head_end is None:
+                    position = body[search_from:].lower().find(b"</head>")
+                    if position != -1:
+                        head_end = search_from + position + len(b"</head>")
+
+                if head_end is not None and not head_checked:
+                    head_checked = True
+                    publication_date = self._trusted_date_from_prefix(
+                        body[:head_end], encoding, url
+                    )
+                    if publication_date:
+                        break
+
+                limit = (
+                    head_end + self.partial_extra_bytes
+                    if head_end is not None
+                    else MAX_HEAD_BYTES
+                )
+                if len(body) >= limit:
+                    publication_date = self._trusted_date_from_prefix(
+                        body, encoding, url
+                    )
+                    if publication_date:
+                        break
+                    # Pas de date fiable dans le début de page : lire le reste,
+                    # dans la limite du budget
+                    for chunk in chunks:
+                        body += chunk
+                        if over_budget():
+                            truncated = True
+                            break
+                    break
+
+            if publication_date:
+                with self.results_lock:
+                    self.partial_pages += 1
+                if self.page_cache:
+                    # Page lue en partie : l'ancienne copie n'est plus à jour
+                    self.page_cache.discard(url)
+                return publication_date
+        finally:
+            response.close()
+
+        if truncated:
+            # Page tronquée : analysée, mais pas mise en cache, et l'ancienne
+            # copie éventuelle n'est plus à jour
+            del body[self.max_page_bytes :]
+            with self.results_lock:
+                self.truncated_pages += 1
+            if self.page_cache:
+                self.page_cache.discard(url)
+        elif self.page_cache:
+            self.page_cache.put(
+                url, bytes(body), response.headers.get("Content-Type", ""), encoding
+            )
+        return self._extract_date(bytes(body), encoding, url)
+
+    def _read_page(self, url, response):
+        """
+        Lit le corps d'une page HTML dans la limite du budget d'octets ; seules
+        les pages lues en entier sont enregistrées dans le cache ; l'ancienne
+        copie d'une page tronquée en est retirée.
+
+        Returns:
+            PageBody: Corps, encodage et indicateur de troncature
+        """
+        page = read_page(response, self.max_page_bytes)
+        if page.truncated:
+            with self.results_lock:
+                self.truncated_pages += 1
+            if self.page_cache:
+                self.page_cache.discard(url)
+        elif self.page_cache:
+            self.page_cache.put(
+                url,
+                page.content,
+                response.headers.get("Content-Type", ""),
+                page.encoding,
+            )
+        return page
+
+    def _dates_from_json_ld(self, soup, url):
+        """Dates des données structurées JSON-LD (confiance 0.95)"""
+        dates = []
+
+        def find_date_in_json(obj):
+            if isinstance(obj, dict):
+                for key, value in obj.items():
+                    if key.lower() in self.json_ld_date_keys and isinstance(value, str):
+                        normalized_date = self.normalize_date(value)
+                        if normalized_date:
+                            dates.append(normalized_date)
+                    find_date_in_json(value)
+            elif isinstance(obj, list):
+                for item in obj:
+                    find_date_in_json(item)
+
+        for script in soup.find_all("script", type="application/ld+json"):
+            if script.string:
+                try:
+                    find_date_in_json(json.loads(script.string))
+                except json.JSONDecodeError:
+                    pass
+        return dates
+
+    def _dates_from_meta(self, soup, url):
+        """Dates des balises META (confiance 0.9)"""
+        dates = []
+        for meta in soup.find_all("meta"):
             for attr in self.date_attributes:
                 if (
                     meta.get("name") == attr
@@ -269,26 +577,31 @@ class DateExtractor:
                     if content:
                         normalized_date = self.normalize_date(content)
                         if normalized_date:
-                            possible_dates.append((normalized_date, 0.9))
+                            dates.append(normalized_date)
+        return dates
 
-        # 2. Time elements
-        time_elements = soup.find_all(["time", "span", "div", "p"])
-        for element in time_elements:
+    def _dates_from_element_attributes(self, soup, url):
+        """Dates portées par les attributs des éléments time, span, div, p (confiance 0.8)"""
+        dates = []
+        for element in soup.find_all(["time", "span", "div", "p"]):
             for attr in self.date_attributes:
                 if element.get(attr):
                     normalized_date = self.normalize_date(element.get(attr))
                     if normalized_date:
-                        possible_dates.append((normalized_date, 0.8))
+                        dates.append(normalized_date)
+        return dates
 
+    def _dates_from_element_text(self, soup, url):
+        """Dates écrites dans le texte des éléments time, span, div, p (confiance 0.7)"""
+        dates = []
+        for element in soup.find_all(["time", "span", "div", "p"]):
             if element.string:
-                for pattern in self.date_patterns:
-                    matches = re.findall(pattern, str(element.string))
-                    for match in matches:
-                        normalized_date = self.normalize_date(match)
-                        if normalized_date:
-                            possible_dates.append((normalized_date, 0.7))
+                dates.extend(self.date_scanner.scan(str(element.string)))
+        return dates
 
-        # 3. Classes et IDs liés aux dates
+    def _dates_from_date_classes(self, soup, url):
+        """Dates des éléments dont la classe ou l'id évoque une date (confiance 0.6)"""
+        dates = []
         date_elements = soup.select(
             "[class*=date], [class*=time], [id*=date], [id*=time], [class*=publish], [id*=publish]"
         )
@@ -297,66 +610,85 @@ class DateExtractor:
             if text:
                 normalized_date = self.normalize_date(text)
                 if normalized_date:
-                    possible_dates.append((normalized_date, 0.6))
-
-        # 4. JSON-LD structured data
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
-            if script.string:
-                try:
-                    data = json.loads(script.string)
-
-                    # Fonction récursive pour JSON
-                    def find_date_in_json(obj):
-                        if isinstance(obj, dict):
-                            for key, value in obj.items():
-                                if key.lower() in [
-                                    "datepublished",
-                                    "datecreated",
-                                    "datemodified",
-                                    "date",
-                                    "published",
-                                    "created",
-                                ]:
-                                    if isinstance(value, str):
-                                        normalized_date = self.normalize_date(value)
-                                        if normalized_date:
-                                            possible_dates.append(
-                                                (normalized_date, 0.95)
-                                            )
-
-                                find_date_in_json(value)
-                        elif isinstance(obj, list):
-                            for item in obj:
-                                find_date_in_json(item)
-
-                    find_date_in_json(data)
-                except json.JSONDecodeError:
-                    pass
+                    dates.append(normalized_date)
+        return dates
 
-        # 5. HTML brut avec regex
-        html_str = str(soup)
-        for pattern in self.date_patterns:
-            matches = re.findall(pattern, html_str)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0] if match else ""
-                normalized_date = self.normalize_date(match)
-                if normalized_date:
-                    possible_dates.append((normalized_date, 0.5))
+    def _dates_from_document(self, soup, url):
+        """Dates trouvées dans tout le HTML brut (confiance 0.5)"""
+        return self.date_scanner.scan(str(soup))
 
-        # 6. URL en dernier recours
+    def _dates_from_url(self, soup, url):
+        """Date contenue dans l'URL, en dernier recours (confiance 0.4)"""
         url_date = self.extract_date_from_url(url)
-        if url_date:
-            possible_dates.append((url_date, 0.4))
+        return [url_date] if url_date else []
 
-        if not possible_dates:
-            return None
+    def fetch_page(self, url, extra_headers=None, stream=False, method="GET"):
+        """
+        Télécharge une page avec un en-tête de navigateur et un referer plausible
 
-        # Tri par confiance puis par date
-        possible_dates.sort(key=lambda x: (-x[1], -int(x[0].replace("-", ""))))
+        Args:
+            url (str): URL à récupérer
+            extra_headers (dict, optional): En-têtes supplémentaires (requêtes conditionnelles)
+            stream (bool, optional): Ne pas lire le corps de la réponse d'avance
+            method (str, optional): Méthode HTTP (HEAD pour les seuls en-têtes)
+        """
+        headers = self.get_random_headers()
+
+        # Ajouter un referer plausible
+        parsed_url = urlparse(url)
+        headers["Referer"] = f"{parsed_url.scheme}://{parsed_url.netloc}/"
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Requête
+        response = self.scheduler.fetch(
+            url,
+            lambda: self.http_client.request(
+                method, url, headers=headers, stream=stream
+            ),
+        )
+
+        response.raise_for_status()
+        return response
 
-        return possible_dates[0][0] if possible_dates else None
+    def load_sitemap_dates(self):
+        """Charge les dates <lastmod> du fichier de métadonnées de sitemap"""
+        self.sitemap_dates = {}
+        if not os.path.exists(self.sitemap_metadata_file):
+            return
+
+        with open(self.sitemap_metadata_file, "r", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                lastmod = row.get("lastmod")
+                date = self.date_scanner.first(lastmod) if lastmod else None
+                if date:
+                    self.sitemap_dates[row["url"]] = date
+
+        self.logger.info(
+            f"{len(self.sitemap_dates)} dates <lastmod> chargées depuis {self.sitemap_metadata_file}"
+        )
+
+    def _date_from_last_modified(self, response):
+        """Date de l'en-tête Last-Modified d'une réponse, ou None"""
+        last_modified = response.headers.get("Last-Modified")
+        if not last_modified:
+            return None
+        try:
+            dt = parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return None
+        if not self.date_scanner.min_year <= dt.year <= self.date_scanner.max_year:
+            return None
+        return dt.strftime("%Y-%m-%d")
+
+    def _cheap_result(self, url, date, status):
+        """Enregistre une date obtenue sans télécharger la page"""
+        result = {"url": url, "date": date, "status": status}
+        self._add_result(result)
+        with self.results_lock:
+            self.cheap_dates[status] += 1
+        self.pbar.update(1)
+        return result
 
     def process_url(self, url):
         """Traite une URL et extrait sa date de publication"""
@@ -365,41 +697,105 @@ class DateExtractor:
             return None
 
         try:
-            session = self.get_session()
-            headers = self.get_random_headers()
-
-            # Ajouter un referer plausible
-            parsed_url = urlparse(url)
-            headers["Referer"] = f"{parsed_url.scheme}://{parsed_url.netloc}/"
-
-            # Requête
-            response = session.get(
-                url, headers=headers, verify=False, timeout=10, allow_redirects=True
-            )
-
-            response.raise_for_status()
+            if self.cheap_mode:
+                # Mode rapide : sitemap puis URL, sans aucune requête
+                date = self.sitemap_dates.get(url)
+                if date:
+                    return self._cheap_result(url, date, "sitemap_lastmod")
+                date = self.extract_date_from_url(url)
+                if date:
+                    return self._cheap_result(url, date, "url_date")
+
+            cached = self.page_cache.get(url) if self.page_cache else None
+            response = None
+
+            if cached is not None:
+                # Page déjà téléchargée par le scraper : pas de requête réseau
+                content_type = cached.content_type
+                with self.results_lock:
+                    self.cached_pages += 1
+            else:
+                if self.cheap_mode:
+                    # Mode rapide : en-têtes seuls avant le téléchargement complet
+                    try:
+                        head = self.fetch_page(url, method="HEAD")
+                    except requests.RequestException:
+                        # HEAD refusé par certains serveurs : passer au GET
+                        head = None
+
+                    if head is not None:
+                        head_type = head.headers.get("Content-Type", "")
+                        if head_type and "text/html" not in head_type.lower():
+                            self.pbar.update(1)
+                            return {"url": url, "date": None, "status": "not_html"}
+                        date = self._date_from_last_modified(head)
+                        if date:
+                            return self._cheap_result(url, date, "last_modified")
+
+                conditional_headers = (
+                    self.http_metadata.conditional_headers(url)
+                    if self.http_metadata
+                    else None
+                )
+                # Corps lu seulement après vérification de Content-Type
+                response = self.fetch_page(url, conditional_headers, stream=True)
+
+                if response.status_code == 304:
+                    response.close()
+                    # Page inchangée : réutiliser la date extraite précédemment
+                    previous = self.http_metadata.get_payload(url, "date")
+                    if previous is not None:
+                        result = {
+                            "url": url,
+                            "date": previous["date"],
+                            "status": previous["status"],
+                        }
+                        self._add_result(result)
+                        with self.results_lock:
+                            self.unchanged_pages += 1
+                        self.pbar.update(1)
+                        return result
+
+                    response = self.fetch_page(url, stream=True)
+
+                content_type = response.headers.get("Content-Type", "")
+                if not is_html_response(response):
+                    # Ressource non HTML : abandonnée sans télécharger le corps
+                    response.close()
+                    if self.page_cache:
+                        self.page_cache.put(url, b"", content_type)
 
             # Vérifier si c'est du HTML
-            if "text/html" not in response.headers.get("Content-Type", "").lower():
+            if "text/html" not in content_type.lower():
                 self.pbar.update(1)
                 return {"url": url, "date": None, "status": "not_html"}
 
             # Extraire la date
-            publication_date = self.extract_date_from_html(response.text, url)
+            if cached is not None:
+                publication_date = self._extract_date(
+                    cached.content, cached.encoding, url
+                )
+            elif self.partial_fetch:
+                publication_date = self._extract_date_from_stream(url, response)
+            else:
+                page = self._read_page(url, response)
+                publication_date = self._extract_date(page.content, page.encoding, url)
             status = "success" if publication_date else "no_date_found"
 
             # Ajouter le résultat
             result = {"url": url, "date": publication_date, "status": status}
 
-            with self.results_lock:
-                self.results.append(result)
+            self._add_result(result)
+
+            if self.http_metadata and response is not None:
+                self.http_metadata.record(url, response)
+                self.http_metadata.set_payload(
+                    url, "date", {"date": publication_date, "status": status}
+                )
 
             # Mettre à jour la barre de progression
             self.pbar.update(1)
 
-            # Pause aléatoire courte pour respect des robots
-            time.sleep(random.uniform(0.2, 0.5))
-
             return result
 
         except requests.RequestException as e:
@@ -411,6 +807,13 @@ class DateExtractor:
             self.pbar.update(1)
             return {"url": url, "date": None, "status": "error"}
 
+    def _add_result(self, result):
+        """Ajoute un résultat et met à jour le compteur de dates trouvées"""
+        with self.results_lock:
+            self.results.append(result)
+            if result.get("date"):
+                self.dates_found += 1
+
     def save_results(self):
         """Sauvegarde les résultats dans un fichier CSV"""
         with open(self.output_file, "w", newline="", encoding="utf-8") as csvfile:
@@ -427,6 +830,21 @@ class DateExtractor:
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+    def _prewarm_connections(self, url):
+        """Ouvre autant de connexions vers l'hôte de l'URL que de threads autorisés"""
+        connections = min(self.max_threads, self.scheduler.max_per_host)
+        opened = self.http_client.prewarm(url, connections)
+        if opened:
+            self.logger.info(f"{opened} connexions préchauffées vers {url}")
+
+    def _iter_urls(self):
+        """Lit les URLs du fichier d'entrée une par une"""
+        with open(self.input_file, "r", encoding="utf-8") as f:
+            for line in f:
+                url = line.strip()
+                if url:
+                    yield url
+
     def run(self, progress_callback=None):
         """
         Exécute l'extraction des dates sur toutes les URLs
@@ -437,10 +855,10 @@ class DateExtractor:
         """
         start_time = time.time()
 
-        # Lire les URLs depuis le fichier
+        # Compter les URLs ; elles sont ensuite relues au fil de la soumission
         try:
             with open(self.input_file, "r", encoding="utf-8") as f:
-                urls = [line.strip() for line in f if line.strip()]
+                total_urls = sum(1 for line in f if line.strip())
         except Exception as e:
             error_msg = (
                 f"Erreur lors de la lecture du fichier {self.input_file}: {str(e)}"
@@ -450,9 +868,16 @@ class DateExtractor:
                 progress_callback(0, 0, error_msg)
             return
 
-        total_urls = len(urls)
         self.logger.info(f"Traitement de {total_urls} URLs depuis {self.input_file}")
 
+        if self.cheap_mode:
+            self.load_sitemap_dates()
+
+        # Ouvrir les connexions vers le site avant le premier résultat
+        first_url = next(iter(self._iter_urls()), None)
+        if first_url:
+            self._prewarm_connections(first_url)
+
         if progress_callback:
             progress_callback(
                 0,
@@ -467,63 +892,72 @@ class DateExtractor:
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
         )
 
-        # Traitement par lots pour réduire les frais généraux
-        batch_size = 50  # Taille optimale du lot
-
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            # Traitement par lots des URLs
-            for i in range(0, len(urls), batch_size):
-                batch = urls[i : i + batch_size]
-                futures = {executor.submit(self.process_url, url): url for url in batch}
-
-                # Attendre que le lot soit terminé
-                for future in as_completed(futures):
-                    # Collecter les résultats si nécessaire
-                    pass
+        def update_progress(processed):
+            """Appelée depuis le thread principal, coût indépendant du nombre d'URLs"""
+            # Calculer et formater l'ETA
+            elapsed = time.time() - start_time
+            urls_per_second = processed / elapsed if elapsed > 0 else 0
+            remaining = total_urls - processed
+            eta_seconds = remaining / urls_per_second if urls_per_second > 0 else 0
 
-                # Mise à jour après chaque lot
-                processed = min(i + batch_size, total_urls)
+            # Formater en HH:MM:SS
+            eta_formatted = self.format_time(eta_seconds)
 
-                # Calculer et formater l'ETA
-                elapsed = time.time() - start_time
-                urls_per_second = processed / elapsed if elapsed > 0 else 0
-                remaining = total_urls - processed
-                eta_seconds = remaining / urls_per_second if urls_per_second > 0 else 0
+            # Dates trouvées jusqu'à présent
+            with self.results_lock:
+                dates_found = self.dates_found
+            success_rate = (
+                f"{(dates_found / processed * 100):.1f}%" if processed > 0 else "0.0%"
+            )
 
-                # Formater en HH:MM:SS
-                eta_formatted = self.format_time(eta_seconds)
+            # La barre avance dans process_url ; seule la description change ici
+            self.pbar.set_description(
+                f"Extraction des dates - ETA: {eta_formatted} - Taux: {success_rate}"
+            )
 
-                # Dates trouvées jusqu'à présent
-                dates_found = sum(1 for r in self.results if r.get("date"))
-                success_rate = (
-                    f"{(dates_found / processed * 100):.1f}%"
-                    if processed > 0
-                    else "0.0%"
+            if progress_callback:
+                progress_callback(
+                    processed,
+                    total_urls,
+                    f"Progression: {processed}/{total_urls} - Taux: {success_rate} - ETA: {eta_formatted}",
                 )
 
-                # Mettre à jour la description de la barre
-                self.pbar.update(len(batch))
-                self.pbar.set_description(
-                    f"Extraction des dates - ETA: {eta_formatted} - Taux: {success_rate}"
-                )
+        # Les threads téléchargent, les processus analysent les pages
+        if self.parse_workers_per_core > 0:
+            self.parse_pool = ParsePool(self, self.parse_workers_per_core)
+            self.logger.info(
+                f"Analyse des pages dans {self.parse_pool.max_workers} processus"
+            )
 
-                # Mise à jour du callback de progression moins fréquente
-                if progress_callback:
-                    progress_callback(
-                        processed,
-                        total_urls,
-                        f"Progression: {processed}/{total_urls} - Taux: {success_rate} - ETA: {eta_formatted}",
-                    )
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                # Fenêtre glissante : une nouvelle URL dès qu'un thread se libère,
+                # sans attendre la plus lente d'un lot
+                run_in_window(
+                    executor,
+                    self.process_url,
+                    self._iter_urls(),
+                    max_pending=self.max_threads * 4,
+                    on_progress=update_progress,
+                )
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
 
         # Fermer la barre de progression
         self.pbar.close()
 
         # Sauvegarder les résultats
         self.save_results()
+        if self.http_metadata:
+            self.http_metadata.commit()
+        if self.page_cache:
+            self.page_cache.commit()
 
         # Statistiques finales
         elapsed_time = time.time() - start_time
-        dates_found = sum(1 for result in self.results if result.get("date"))
+        dates_found = self.dates_found
         success_rate = (dates_found / total_urls) * 100 if total_urls > 0 else 0
 
         final_status = (
@@ -545,6 +979,13 @@ class DateExtractor:
             "total_urls": total_urls,
             "dates_found": dates_found,
             "success_rate": success_rate,
+            "unchanged_pages": self.unchanged_pages,
+            "cached_pages": self.cached_pages,
+            "partial_pages": self.partial_pages,
+            "truncated_pages": self.truncated_pages,
+            "cheap_mode": self.cheap_mode,
+            "cheap_dates": self.cheap_dates,
+            "http_connections": self.http_client.stats(),
             "elapsed_time": elapsed_time,
             "timestamp": datetime.datetime.now().isoformat(),
         }
@@ -573,6 +1014,12 @@ if __name__ == "__main__":
 
     max_threads_input = input("Nombre de threads (par défaut: 10): ")
     max_threads = int(max_threads_input) if max_threads_input.strip() else 10
+    cheap_mode = (
+        input(
+            "Mode rapide (sitemap, URL et Last-Modified avant téléchargement)? (o/n, par défaut: non): "
+        ).lower()
+        == "o"
+    )
 
     print(f"\nDémarrage de l'extraction des dates à partir de {input_file}")
     print(f"Utilisation de {max_threads} threads en parallèle")
@@ -583,7 +1030,9 @@ if __name__ == "__main__":
             requests.packages.urllib3.exceptions.InsecureRequestWarning
         )
 
-        extractor = DateExtractor(input_file, output_file, max_threads)
+        extractor = DateExtractor(
+            input_file, output_file, max_threads, cheap_mode=cheap_mode
+        )
         extractor.run()
 
     except KeyboardInterrupt:
@@ -0,0 +1,149 @@
+"""
+Module contenant la classe DateScanner pour repérer des dates dans un texte en un seul passage.
+
+Tous les formats reconnus sont réunis dans une seule expression régulière
+compilée une fois. Chaque occurrence est convertie directement en date à
+partir de ses groupes (jour, mois, année) et de la table des mois, sans
+passer par l'analyse floue de dateutil.
+"""
+
+import re
+import datetime
+
+# Noms et abréviations des mois (français et anglais) vers leur numéro
+MONTH_MAP = {
+    # Français
+    "janvier": "01",
+    "février": "02",
+    "fevrier": "02",
+    "mars": "03",
+    "avril": "04",
+    "mai": "05",
+    "juin": "06",
+    "juillet": "07",
+    "août": "08",
+    "aout": "08",
+    "septembre": "09",
+    "octobre": "10",
+    "novembre": "11",
+    "décembre": "12",
+    "decembre": "12",
+    # Abréviations françaises
+    "janv": "01",
+    "févr": "02",
+    "fevr": "02",
+    "fév": "02",
+    "fev": "02",
+    "avr": "04",
+    "juil": "07",
+    "sept": "09",
+    "déc": "12",
+    # Anglais
+    "january": "01",
+    "february": "02",
+    "march": "03",
+    "april": "04",
+    "may": "05",
+    "june": "06",
+    "july": "07",
+    "august": "08",
+    "september": "09",
+    "october": "10",
+    "november": "11",
+    "december": "12",
+    # Abréviation anglais
+    "jan": "01",
+    "feb": "02",
+    "mar": "03",
+    "apr": "04",
+    "jun": "06",
+    "jul": "07",
+    "aug": "08",
+    "sep": "09",
+    "oct": "10",
+    "nov": "11",
+    "dec": "12",
+}
+
+
+class DateScanner:
+    def __init__(self, month_map=None, min_year=1990, max_year=None):
+        """
+        Compile l'expression de recherche des dates.
+
+        Args:
+            month_map (dict, optional): Nom de mois en minuscules -> numéro
+            min_year (int): Année minimale acceptée
+            max_year (int, optional): Année maximale acceptée (année suivante par défaut)
+        """
+        self.month_map = {
+            name.lower(): int(number)
+            for name, number in (month_map or MONTH_MAP).items()
+        }
+        self.min_year = min_year
+        self.max_year = max_year or datetime.date.today().year + 1
+
+        # Noms complets et abréviations connues uniquement, en mots entiers :
+        # "summary", "Decision" ou "mainly" ne sont pas des mois
+        months = "|".join(
+            re.escape(name) for name in sorted(self.month_map, key=len, reverse=True)
+        )
+        month = rf"\b(?:{months})\b\.?"
+
+        self.pattern = re.compile(
+            "|".join(
+                [
+                    # YYYY-MM-DD, YYYY/MM/DD (et ISO 8601 avec l'heure)
+                    r"(?<!\d)(?P<ymd_y>\d{4})[/-](?P<ymd_m>\d{1,2})[/-](?P<ymd_d>\d{1,2})(?!\d)",
+                    # DD-MM-YYYY, DD/MM/YYYY
+                    r"(?<!\d)(?P<dmy_d>\d{1,2})[/-](?P<dmy_m>\d{1,2})[/-](?P<dmy_y>\d{4})(?!\d)",
+                    # DD Month YYYY, 1er janvier 2024 (jour de la semaine ignoré)
+                    rf"(?<!\d)(?P<dmony_d>\d{{1,2}})(?:er|st|nd|rd|th)?\s+(?P<dmony_m>{month})\s+(?P<dmony_y>\d{{4}})(?!\d)",
+                    # Month DD, YYYY et Month DD YYYY
+                    rf"(?P<mondy_m>{month})\s+(?P<mondy_d>\d{{1,2}})(?:st|nd|rd|th)?,?\s+(?P<mondy_y>\d{{4}})(?!\d)",
+                    # YYYYMMDD
+                    r"(?<!\d)(?P<compact_y>(?:19|20)\d{2})(?P<compact_m>0[1-9]|1[0-2])(?P<compact_d>0[1-9]|[12]\d|3[01])(?!\d)",
+                ]
+            ),
+            re.IGNORECASE,
+        )
+
+    def _month_number(self, name):
+        return self.month_map.get(name.lower().rstrip("."))
+
+    def _to_date(self, match):
+        """Convertit une occurrence en date ISO, ou None si elle est invalide"""
+        kind = match.lastgroup.split("_", 1)[0]
+        year = int(match.group(f"{kind}_y"))
+        day = int(match.group(f"{kind}_d"))
+        month = match.group(f"{kind}_m")
+        month = int(month) if month.isdigit() else self._month_number(month)
+
+        if month is None or not self.min_year <= year <= self.max_year:
+            return None
+        try:
+            return datetime.date(year, month, day).isoformat()
+        except ValueError:
+            return None
+
+    def scan(self, text):
+        """
+        Renvoie les dates valides trouvées dans un texte, dans l'ordre.
+
+        Returns:
+            list: Dates au format YYYY-MM-DD
+        """
+        dates = []
+        for match in self.pattern.finditer(text):
+            date = self._to_date(match)
+            if date:
+                dates.append(date)
+        return dates
+
+    def first(self, text):
+        """Renvoie la première date valide d'un texte, ou None"""
+        for match in self.pattern.finditer(text):
+            date = self._to_date(match)
+            if date:
+                return date
+        return None
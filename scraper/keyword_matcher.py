@@ -0,0 +1,265 @@
+"""
+Recherche simultanée de plusieurs mots-clés en un seul passage (Aho-Corasick).
+
+L'automate est construit une fois pour toute la liste de mots-clés ; chaque
+page est ensuite parcourue une seule fois, quel que soit le nombre de
+mots-clés. Les comptes sont identiques à ceux d'une recherche re.findall par
+mot-clé : occurrences sans chevauchement, de gauche à droite.
+
+Modes de correspondance disponibles, combinables :
+- mots entiers : l'occurrence doit être délimitée par des caractères hors mot
+- sans accents : "publie" trouve "publié" (repliement des accents)
+- racine légère : "publiée" trouve "publie", "publiés"... (pluriels et
+  féminins usuels du français, implique les mots entiers)
+
+Le texte est normalisé une seule fois par page et les mots-clés une seule
+fois à la construction ; les vérifications se font par occurrence trouvée,
+sans coût supplémentaire par mot-clé.
+
+Le module C pyahocorasick est utilisé s'il est installé, sinon un automate
+en Python pur sert de secours.
+"""
+
+import re
+import unicodedata
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick est optionnel
+    ahocorasick = None
+
+# Terminaisons retirées des mots-clés en mode racine (les plus longues d'abord)
+STEM_SUFFIXES = ("ées", "ees", "ée", "és", "ee", "es", "é", "e", "s")
+
+# Terminaisons acceptées après la racine dans le texte
+INFLECTION_SUFFIXES = frozenset(
+    ("", "e", "s", "x", "es", "ee", "ees", "é", "ée", "és", "ées")
+)
+MAX_INFLECTION_LENGTH = max(len(suffix) for suffix in INFLECTION_SUFFIXES)
+
+
+def _build_accent_table():
+    """Table des lettres accentuées latines vers leur lettre de base"""
+    table = {}
+    for codepoint in list(range(0x00C0, 0x0250)) + list(range(0x1E00, 0x1F00)):
+        char = chr(codepoint)
+        decomposed = unicodedata.normalize("NFD", char)
+        if len(decomposed) > 1 and all(
+            unicodedata.combining(mark) for mark in decomposed[1:]
+        ):
+            table[char] = decomposed[0]
+    return table
+
+
+ACCENT_TABLE = _build_accent_table()
+
+# Les lettres accentuées sont rares dans un texte : une regex les localise
+# bien plus vite qu'un str.translate caractère par caractère
+_ACCENTED_CHARS = re.compile("[" + "".join(ACCENT_TABLE) + "]")
+
+
+def strip_accents(text):
+    """Retire les accents sans changer la longueur du texte ("é" -> "e")"""
+    return _ACCENTED_CHARS.sub(lambda match: ACCENT_TABLE[match.group()], text)
+
+
+def light_stem(word):
+    """Racine légère d'un mot-clé : retire une terminaison de pluriel ou de féminin"""
+    for suffix in STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            return word[: -len(suffix)]
+    return word
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+def lower_preserving_length(text):
+    """
+    Met le texte en minuscules sans changer sa longueur, pour que les
+    positions trouvées restent valables dans le texte d'origine.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # Quelques caractères (ex. "İ") s'étendent en minuscules : les laisser tels quels
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class _PurePythonAutomaton:
+    """Automate d'Aho-Corasick en Python pur"""
+
+    def __init__(self, patterns):
+        # Trie : transitions, lien d'échec et motifs reconnus par état
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] = self.output[state] + (pattern,)
+
+        # Liens d'échec en largeur d'abord
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = (
+                    self.output[next_state] + self.output[self.fail[next_state]]
+                )
+
+        # Transitions complètes calculées à la demande (automate déterministe)
+        self.delta = [dict(transitions) for transitions in self.goto]
+
+    def _step(self, state, char):
+        next_state = self.delta[state].get(char)
+        if next_state is None:
+            if state == 0:
+                next_state = 0
+            else:
+                next_state = self._step(self.fail[state], char)
+            self.delta[state][char] = next_state
+        return next_state
+
+    def iter(self, text):
+        """Génère (index_de_fin, motif) pour chaque occurrence, chevauchements compris"""
+        delta = self.delta
+        output = self.output
+        step = self._step
+        state = 0
+        for index, char in enumerate(text):
+            next_state = delta[state].get(char)
+            state = step(state, char) if next_state is None else next_state
+            if output[state]:
+                for pattern in output[state]:
+                    yield index, pattern
+
+
+class KeywordMatcher:
+    def __init__(
+        self,
+        keywords,
+        case_sensitive=False,
+        max_contexts=5,
+        whole_word=False,
+        fold_accents=False,
+        stemming=False,
+    ):
+        """
+        Construit l'automate pour une liste de mots-clés.
+
+        Args:
+            keywords (list): Mots-clés à rechercher
+            case_sensitive (bool): Si True, respecte la casse des mots-clés
+            max_contexts (int): Nombre d'occurrences dont la position est conservée
+            whole_word (bool): Ne retenir que les mots entiers
+            fold_accents (bool): Ignorer les accents du texte et des mots-clés
+            stemming (bool): Trouver aussi les pluriels et féminins usuels
+                (implique whole_word)
+        """
+        self.keywords = list(keywords)
+        self.case_sensitive = case_sensitive
+        self.max_contexts = max_contexts
+        self.fold_accents = fold_accents
+        self.stemming = stemming
+        self.whole_word = whole_word or stemming
+
+        # Motif normalisé -> mots-clés correspondants (ex. "Prix" et "prix")
+        self.pattern_keywords = {}
+        for keyword in self.keywords:
+            if keyword:
+                pattern = self.normalize(keyword)
+                if stemming:
+                    pattern = light_stem(pattern)
+                self.pattern_keywords.setdefault(pattern, []).append(keyword)
+
+        if ahocorasick is not None:
+            self.automaton = ahocorasick.Automaton()
+            for pattern in self.pattern_keywords:
+                self.automaton.add_word(pattern, pattern)
+            if self.pattern_keywords:
+                self.automaton.make_automaton()
+        else:
+            self.automaton = _PurePythonAutomaton(self.pattern_keywords)
+
+    def normalize(self, text):
+        """Normalise un texte ou un mot-clé avant la recherche"""
+        if not self.case_sensitive:
+            text = lower_preserving_length(text)
+        if self.fold_accents:
+            text = strip_accents(text)
+        return text
+
+    def scan(self, text):
+        """
+        Recherche tous les mots-clés dans un texte en un seul passage.
+
+        Args:
+            text (str): Texte de la page
+
+        Returns:
+            dict: mot-clé -> (nombre d'occurrences, liste des premières
+                positions (début, fin) dans le texte), pour les mots-clés trouvés
+        """
+        if not self.pattern_keywords:
+            return {}
+
+        haystack = self.normalize(text)
+        text_length = len(haystack)
+        whole_word = self.whole_word
+        stemming = self.stemming
+        counts = {}
+        spans = {}
+        last_end = {}
+
+        for end_index, pattern in self.automaton.iter(haystack):
+            start = end_index - len(pattern) + 1
+            end = end_index + 1
+            # Occurrences sans chevauchement, comme re.findall
+            if start < last_end.get(pattern, 0):
+                continue
+
+            if whole_word:
+                if start > 0 and _is_word_char(haystack[start - 1]):
+                    continue
+                if stemming:
+                    # Étendre à la terminaison du mot si c'est une flexion connue
+                    word_end = end
+                    while (
+                        word_end < text_length
+                        and word_end - end <= MAX_INFLECTION_LENGTH
+                        and _is_word_char(haystack[word_end])
+                    ):
+                        word_end += 1
+                    if haystack[end:word_end].lower() not in INFLECTION_SUFFIXES:
+                        continue
+                    end = word_end
+                elif end < text_length and _is_word_char(haystack[end]):
+                    continue
+
+            last_end[pattern] = end
+            counts[pattern] = counts.get(pattern, 0) + 1
+            pattern_spans = spans.setdefault(pattern, [])
+            if len(pattern_spans) < self.max_contexts:
+                pattern_spans.append((start, end))
+
+        found = {}
+        for pattern, count in counts.items():
+            for keyword in self.pattern_keywords[pattern]:
+                found[keyword] = (count, spans[pattern])
+        return found
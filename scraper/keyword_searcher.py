@@ -3,24 +3,55 @@ Module contenant la classe KeywordSearcher pour rechercher des mots-clés dans l
 """
 
 import os
-import re
 import time
 import requests
 import threading
 import logging
-import csv
 import tempfile
 import datetime
 import json
+import hashlib
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
+from utils.common_utils import get_random_headers
+from utils.host_scheduler import get_shared_scheduler
+from utils.http_client import (
+    MAX_PAGE_BYTES,
+    get_shared_client,
+    is_html_response,
+    read_page,
+)
+from utils.http_metadata import HttpMetadataStore
+from utils.page_cache import PageCache
+from utils.work_window import run_in_window
+from utils.parse_pool import ParsePool, decode_content
+from scraper.keyword_matcher import KeywordMatcher
+from scraper.results_writer import StreamingCSVWriter
+
+RESULT_FIELDNAMES = ["url", "title", "keyword", "matches", "preview", "contexts"]
 
 
 class KeywordSearcher:
     def __init__(
-        self, input_file, keywords, case_sensitive=False, temp_dir=None, max_threads=10
+        self,
+        input_file,
+        keywords,
+        case_sensitive=False,
+        temp_dir=None,
+        max_threads=10,
+        revalidate=True,
+        use_page_cache=True,
+        cache_max_age=None,
+        whole_word=False,
+        fold_accents=False,
+        stemming=False,
+        parse_workers_per_core=0,
+        http2=False,
+        max_page_bytes=MAX_PAGE_BYTES,
+        max_per_host=None,
+        requests_per_second=None,
     ):
         """
         Initialise le chercheur de mots-clés.
@@ -31,11 +62,47 @@ class KeywordSearcher:
             case_sensitive (bool): Si True, respecte la casse des mots-clés
             temp_dir (str, optional): Répertoire temporaire pour les résultats
             max_threads (int, optional): Nombre maximum de threads à utiliser
+            revalidate (bool, optional): Envoyer des requêtes conditionnelles
+                (ETag / Last-Modified) et réutiliser les résultats des pages inchangées
+            use_page_cache (bool, optional): Lire les pages dans le cache disque
+                rempli par le scraper avant de les télécharger
+            cache_max_age (float, optional): Âge maximum en secondes d'une page
+                lue dans le cache ; au-delà elle est retéléchargée (None = pas
+                de limite)
+            whole_word (bool, optional): Ne retenir que les mots entiers
+                ("prix" ne trouve pas "prixfixe")
+            fold_accents (bool, optional): Ignorer les accents ("publie" trouve "publié")
+            stemming (bool, optional): Trouver aussi les pluriels et féminins
+                usuels ("publié" trouve "publiées"), implique whole_word
+            parse_workers_per_core (float, optional): Processus d'analyse HTML
+                par cœur ; 0 pour analyser les pages dans les threads de
+                téléchargement
+            http2 (bool, optional): Télécharger en HTTP/2 (httpx) : les
+                requêtes simultanées vers un hôte partagent une connexion
+            max_page_bytes (int, optional): Octets lus au plus par page ; au-delà
+                la page est analysée tronquée (0 pour tout lire)
+            max_per_host (int, optional): Requêtes simultanées par hôte
+                (par défaut le nombre de threads)
+            requests_per_second (float, optional): Débit maximum par hôte
+                (par défaut calculé à partir du nombre de threads)
         """
         self.input_file = input_file
         self.keywords = keywords if isinstance(keywords, list) else [keywords]
         self.case_sensitive = case_sensitive
+        self.whole_word = whole_word or stemming
+        self.fold_accents = fold_accents
+        self.stemming = stemming
         self.max_threads = max_threads
+        self.max_page_bytes = max_page_bytes
+
+        # Automate de recherche construit une fois pour tous les mots-clés
+        self.matcher = KeywordMatcher(
+            self.keywords,
+            case_sensitive,
+            whole_word=whole_word,
+            fold_accents=fold_accents,
+            stemming=stemming,
+        )
 
         # Créer un répertoire temporaire pour les résultats
         if temp_dir:
@@ -52,17 +119,51 @@ class KeywordSearcher:
 
         # Threads et synchronisation
         self.lock = threading.RLock()
-        self.session_pool = []
-        for _ in range(max_threads):
-            session = requests.Session()
-            self.session_pool.append(session)
 
-        self.session_lock = threading.Lock()
-        self.session_index = 0
+        # Client HTTP partagé (connexions keep-alive, pools à la taille des threads)
+        self.http_client = get_shared_client(max_threads, http2=http2)
+
+        # Politesse par hôte partagée avec les autres modules
+        self.scheduler = get_shared_scheduler(
+            max_threads, max_per_host, requests_per_second
+        )
+
+        # Métadonnées HTTP pour les recrawls (réponses 304), stockées à côté du
+        # fichier d'URLs (data/<domaine>/). Les résultats réutilisables dépendent
+        # des mots-clés et de la casse.
+        self.http_metadata = (
+            HttpMetadataStore.for_directory(
+                os.path.dirname(os.path.abspath(input_file))
+            )
+            if revalidate
+            else None
+        )
+        signature = json.dumps(
+            [
+                sorted(self.keywords),
+                self.case_sensitive,
+                self.whole_word,
+                self.fold_accents,
+                self.stemming,
+            ]
+        )
+        self.metadata_stage = (
+            "keywords:" + hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+        )
+
+        # Cache disque des pages rempli par le scraper
+        self.page_cache = (
+            PageCache.for_directory(
+                os.path.dirname(os.path.abspath(input_file)), max_age=cache_max_age
+            )
+            if use_page_cache
+            else None
+        )
 
-        # Résultats
-        self.results = []
+        # Résultats écrits au fil de l'eau : seuls les compteurs restent en mémoire
+        self.results_writer = StreamingCSVWriter(self.output_file, RESULT_FIELDNAMES)
         self.results_lock = threading.Lock()
+        self.stats_interval = 30  # Secondes entre deux sauvegardes des statistiques
 
         # Barre de progression
         self.pbar = None
@@ -71,30 +172,44 @@ class KeywordSearcher:
         self.stats = {
             "keywords": self.keywords,
             "case_sensitive": self.case_sensitive,
+            "whole_word": self.whole_word,
+            "fold_accents": self.fold_accents,
+            "stemming": self.stemming,
             "total_urls": 0,
             "processed_urls": 0,
             "urls_with_matches": 0,
             "total_matches": 0,
             "matches_per_keyword": {keyword: 0 for keyword in self.keywords},
+            "unchanged_pages": 0,
+            "cached_pages": 0,
+            "truncated_pages": 0,
             "start_time": datetime.datetime.now().isoformat(),
         }
 
+        # Analyse des pages dans un pool de processus (démarré par run())
+        self.parse_workers_per_core = parse_workers_per_core
+        self.parse_pool = None
+
         # Configuration du logger
         self.logger = self._setup_logger()
 
-    def __del__(self):
-        """Ferme les sessions HTTP lorsque l'objet est détruit"""
-        if hasattr(self, "session_pool"):
-            for session in self.session_pool:
-                try:
-                    session.close()
-                except:
-                    pass
-        elif hasattr(self, "session"):
-            try:
-                self.session.close()
-            except:
-                pass
+    # Attributs copiés dans les processus d'analyse : de quoi chercher les
+    # mots-clés dans une page, sans sessions, verrous, fichiers ni compteurs
+    _PARSE_STATE = (
+        "keywords",
+        "case_sensitive",
+        "whole_word",
+        "fold_accents",
+        "stemming",
+        "matcher",
+    )
+
+    def __getstate__(self):
+        return {name: self.__dict__[name] for name in self._PARSE_STATE}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.parse_pool = None
 
     def _setup_logger(self):
         """Configure le logger pour cette classe"""
@@ -122,44 +237,9 @@ class KeywordSearcher:
 
         return logger
 
-    def __del__(self):
-        """Ferme les sessions HTTP lorsque l'objet est détruit"""
-        for session in self.session_pool:
-            session.close()
-
     def get_random_headers(self):
-        """Génère des en-têtes HTTP aléatoires qui imitent un navigateur"""
-        try:
-            from fake_useragent import UserAgent
-
-            ua = UserAgent()
-            return {
-                "User-Agent": ua.random,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-                "DNT": "1",
-            }
-        except:
-            # Fallback
-            return {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Referer": "https://www.google.com/",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-
-    def get_session(self):
-        """Obtient une session du pool de manière thread-safe"""
-        with self.session_lock:
-            session = self.session_pool[self.session_index]
-            self.session_index = (self.session_index + 1) % len(self.session_pool)
-            return session
+        """Génère des en-têtes HTTP qui imitent un navigateur (pool partagé)"""
+        return get_random_headers()
 
     def search_keywords_in_text(self, text, url):
         """
@@ -169,11 +249,35 @@ class KeywordSearcher:
             text (str): Texte de la page web
             url (str): URL de la page web
 
+        Returns:
+            list: Liste des résultats pour chaque mot-clé trouvé
+        """
+        return self.search_keywords_in_soup(BeautifulSoup(text, "html.parser"), url)
+
+    def search_keywords_in_content(self, content, encoding, url):
+        """Recherche les mots-clés dans le corps brut (bytes) d'une page"""
+        return self.search_keywords_in_text(decode_content(content, encoding), url)
+
+    def _search_keywords(self, content, encoding, url):
+        """Recherche les mots-clés dans un corps brut, dans le pool de processus s'il est actif"""
+        if self.parse_pool is not None:
+            return self.parse_pool.call(
+                "search_keywords_in_content", content, encoding, url
+            )
+        return self.search_keywords_in_content(content, encoding, url)
+
+    def search_keywords_in_soup(self, soup, url):
+        """
+        Recherche les mots-clés dans une page déjà analysée.
+
+        Args:
+            soup (BeautifulSoup): Document HTML analysé (non modifié)
+            url (str): URL de la page web
+
         Returns:
             list: Liste des résultats pour chaque mot-clé trouvé
         """
         search_results = []
-        soup = BeautifulSoup(text, "html.parser")
 
         # Extraire le titre
         title = soup.title.string if soup.title else "Sans titre"
@@ -186,61 +290,36 @@ class KeywordSearcher:
             page_content[:200] + "..." if len(page_content) > 200 else page_content
         )
 
-        # Vérifier si nous avons des patterns précompilés, sinon les créer
-        if not hasattr(self, "keyword_patterns"):
-            self.keyword_patterns = {}
-            for keyword in self.keywords:
-                if self.case_sensitive:
-                    self.keyword_patterns[keyword] = re.compile(re.escape(keyword))
-                else:
-                    self.keyword_patterns[keyword] = re.compile(
-                        re.escape(keyword), re.IGNORECASE
-                    )
-
-        # Recherche pour chaque mot-clé
-        for keyword in self.keywords:
-            # Utiliser le pattern précompilé
-            pattern = self.keyword_patterns[keyword]
+        # Une seule passe sur le texte pour tous les mots-clés
+        found = self.matcher.scan(page_content)
 
-            matches = pattern.findall(page_content)
-            match_count = len(matches)
+        for keyword in self.keywords:
+            if keyword not in found:
+                continue
 
+            match_count, spans = found[keyword]
             if match_count > 0:
-                # Mettre à jour les statistiques
-                with self.results_lock:
-                    self.stats["total_matches"] += match_count
-                    self.stats["matches_per_keyword"][keyword] += match_count
-
-                # Extraire les contextes d'occurrence de manière plus efficace
+                # Extraire les contextes des premières occurrences (5 max)
                 contexts = []
-                # Limiter le nombre de contextes à extraire pour les performances
-                matches_to_process = pattern.finditer(page_content)
-                context_count = 0
-
-                for match in matches_to_process:
-                    if context_count >= 5:  # Limiter à 5 contextes max
-                        break
-
-                    start = max(0, match.start() - 50)
-                    end = min(len(page_content), match.end() + 50)
-                    context = page_content[start:end].replace("\n", " ")
+                for match_start, match_end in spans:
+                    start = max(0, match_start - 50)
+                    end = min(len(page_content), match_end + 50)
+
+                    # Mettre en évidence l'occurrence trouvée, à sa position et
+                    # telle qu'écrite dans la page (casse, accents et
+                    # terminaison d'origine), sans marquer les autres sous-chaînes
+                    # identiques du contexte
+                    context = (
+                        page_content[start:match_start]
+                        + f"**{page_content[match_start:match_end]}**"
+                        + page_content[match_end:end]
+                    ).replace("\n", " ")
                     if start > 0:
                         context = "..." + context
                     if end < len(page_content):
                         context = context + "..."
 
-                    # Mettre en évidence le mot-clé dans le contexte (pour la lisibilité)
-                    if self.case_sensitive:
-                        highlighted = context.replace(keyword, f"**{keyword}**")
-                    else:
-                        # Pour respecter la casse originale même en mode insensible
-                        original_match = match.group(0)
-                        highlighted = context.replace(
-                            original_match, f"**{original_match}**"
-                        )
-
-                    contexts.append(highlighted)
-                    context_count += 1
+                    contexts.append(context)
 
                 # Si plus de 5 correspondances, ajouter une note
                 if match_count > 5:
@@ -266,43 +345,69 @@ class KeywordSearcher:
             return None
 
         try:
-            session = self.get_session()
-            headers = self.get_random_headers()
-
-            # Ajouter un referer plausible
-            parsed_url = urlparse(url)
-            headers["Referer"] = f"{parsed_url.scheme}://{parsed_url.netloc}/"
-
-            # Requête
-            response = session.get(
-                url, headers=headers, verify=False, timeout=15, allow_redirects=True
-            )
+            cached = self.page_cache.get(url) if self.page_cache else None
+            response = None
 
-            response.raise_for_status()
+            if cached is not None:
+                # Page déjà téléchargée par le scraper : pas de requête réseau
+                content_type = cached.content_type
+                with self.results_lock:
+                    self.stats["cached_pages"] += 1
+            else:
+                conditional_headers = (
+                    self.http_metadata.conditional_headers(url)
+                    if self.http_metadata
+                    else None
+                )
+                # Corps lu seulement après vérification de Content-Type
+                response = self.fetch_page(url, conditional_headers, stream=True)
+
+                if response.status_code == 304:
+                    response.close()
+                    # Page inchangée : réutiliser les résultats précédents
+                    previous = self.http_metadata.get_payload(url, self.metadata_stage)
+                    if previous is not None:
+                        with self.results_lock:
+                            self.stats["unchanged_pages"] += 1
+                        self._record_results(previous)
+                        self.pbar.update(1)
+                        return {"url": url, "status": "unchanged", "results": previous}
+
+                    response = self.fetch_page(url, stream=True)
+
+                content_type = response.headers.get("Content-Type", "")
+                if not is_html_response(response):
+                    # Ressource non HTML : abandonnée sans télécharger le corps
+                    response.close()
+                    if self.page_cache:
+                        self.page_cache.put(url, b"", content_type)
 
             # Vérifier si c'est du HTML
-            if "text/html" not in response.headers.get("Content-Type", "").lower():
+            if "text/html" not in content_type.lower():
                 self.pbar.update(1)
                 with self.results_lock:
                     self.stats["processed_urls"] += 1
                 return {"url": url, "status": "not_html", "results": []}
 
             # Rechercher les mots-clés
-            search_results = self.search_keywords_in_text(response.text, url)
+            if cached is not None:
+                search_results = self._search_keywords(
+                    cached.content, cached.encoding, url
+                )
+            else:
+                page = self._read_page(url, response)
+                search_results = self._search_keywords(page.content, page.encoding, url)
+
+            if self.http_metadata and response is not None:
+                self.http_metadata.record(url, response)
+                self.http_metadata.set_payload(url, self.metadata_stage, search_results)
 
             # Mettre à jour les statistiques
-            with self.results_lock:
-                self.stats["processed_urls"] += 1
-                if search_results:
-                    self.stats["urls_with_matches"] += 1
-                    self.results.extend(search_results)
+            self._record_results(search_results)
 
             # Mettre à jour la barre de progression
             self.pbar.update(1)
 
-            # Pause aléatoire courte pour respect des robots
-            time.sleep(0.2)
-
             return {"url": url, "status": "success", "results": search_results}
 
         except requests.RequestException as e:
@@ -318,27 +423,94 @@ class KeywordSearcher:
                 self.stats["processed_urls"] += 1
             return {"url": url, "status": "error", "results": []}
 
+    def _read_page(self, url, response):
+        """
+        Lit le corps d'une page HTML dans la limite du budget d'octets ; seules
+        les pages lues en entier sont enregistrées dans le cache ; l'ancienne
+        copie d'une page tronquée en est retirée.
+
+        Returns:
+            PageBody: Corps, encodage et indicateur de troncature
+        """
+        page = read_page(response, self.max_page_bytes)
+        if page.truncated:
+            with self.results_lock:
+                self.stats["truncated_pages"] += 1
+            if self.page_cache:
+                self.page_cache.discard(url)
+        elif self.page_cache:
+            self.page_cache.put(
+                url,
+                page.content,
+                response.headers.get("Content-Type", ""),
+                page.encoding,
+            )
+        return page
+
+    def fetch_page(self, url, extra_headers=None, stream=False):
+        """
+        Télécharge une page avec un en-tête de navigateur et un referer plausible
+
+        Args:
+            url (str): URL à récupérer
+            extra_headers (dict, optional): En-têtes supplémentaires (requêtes conditionnelles)
+            stream (bool, optional): Ne pas lire le corps de la réponse d'avance
+        """
+        headers = self.get_random_headers()
+
+        # Ajouter un referer plausible
+        parsed_url = urlparse(url)
+        headers["Referer"] = f"{parsed_url.scheme}://{parsed_url.netloc}/"
+        if extra_headers:
+            headers.update(extra_headers)
+
+        # Requête
+        response = self.scheduler.fetch(
+            url,
+            lambda: self.http_client.get(
+                url, headers=headers, stream=stream, timeout=15
+            ),
+        )
+
+        response.raise_for_status()
+        return response
+
+    def _record_results(self, search_results):
+        """Met à jour les statistiques et transmet les résultats d'une URL à l'écrivain CSV"""
+        with self.results_lock:
+            self.stats["processed_urls"] += 1
+            if search_results:
+                self.stats["urls_with_matches"] += 1
+            for result in search_results:
+                self.stats["total_matches"] += result["matches"]
+                self.stats["matches_per_keyword"][result["keyword"]] += result[
+                    "matches"
+                ]
+
+        for result in search_results:
+            self.results_writer.write(
+                {
+                    "url": result["url"],
+                    "title": result["title"],
+                    "keyword": result["keyword"],
+                    "matches": result["matches"],
+                    "preview": result["preview"],
+                    # Convertir la liste de contextes en une chaîne formatée
+                    "contexts": " | ".join(result["contexts"]),
+                }
+            )
+
+    def open_results(self):
+        """Crée le fichier CSV des résultats et démarre l'écriture au fil de l'eau"""
+        self.results_writer.open()
+
     def save_results(self):
-        """Sauvegarde les résultats dans un fichier CSV"""
-        with open(self.output_file, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = ["url", "title", "keyword", "matches", "preview", "contexts"]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for result in self.results:
-                # Convertir la liste de contextes en une chaîne formatée
-                contexts_str = " | ".join(result["contexts"])
-
-                writer.writerow(
-                    {
-                        "url": result["url"],
-                        "title": result["title"],
-                        "keyword": result["keyword"],
-                        "matches": result["matches"],
-                        "preview": result["preview"],
-                        "contexts": contexts_str,
-                    }
-                )
+        """Termine l'écriture des résultats dans le fichier CSV"""
+        self.results_writer.close()
+        if self.results_writer.error:
+            self.logger.error(
+                f"Erreur d'écriture des résultats dans {self.output_file}: {self.results_writer.error}"
+            )
 
     def save_stats(self):
         """Sauvegarde les statistiques dans un fichier JSON"""
@@ -347,10 +519,16 @@ class KeywordSearcher:
         start = datetime.datetime.fromisoformat(self.stats["start_time"])
         end = datetime.datetime.fromisoformat(self.stats["end_time"])
         self.stats["duration_seconds"] = (end - start).total_seconds()
+        self.stats["http_connections"] = self.http_client.stats()
+
+        with self.results_lock:
+            stats = json.dumps(self.stats, indent=2)
 
-        # Sauvegarder le fichier
-        with open(self.stats_file, "w", encoding="utf-8") as f:
-            json.dump(self.stats, f, indent=2)
+        # Remplacer le fichier d'un bloc pour ne jamais laisser de JSON tronqué
+        tmp_file = f"{self.stats_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            f.write(stats)
+        os.replace(tmp_file, self.stats_file)
 
     def format_time(self, seconds):
         """Formate les secondes en format HH:MM:SS"""
@@ -358,6 +536,21 @@ class KeywordSearcher:
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
+    def _prewarm_connections(self, url):
+        """Ouvre autant de connexions vers l'hôte de l'URL que de threads autorisés"""
+        connections = min(self.max_threads, self.scheduler.max_per_host)
+        opened = self.http_client.prewarm(url, connections)
+        if opened:
+            self.logger.info(f"{opened} connexions préchauffées vers {url}")
+
+    def _iter_urls(self):
+        """Lit les URLs du fichier d'entrée une par une"""
+        with open(self.input_file, "r", encoding="utf-8") as f:
+            for line in f:
+                url = line.strip()
+                if url:
+                    yield url
+
     def run(self, progress_callback=None):
         """
         Exécute la recherche de mots-clés sur toutes les URLs
@@ -368,10 +561,10 @@ class KeywordSearcher:
         """
         start_time = time.time()
 
-        # Lire les URLs depuis le fichier
+        # Compter les URLs ; elles sont ensuite relues au fil de la soumission
         try:
             with open(self.input_file, "r", encoding="utf-8") as f:
-                urls = [line.strip() for line in f if line.strip()]
+                total_urls = sum(1 for line in f if line.strip())
         except Exception as e:
             error_msg = (
                 f"Erreur lors de la lecture du fichier {self.input_file}: {str(e)}"
@@ -381,7 +574,6 @@ class KeywordSearcher:
                 progress_callback(0, 0, error_msg)
             return None
 
-        total_urls = len(urls)
         self.stats["total_urls"] = total_urls
 
         self.logger.info(
@@ -389,6 +581,11 @@ class KeywordSearcher:
         )
         self.logger.info(f"Mots-clés: {', '.join(self.keywords)}")
 
+        # Ouvrir les connexions vers le site avant le premier résultat
+        first_url = next(iter(self._iter_urls()), None)
+        if first_url:
+            self._prewarm_connections(first_url)
+
         if progress_callback:
             progress_callback(
                 0, total_urls, f"Démarrage de la recherche pour {total_urls} URLs"
@@ -401,60 +598,76 @@ class KeywordSearcher:
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
         )
 
-        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
-            # Soumettre toutes les URLs
-            future_to_url = {
-                executor.submit(self.process_url, url): url for url in urls
-            }
+        self.open_results()
+        last_stats_save = time.time()
 
-            # Mise à jour de la barre de progression avec ETA formaté
-            processed = 0
-            while processed < total_urls:
-                time.sleep(0.5)  # Mise à jour toutes les 0.5 secondes
-                processed = sum(1 for future in future_to_url if future.done())
+        def update_progress(processed):
+            """Appelée depuis le thread principal, coût indépendant du nombre d'URLs"""
+            nonlocal last_stats_save
 
-                # Calculer et formater l'ETA
-                elapsed = time.time() - start_time
-                urls_per_second = processed / elapsed if elapsed > 0 else 0
-                remaining = total_urls - processed
-                eta_seconds = remaining / urls_per_second if urls_per_second > 0 else 0
+            # Calculer et formater l'ETA
+            elapsed = time.time() - start_time
+            urls_per_second = processed / elapsed if elapsed > 0 else 0
+            remaining = total_urls - processed
+            eta_seconds = remaining / urls_per_second if urls_per_second > 0 else 0
 
-                # Formater en HH:MM:SS
-                eta_formatted = self.format_time(eta_seconds)
+            # Formater en HH:MM:SS
+            eta_formatted = self.format_time(eta_seconds)
 
-                # Mots-clés trouvés jusqu'à présent
-                with self.results_lock:
-                    matches_found = self.stats["total_matches"]
-                    urls_with_matches = self.stats["urls_with_matches"]
+            # Mots-clés trouvés jusqu'à présent
+            with self.results_lock:
+                matches_found = self.stats["total_matches"]
 
-                success_rate = (
-                    f"{(urls_with_matches / processed * 100):.1f}%"
-                    if processed > 0
-                    else "0.0%"
-                )
+            # Mettre à jour la description de la barre
+            self.pbar.set_description(
+                f"Recherche - ETA: {eta_formatted} - Correspondances: {matches_found}"
+            )
 
-                # Mettre à jour la description de la barre
-                self.pbar.set_description(
-                    f"Recherche - ETA: {eta_formatted} - Correspondances: {matches_found}"
+            # Mise à jour du callback de progression
+            if progress_callback:
+                progress_callback(
+                    processed,
+                    total_urls,
+                    f"Progression: {processed}/{total_urls} - Correspondances: {matches_found} - ETA: {eta_formatted}",
                 )
 
-                # Mise à jour du callback de progression
-                if progress_callback:
-                    progress_callback(
-                        processed,
-                        total_urls,
-                        f"Progression: {processed}/{total_urls} - Correspondances: {matches_found} - ETA: {eta_formatted}",
-                    )
+            # Sauvegarde périodique des statistiques
+            if time.time() - last_stats_save >= self.stats_interval:
+                self.save_stats()
+                last_stats_save = time.time()
 
-                # Si tous les URLs sont traités, sortir de la boucle
-                if processed >= total_urls:
-                    break
+        # Les threads téléchargent, les processus analysent les pages
+        if self.parse_workers_per_core > 0:
+            self.parse_pool = ParsePool(self, self.parse_workers_per_core)
+            self.logger.info(
+                f"Analyse des pages dans {self.parse_pool.max_workers} processus"
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                # Fenêtre glissante : quelques tâches d'avance par thread, sans
+                # garder un Future par URL
+                run_in_window(
+                    executor,
+                    self.process_url,
+                    self._iter_urls(),
+                    max_pending=self.max_threads * 4,
+                    on_progress=update_progress,
+                )
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
 
         # Fermer la barre de progression
         self.pbar.close()
 
         # Sauvegarder les résultats
         self.save_results()
+        if self.http_metadata:
+            self.http_metadata.commit()
+        if self.page_cache:
+            self.page_cache.commit()
 
         # Sauvegarder les statistiques
         self.save_stats()
@@ -0,0 +1,82 @@
+"""
+Fonctions d'extraction des liens (<a href> et <link href>) d'une page HTML.
+
+Deux implémentations sont disponibles :
+- "lxml" : parseur C de lxml et requête XPath, sans construire d'arbre BeautifulSoup
+- "html.parser" : BeautifulSoup avec le parseur pur Python, utilisé en secours
+"""
+
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml est optionnel, BeautifulSoup sert alors de secours
+    lxml_etree = None
+
+LINK_PARSERS = ("lxml", "html.parser")
+
+_LINKS_XPATH = "//a/@href | //link/@href"
+
+
+def extract_links_soup(html_content, base_url):
+    """Extrait les liens avec BeautifulSoup et html.parser"""
+    soup = BeautifulSoup(html_content, "html.parser")
+    urls = set()
+
+    # Extraire les liens <a href>
+    for a_tag in soup.find_all("a", href=True):
+        urls.add(urljoin(base_url, a_tag["href"]))
+
+    # Extraire les liens de <link>
+    for link_tag in soup.find_all("link", href=True):
+        urls.add(urljoin(base_url, link_tag["href"]))
+
+    return urls
+
+
+def extract_links_lxml(html_content, base_url):
+    """
+    Extrait les liens avec le parseur HTML de lxml.
+
+    Raises:
+        ValueError: Si lxml n'est pas installé ou ne peut pas lire le document
+    """
+    if lxml_etree is None:
+        raise ValueError("lxml n'est pas installé")
+
+    if isinstance(html_content, str) and html_content.lstrip().startswith("<?xml"):
+        # lxml refuse les chaînes Unicode portant une déclaration d'encodage
+        html_content = html_content.encode("utf-8")
+
+    try:
+        root = lxml_etree.fromstring(html_content, lxml_etree.HTMLParser())
+    except lxml_etree.LxmlError as e:
+        raise ValueError(str(e)) from e
+
+    if root is None:
+        return set()
+
+    return {urljoin(base_url, str(href)) for href in root.xpath(_LINKS_XPATH)}
+
+
+def extract_links(html_content, base_url, parser="lxml"):
+    """
+    Extrait toutes les URLs d'une page HTML.
+
+    Args:
+        html_content (str): Contenu HTML
+        base_url (str): URL de la page, pour résoudre les liens relatifs
+        parser (str): "lxml" (rapide) ou "html.parser" ; lxml retombe sur
+            html.parser s'il est indisponible ou échoue
+
+    Returns:
+        set: URLs absolues trouvées
+    """
+    if parser == "lxml":
+        try:
+            return extract_links_lxml(html_content, base_url)
+        except ValueError:
+            pass
+
+    return extract_links_soup(html_content, base_url)
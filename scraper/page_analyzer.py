@@ -0,0 +1,486 @@
+"""
+Module contenant la classe PageAnalyzer pour extraire les dates et rechercher
+des mots-clés en un seul passage sur les pages web.
+"""
+
+import os
+import time
+import requests
+import threading
+import logging
+from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from tqdm import tqdm
+from utils.http_client import MAX_PAGE_BYTES, is_html_response, read_page
+from utils.http_metadata import HttpMetadataStore
+from utils.page_cache import PageCache
+from utils.work_window import run_in_window
+from utils.parse_pool import ParsePool, decode_content
+from scraper.date_extractor import DateExtractor
+from scraper.keyword_searcher import KeywordSearcher
+
+
+class PageAnalyzer:
+    def __init__(
+        self,
+        input_file,
+        keywords,
+        case_sensitive=False,
+        date_output_file=None,
+        temp_dir=None,
+        max_threads=10,
+        revalidate=True,
+        use_page_cache=True,
+        cache_max_age=None,
+        whole_word=False,
+        fold_accents=False,
+        stemming=False,
+        parse_workers_per_core=0,
+        http2=False,
+        max_page_bytes=MAX_PAGE_BYTES,
+        max_per_host=None,
+        requests_per_second=None,
+    ):
+        """
+        Initialise l'analyse combinée : chaque page est téléchargée et analysée
+        une seule fois, puis la date et les mots-clés sont extraits du même
+        document.
+
+        Args:
+            input_file (str): Fichier contenant les URLs à analyser
+            keywords (list): Liste de mots-clés à rechercher
+            case_sensitive (bool): Si True, respecte la casse des mots-clés
+            date_output_file (str, optional): Fichier CSV des dates
+                (par défaut: [nom_du_fichier_d'entrée]-dates.csv)
+            temp_dir (str, optional): Répertoire des résultats de mots-clés
+            max_threads (int, optional): Nombre maximum de threads à utiliser
+            revalidate (bool, optional): Envoyer des requêtes conditionnelles
+                (ETag / Last-Modified) et réutiliser les résultats des pages inchangées
+            use_page_cache (bool, optional): Lire les pages dans le cache disque
+                rempli par le scraper avant de les télécharger
+            cache_max_age (float, optional): Âge maximum en secondes d'une page
+                lue dans le cache ; au-delà elle est retéléchargée (None = pas
+                de limite)
+            whole_word (bool, optional): Ne retenir que les mots entiers
+            fold_accents (bool, optional): Ignorer les accents des mots-clés
+            stemming (bool, optional): Trouver aussi les pluriels et féminins usuels
+            parse_workers_per_core (float, optional): Processus d'analyse HTML
+                par cœur ; 0 pour analyser les pages dans les threads de
+                téléchargement
+            http2 (bool, optional): Télécharger en HTTP/2 (httpx) : les
+                requêtes simultanées vers un hôte partagent une connexion
+            max_page_bytes (int, optional): Octets lus au plus par page ; au-delà
+                la page est analysée tronquée (0 pour tout lire)
+            max_per_host (int, optional): Requêtes simultanées par hôte
+                (par défaut le nombre de threads)
+            requests_per_second (float, optional): Débit maximum par hôte
+                (par défaut calculé à partir du nombre de threads)
+        """
+        self.input_file = input_file
+        self.max_threads = max_threads
+
+        # Les deux modules fournissent l'extraction et l'écriture des résultats ;
+        # le téléchargement, le cache et les métadonnées sont gérés ici.
+        self.date_extractor = DateExtractor(
+            input_file,
+            date_output_file,
+            max_threads,
+            revalidate=False,
+            use_page_cache=False,
+            http2=http2,
+            max_per_host=max_per_host,
+            requests_per_second=requests_per_second,
+        )
+        self.keyword_searcher = KeywordSearcher(
+            input_file,
+            keywords,
+            case_sensitive,
+            temp_dir=temp_dir,
+            max_threads=max_threads,
+            revalidate=False,
+            use_page_cache=False,
+            whole_word=whole_word,
+            fold_accents=fold_accents,
+            stemming=stemming,
+            http2=http2,
+            max_per_host=max_per_host,
+            requests_per_second=requests_per_second,
+        )
+
+        data_dir = os.path.dirname(os.path.abspath(input_file))
+        self.http_metadata = (
+            HttpMetadataStore.for_directory(data_dir) if revalidate else None
+        )
+        self.page_cache = (
+            PageCache.for_directory(data_dir, max_age=cache_max_age)
+            if use_page_cache
+            else None
+        )
+
+        self.stats_lock = threading.Lock()
+        self.unchanged_pages = 0
+        self.cached_pages = 0
+        self.max_page_bytes = max_page_bytes
+        self.truncated_pages = 0
+        self.pbar = None
+
+        # Analyse des pages dans un pool de processus (démarré par run())
+        self.parse_workers_per_core = parse_workers_per_core
+        self.parse_pool = None
+
+        self.logger = self._setup_logger()
+
+    def __getstate__(self):
+        # Copie pour les processus d'analyse : les deux extracteurs suffisent
+        return {
+            "date_extractor": self.date_extractor,
+            "keyword_searcher": self.keyword_searcher,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.parse_pool = None
+
+    def _setup_logger(self):
+        """Configure le logger pour cette classe"""
+        logger = logging.getLogger("PageAnalyzer")
+        logger.setLevel(logging.INFO)
+
+        # Vérifier si des handlers sont déjà configurés
+        if not logger.handlers:
+            # Créer le handler pour fichier
+            file_handler = logging.FileHandler("page_analyzer.log")
+            file_handler.setLevel(logging.INFO)
+
+            # Créer le handler pour console
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(logging.INFO)
+
+            # Créer le format
+            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+            file_handler.setFormatter(formatter)
+            console_handler.setFormatter(formatter)
+
+            # Ajouter les handlers au logger
+            logger.addHandler(file_handler)
+            logger.addHandler(console_handler)
+
+        return logger
+
+    def _record(self, url, date, status, search_results):
+        """Enregistre la date et les mots-clés trouvés pour une URL"""
+        self.date_extractor._add_result({"url": url, "date": date, "status": status})
+        self.keyword_searcher._record_results(search_results)
+
+    def _record_failure(self):
+        """Compte une URL sans résultat (non HTML ou en erreur)"""
+        with self.keyword_searcher.results_lock:
+            self.keyword_searcher.stats["processed_urls"] += 1
+
+    def analyze_content(self, content, encoding, url):
+        """
+        Une seule analyse HTML du corps brut d'une page pour les deux extractions.
+
+        Returns:
+            tuple: (date de publication ou None, résultats des mots-clés)
+        """
+        soup = BeautifulSoup(decode_content(content, encoding), "html.parser")
+        publication_date = self.date_extractor.extract_date_from_soup(soup, url)
+        search_results = self.keyword_searcher.search_keywords_in_soup(soup, url)
+        return publication_date, search_results
+
+    def _analyze(self, content, encoding, url):
+        """Analyse un corps brut, dans le pool de processus s'il est actif"""
+        if self.parse_pool is not None:
+            return self.parse_pool.call("analyze_content", content, encoding, url)
+        return self.analyze_content(content, encoding, url)
+
+    def process_url(self, url):
+        """Traite une URL : un téléchargement, une analyse HTML, deux extractions"""
+        url = url.strip()
+        if not url:
+            return None
+
+        keyword_stage = self.keyword_searcher.metadata_stage
+
+        try:
+            cached = self.page_cache.get(url) if self.page_cache else None
+            response = None
+
+            if cached is not None:
+                # Page déjà téléchargée par le scraper : pas de requête réseau
+                content_type = cached.content_type
+                with self.stats_lock:
+                    self.cached_pages += 1
+            else:
+                conditional_headers = (
+                    self.http_metadata.conditional_headers(url)
+                    if self.http_metadata
+                    else None
+                )
+                # Corps lu seulement après vérification de Content-Type
+                response = self.date_extractor.fetch_page(
+                    url, conditional_headers, stream=True
+                )
+
+                if response.status_code == 304:
+                    response.close()
+                    # Page inchangée : réutiliser les résultats des deux modules
+                    previous_date = self.http_metadata.get_payload(url, "date")
+                    previous_keywords = self.http_metadata.get_payload(
+                        url, keyword_stage
+                    )
+                    if previous_date is not None and previous_keywords is not None:
+                        self._record(
+                            url,
+                            previous_date["date"],
+                            previous_date["status"],
+                            previous_keywords,
+                        )
+                        with self.stats_lock:
+                            self.unchanged_pages += 1
+                        self.pbar.update(1)
+                        return {"url": url, "status": "unchanged"}
+
+                    response = self.date_extractor.fetch_page(url, stream=True)
+
+                content_type = response.headers.get("Content-Type", "")
+                if not is_html_response(response):
+                    # Ressource non HTML : abandonnée sans télécharger le corps
+                    response.close()
+                    if self.page_cache:
+                        self.page_cache.put(url, b"", content_type)
+
+            # Vérifier si c'est du HTML
+            if "text/html" not in content_type.lower():
+                self._record_failure()
+                self.pbar.update(1)
+                return {"url": url, "status": "not_html"}
+
+            # Une seule analyse HTML pour les deux extractions
+            if cached is not None:
+                publication_date, search_results = self._analyze(
+                    cached.content, cached.encoding, url
+                )
+            else:
+                page = read_page(response, self.max_page_bytes)
+                if page.truncated:
+                    # Page tronquée : analysée, mais pas mise en cache, et
+                    # l'ancienne copie éventuelle n'est plus à jour
+                    with self.stats_lock:
+                        self.truncated_pages += 1
+                    if self.page_cache:
+                        self.page_cache.discard(url)
+                elif self.page_cache:
+                    self.page_cache.put(url, page.content, content_type, page.encoding)
+                publication_date, search_results = self._analyze(
+                    page.content, page.encoding, url
+                )
+            status = "success" if publication_date else "no_date_found"
+
+            self._record(url, publication_date, status, search_results)
+
+            if self.http_metadata and response is not None:
+                self.http_metadata.record(url, response)
+                self.http_metadata.set_payload(
+                    url, "date", {"date": publication_date, "status": status}
+                )
+                self.http_metadata.set_payload(url, keyword_stage, search_results)
+
+            self.pbar.update(1)
+            return {"url": url, "status": status}
+
+        except requests.RequestException as e:
+            self._record_failure()
+            self.pbar.update(1)
+            return {"url": url, "status": f"error_{type(e).__name__}"}
+
+        except Exception as e:
+            self._record_failure()
+            self.pbar.update(1)
+            return {"url": url, "status": "error"}
+
+    def format_time(self, seconds):
+        """Formate les secondes en format HH:MM:SS"""
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+    def run(self, progress_callback=None):
+        """
+        Exécute l'analyse combinée sur toutes les URLs
+
+        Args:
+            progress_callback (callable, optional): Fonction callback pour mettre à jour la progression
+                Signature: callback(current_progress, max_progress, status_message)
+
+        Returns:
+            dict: Fichiers de résultats et statistiques, None si le fichier
+                d'URLs est illisible
+        """
+        start_time = time.time()
+
+        # Compter les URLs ; elles sont ensuite relues au fil de la soumission
+        try:
+            with open(self.input_file, "r", encoding="utf-8") as f:
+                total_urls = sum(1 for line in f if line.strip())
+        except Exception as e:
+            error_msg = (
+                f"Erreur lors de la lecture du fichier {self.input_file}: {str(e)}"
+            )
+            self.logger.error(error_msg)
+            if progress_callback:
+                progress_callback(0, 0, error_msg)
+            return None
+
+        searcher = self.keyword_searcher
+        searcher.stats["total_urls"] = total_urls
+
+        self.logger.info(f"Analyse de {total_urls} URLs depuis {self.input_file}")
+        self.logger.info(f"Mots-clés: {', '.join(searcher.keywords)}")
+
+        # Ouvrir les connexions vers le site avant le premier résultat
+        first_url = next(iter(searcher._iter_urls()), None)
+        if first_url:
+            searcher._prewarm_connections(first_url)
+
+        if progress_callback:
+            progress_callback(
+                0, total_urls, f"Démarrage de l'analyse pour {total_urls} URLs"
+            )
+
+        # Initialiser la barre de progression
+        self.pbar = tqdm(
+            total=total_urls,
+            desc="Analyse des pages",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
+        )
+
+        searcher.open_results()
+        last_stats_save = time.time()
+
+        def update_progress(processed):
+            nonlocal last_stats_save
+
+            # Sauvegarde périodique des statistiques
+            if time.time() - last_stats_save >= searcher.stats_interval:
+                searcher.save_stats()
+                last_stats_save = time.time()
+
+            if progress_callback:
+                elapsed = time.time() - start_time
+                urls_per_second = processed / elapsed if elapsed > 0 else 0
+                remaining = total_urls - processed
+                eta_seconds = remaining / urls_per_second if urls_per_second > 0 else 0
+                with searcher.results_lock:
+                    matches_found = searcher.stats["total_matches"]
+
+                progress_callback(
+                    processed,
+                    total_urls,
+                    f"Progression: {processed}/{total_urls} - Correspondances: {matches_found} - ETA: {self.format_time(eta_seconds)}",
+                )
+
+        # Les threads téléchargent, les processus analysent les pages
+        if self.parse_workers_per_core > 0:
+            self.parse_pool = ParsePool(self, self.parse_workers_per_core)
+            self.logger.info(
+                f"Analyse des pages dans {self.parse_pool.max_workers} processus"
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+                run_in_window(
+                    executor,
+                    self.process_url,
+                    searcher._iter_urls(),
+                    max_pending=self.max_threads * 4,
+                    on_progress=update_progress,
+                )
+        finally:
+            if self.parse_pool is not None:
+                self.parse_pool.shutdown()
+                self.parse_pool = None
+
+        # Fermer la barre de progression
+        self.pbar.close()
+
+        # Sauvegarder les résultats des deux modules
+        self.date_extractor.save_results()
+        searcher.stats["unchanged_pages"] = self.unchanged_pages
+        searcher.stats["cached_pages"] = self.cached_pages
+        searcher.stats["truncated_pages"] = self.truncated_pages
+        searcher.save_results()
+        searcher.save_stats()
+        if self.http_metadata:
+            self.http_metadata.commit()
+        if self.page_cache:
+            self.page_cache.commit()
+
+        # Statistiques finales
+        elapsed_time = time.time() - start_time
+        dates_found = self.date_extractor.dates_found
+
+        final_status = (
+            f"Analyse terminée en {self.format_time(elapsed_time)}\n"
+            f"Dates trouvées: {dates_found}/{total_urls}\n"
+            f"Correspondances trouvées: {searcher.stats['total_matches']} dans {searcher.stats['urls_with_matches']}/{total_urls} URLs"
+        )
+
+        self.logger.info(final_status)
+        self.logger.info(f"Dates sauvegardées dans {self.date_extractor.output_file}")
+        self.logger.info(f"Mots-clés sauvegardés dans {searcher.output_file}")
+
+        # Dernière mise à jour du callback de progression
+        if progress_callback:
+            progress_callback(total_urls, total_urls, final_status)
+
+        return {
+            "dates_file": self.date_extractor.output_file,
+            "dates_found": dates_found,
+            "output_file": searcher.output_file,
+            "stats_file": searcher.stats_file,
+            "stats": searcher.stats,
+            "temp_dir": searcher.temp_dir,
+        }
+
+
+if __name__ == "__main__":
+    print("=== ANALYSE COMBINÉE : DATES ET MOTS-CLÉS ===")
+    print(
+        "Ce script télécharge chaque page une seule fois pour en extraire la date de publication et y rechercher des mots-clés."
+    )
+
+    input_file = (
+        input("Fichier contenant les URLs (par défaut: urls.txt): ") or "urls.txt"
+    )
+    keywords_input = input("Mots-clés à rechercher (séparés par des virgules): ")
+    keywords = [k.strip() for k in keywords_input.split(",") if k.strip()]
+
+    case_sensitive = (
+        input("Respecter la casse? (o/n, par défaut: non): ").lower() == "o"
+    )
+
+    max_threads_input = input("Nombre de threads (par défaut: 10): ")
+    max_threads = int(max_threads_input) if max_threads_input.strip() else 10
+
+    try:
+        # Désactiver les avertissements SSL
+        import urllib3
+
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        analyzer = PageAnalyzer(
+            input_file, keywords, case_sensitive, max_threads=max_threads
+        )
+        result = analyzer.run()
+
+        if result:
+            print(f"\nAnalyse terminée avec succès!")
+            print(f"Dates enregistrées dans: {result['dates_file']}")
+            print(f"Mots-clés enregistrés dans: {result['output_file']}")
+
+    except KeyboardInterrupt:
+        print("\nAnalyse interrompue par l'utilisateur.")
+    except Exception as e:
+        print(f"\nUne erreur est survenue: {e}")
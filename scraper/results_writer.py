@@ -0,0 +1,121 @@
+"""
+Module contenant la classe StreamingCSVWriter pour écrire des résultats CSV au fil de l'eau.
+"""
+
+import os
+import csv
+import time
+import queue
+import threading
+
+# Marqueur de fin d'écriture
+_CLOSE = object()
+
+
+class StreamingCSVWriter:
+    def __init__(
+        self,
+        output_file,
+        fieldnames,
+        flush_count=100,
+        flush_interval=2.0,
+        queue_size=10000,
+    ):
+        """
+        Initialise l'écrivain CSV.
+
+        Les lignes sont déposées dans une file et écrites par un thread dédié,
+        qui vide le tampon du fichier dès que flush_count lignes sont en
+        attente ou que flush_interval secondes se sont écoulées. Les résultats
+        déjà produits restent ainsi sur disque en cas d'arrêt brutal, et la
+        mémoire utilisée ne dépend pas du nombre de lignes.
+
+        Args:
+            output_file (str): Fichier CSV de sortie
+            fieldnames (list): Colonnes du fichier
+            flush_count (int): Nombre de lignes écrites déclenchant un flush
+            flush_interval (float): Délai maximum en secondes avant flush
+            queue_size (int): Nombre maximum de lignes en attente d'écriture
+        """
+        self.output_file = output_file
+        self.fieldnames = fieldnames
+        self.flush_count = max(1, int(flush_count))
+        self.flush_interval = flush_interval
+
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.rows_written = 0
+        self.error = None
+        self._thread = None
+
+    def open(self):
+        """Crée le fichier (en-tête compris) et démarre le thread d'écriture"""
+        if self._thread is not None:
+            return
+
+        directory = os.path.dirname(self.output_file)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        csvfile = open(self.output_file, "w", newline="", encoding="utf-8")
+        writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
+        writer.writeheader()
+        csvfile.flush()
+
+        self._thread = threading.Thread(
+            target=self._run, args=(csvfile, writer), daemon=True
+        )
+        self._thread.start()
+
+    def write(self, row):
+        """Dépose une ligne (dict) dans la file d'écriture"""
+        self.queue.put(row)
+
+    def close(self):
+        """Écrit les lignes en attente, ferme le fichier et attend le thread"""
+        if self._thread is None:
+            return
+        self.queue.put(_CLOSE)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self, csvfile, writer):
+        pending = 0
+        last_flush = time.monotonic()
+        try:
+            while True:
+                try:
+                    row = self.queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    row = None
+
+                if row is _CLOSE:
+                    break
+
+                if row is not None and self.error is None:
+                    try:
+                        writer.writerow(row)
+                        self.rows_written += 1
+                        pending += 1
+                    except (OSError, ValueError) as e:
+                        # Continuer à vider la file pour ne pas bloquer les producteurs
+                        self.error = e
+
+                if pending and (
+                    pending >= self.flush_count
+                    or time.monotonic() - last_flush >= self.flush_interval
+                ):
+                    try:
+                        csvfile.flush()
+                    except OSError as e:
+                        self.error = e
+                    pending = 0
+                    last_flush = time.monotonic()
+        finally:
+            csvfile.close()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
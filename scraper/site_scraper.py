@@ -2,18 +2,51 @@
 Module contenant la classe SiteScraper pour explorer et récupérer les URLs d'un site web.
 """
 
-import os, re, time, random, requests, sys
-import queue  # Ajoutez cette ligne
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse, unquote
-from collections import deque
-import xml.etree.ElementTree as ET
+import os, time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, unquote
 import logging
 from utils.common_utils import extract_domain, ensure_data_directory
+from utils.host_scheduler import get_shared_scheduler
+from utils.http_client import (
+    MAX_PAGE_BYTES,
+    get_shared_client,
+    is_html_response,
+    read_page,
+)
+from utils.http_metadata import HttpMetadataStore
+from utils.page_cache import PageCache
+from utils.parse_pool import decode_content
+from scraper.crawl_frontier import CrawlFrontier
+from scraper.crawl_state import CrawlState
+from scraper.url_writer import BufferedURLWriter
+from scraper.link_extractor import extract_links, LINK_PARSERS
+from scraper.sitemap_ingester import SitemapIngester, SITEMAP_METADATA_FIELDNAMES
+from scraper.results_writer import StreamingCSVWriter
 
 
 class SiteScraper:
-    def __init__(self, url, output_file=None, max_urls=None):
+    def __init__(
+        self,
+        url,
+        output_file=None,
+        max_urls=None,
+        max_concurrency=1,
+        resume=False,
+        checkpoint_interval=30,
+        flush_count=100,
+        flush_interval=2.0,
+        log_interval=10,
+        link_parser="lxml",
+        revalidate=True,
+        page_cache=True,
+        http2=False,
+        max_page_bytes=MAX_PAGE_BYTES,
+        max_per_host=None,
+        requests_per_second=None,
+    ):
         """
         Initialise le scraper de site web avec une approche simplifiée.
 
@@ -21,6 +54,33 @@ class SiteScraper:
             url (str): URL de départ pour le scraping
             output_file (str, optional): Fichier où enregistrer les URLs trouvées
             max_urls (int, optional): Nombre maximum d'URLs à scraper (None = illimité)
+            max_concurrency (int, optional): Nombre de requêtes simultanées.
+                Au-delà de 1, le crawl utilise le moteur asyncio.
+            resume (bool, optional): Reprendre le crawl interrompu au dernier point
+                de sauvegarde au lieu de repartir de zéro
+            checkpoint_interval (float, optional): Intervalle en secondes entre
+                deux sauvegardes de l'état du crawl
+            flush_count (int, optional): Nombre d'URLs en attente avant écriture
+                dans le fichier de sortie
+            flush_interval (float, optional): Délai maximum en secondes avant
+                écriture des URLs en attente
+            log_interval (float, optional): Intervalle en secondes entre deux
+                messages de progression dans le journal
+            link_parser (str, optional): Parseur d'extraction des liens, "lxml"
+                (rapide) ou "html.parser" (BeautifulSoup)
+            revalidate (bool, optional): Envoyer des requêtes conditionnelles
+                (ETag / Last-Modified) et réutiliser les liens des pages inchangées
+            page_cache (bool, optional): Conserver les pages téléchargées dans le
+                cache disque partagé avec l'extracteur de dates et le chercheur
+                de mots-clés
+            http2 (bool, optional): Crawler en HTTP/2 (httpx) : les requêtes
+                simultanées vers le site partagent une connexion
+            max_page_bytes (int, optional): Octets lus au plus par page ; au-delà
+                les liens sont extraits de la page tronquée (0 pour tout lire)
+            max_per_host (int, optional): Requêtes simultanées vers le site
+                (par défaut le nombre de requêtes simultanées du crawl, au moins 4)
+            requests_per_second (float, optional): Débit maximum vers le site
+                (par défaut calculé à partir du nombre de requêtes simultanées)
         """
         self.start_url = url
 
@@ -54,15 +114,71 @@ class SiteScraper:
 
         # Initialiser les variables de base
         self.max_urls = max_urls
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+
+        # Client HTTP partagé : connexions keep-alive réutilisées entre les pages,
+        # pools dimensionnés pour le crawl et la lecture des sitemaps
+        self.http_client = get_shared_client(max(4, self.max_concurrency), http2=http2)
+        if link_parser not in LINK_PARSERS:
+            raise ValueError(
+                f"Parseur de liens inconnu: {link_parser} (choix: {', '.join(LINK_PARSERS)})"
+            )
+        self.link_parser = link_parser
         self.found_urls = set()  # URLs déjà trouvées et enregistrées
         self.visited_urls = set()  # URLs déjà visitées
-        self.to_visit = [
-            self.start_url
-        ]  # URLs à visiter (liste simple au lieu d'une queue)
+        self.to_visit = CrawlFrontier([self.start_url])  # URLs à visiter
+
+        # Écriture des URLs trouvées par lots
+        self.url_writer = BufferedURLWriter(
+            self.output_file, flush_count=flush_count, flush_interval=flush_interval
+        )
+        self.log_interval = log_interval
+        self._last_progress_log = time.monotonic()
+        self._last_progress_count = 0
+
+        # Métadonnées HTTP pour les recrawls (réponses 304)
+        self.http_metadata = (
+            HttpMetadataStore.for_directory(self.domain_dir) if revalidate else None
+        )
+        self.unchanged_pages = 0
+        self._unchanged_lock = threading.Lock()
+
+        # Cache disque des pages, relu par les modules suivants du pipeline
+        self.page_cache = (
+            PageCache.for_directory(self.domain_dir) if page_cache else None
+        )
+
+        # Budget d'octets par page, lu après vérification de Content-Type
+        self.max_page_bytes = max_page_bytes
+        self.truncated_pages = 0
+        self._truncated_lock = threading.Lock()
+
+        # Sauvegarde périodique de l'état pour pouvoir reprendre le crawl
+        self.resume = resume
+        self.checkpoint_interval = checkpoint_interval
+        state_name = os.path.splitext(os.path.basename(self.output_file))[0]
+        self.crawl_state = CrawlState(
+            os.path.join(self.domain_dir, f"{state_name}-crawl_state.sqlite")
+        )
+        self._pending_visited = []  # Visitées depuis la dernière sauvegarde
+        self._in_flight_urls = set()  # En cours de téléchargement
+        self._last_checkpoint = time.monotonic()
+
+        # <lastmod> et <changefreq> des sitemaps, à côté du fichier d'URLs
+        # (lus par DateExtractor en mode rapide)
+        self.sitemap_metadata_file = (
+            f"{os.path.splitext(self.output_file)[0]}-sitemap.csv"
+        )
 
         # Configuration du logger
         self.logger = self._setup_logger()
 
+        # Politesse par hôte partagée avec les autres modules, dimensionnée
+        # comme le client HTTP (crawl et lecture des sitemaps)
+        self.scheduler = get_shared_scheduler(
+            max(4, self.max_concurrency), max_per_host, requests_per_second
+        )
+
         # Liste des extensions à ignorer
         self.ignored_extensions = [
             "jpg",
@@ -159,20 +275,27 @@ class SiteScraper:
         except Exception:
             return False
 
-    def make_request(self, url):
-        """Effectue une requête HTTP simple avec gestion des erreurs"""
+    def make_request(self, url, stream=False, extra_headers=None):
+        """
+        Effectue une requête HTTP simple avec gestion des erreurs
+
+        Args:
+            url (str): URL à récupérer
+            stream (bool, optional): Ne pas télécharger le corps immédiatement
+            extra_headers (dict, optional): En-têtes supplémentaires (requêtes conditionnelles)
+        """
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
         }
+        if extra_headers:
+            headers.update(extra_headers)
 
         try:
-            response = requests.get(
+            response = self.scheduler.fetch(
                 url,
-                headers=headers,
-                verify=False,  # Désactive la vérification SSL pour simplifier
-                timeout=10,
+                lambda: self.http_client.get(url, headers=headers, stream=stream),
             )
             response.raise_for_status()
             return response
@@ -186,13 +309,12 @@ class SiteScraper:
         if url in self.found_urls:
             return False
 
-        # Ajouter l'URL au fichier
-        with open(self.output_file, "a", encoding="utf-8") as f:
-            f.write(url + "\n")
+        # Ajouter l'URL au fichier (écriture par lots)
+        self.url_writer.write(url)
 
         # Ajouter l'URL à l'ensemble
         self.found_urls.add(url)
-        self.logger.info(f"URL #{len(self.found_urls)} sauvegardée: {url}")
+        self.logger.debug(f"URL #{len(self.found_urls)} sauvegardée: {url}")
 
         # Vérifier si on a atteint le nombre maximum d'URLs
         if self.max_urls and len(self.found_urls) >= self.max_urls:
@@ -201,116 +323,52 @@ class SiteScraper:
 
     def extract_urls_from_html(self, html_content, base_url):
         """Extrait toutes les URLs d'une page HTML"""
-        soup = BeautifulSoup(html_content, "html.parser")
-        urls = set()
+        return extract_links(html_content, base_url, self.link_parser)
 
-        # Extraire les liens <a href>
-        for a_tag in soup.find_all("a", href=True):
-            urls.add(urljoin(base_url, a_tag["href"]))
+    def iter_sitemap_urls(self):
+        """
+        Génère les URLs des sitemaps du site au fur et à mesure de leur lecture.
 
-        # Extraire les liens de <link>
-        for link_tag in soup.find_all("link", href=True):
-            urls.add(urljoin(base_url, link_tag["href"]))
+        Yields:
+            str: URL normalisée et valide pour ce site
+        """
+        entries = self.iter_sitemap_entries()
+        try:
+            for entry in entries:
+                yield entry.loc
+        finally:
+            entries.close()
 
-        return urls
+    def iter_sitemap_entries(self):
+        """
+        Génère les entrées des sitemaps du site au fur et à mesure de leur lecture.
 
-    def extract_sitemap_urls(self):
-        """Extrait les URLs d'un sitemap de manière simplifiée"""
-        sitemap_urls = set()
-
-        # Sitemap standard
-        sitemap_url = f"{self.base_url}/sitemap.xml"
-        self.logger.info(f"Recherche du sitemap: {sitemap_url}")
-
-        response = self.make_request(sitemap_url)
-        if not response or response.status_code != 200:
-            self.logger.info(f"Sitemap non trouvé à {sitemap_url}")
-            # Vérifier robots.txt
-            robots_url = f"{self.base_url}/robots.txt"
-            response = self.make_request(robots_url)
-            if response and response.status_code == 200:
-                # Rechercher les lignes Sitemap: URL
-                sitemap_matches = re.findall(
-                    r"Sitemap:\s*(\S+)", response.text, re.IGNORECASE
-                )
-                if sitemap_matches:
-                    sitemap_url = sitemap_matches[0]
-                    self.logger.info(f"Sitemap trouvé via robots.txt: {sitemap_url}")
-                    response = self.make_request(sitemap_url)
-                else:
-                    return sitemap_urls
-            else:
-                return sitemap_urls
+        Toutes les entrées Sitemap: de robots.txt et /sitemap.xml sont lues, y
+        compris les index imbriqués et les fichiers .xml.gz.
 
-        if not response or response.status_code != 200:
-            return sitemap_urls
+        Yields:
+            SitemapEntry: Entrée dont l'URL est normalisée et valide pour ce site
+        """
+        self.logger.info(f"Recherche des sitemaps de {self.base_url}")
+        ingester = SitemapIngester(
+            self.base_url,
+            self.make_request,
+            max_workers=max(4, self.max_concurrency),
+            logger=self.logger,
+        )
 
-        # Parser le XML
+        entries = ingester.iter_entries()
         try:
-            root = ET.fromstring(response.content)
-
-            # Déterminer le namespace s'il existe
-            namespace = ""
-            if root.tag.startswith("{"):
-                namespace = root.tag.split("}")[0] + "}"
-
-            # Vérifier si c'est un sitemap index (contient d'autres sitemaps)
-            sitemaps = root.findall(".//" + namespace + "sitemap")
-            if sitemaps:
-                self.logger.info(f"Sitemap index trouvé avec {len(sitemaps)} sitemaps.")
-
-                # Récupérer les URLs de chaque sitemap référencé
-                for sitemap in sitemaps:
-                    loc = sitemap.find(namespace + "loc")
-                    if loc is not None and loc.text:
-                        sub_sitemap_url = loc.text.strip()
-                        self.logger.info(
-                            f"Traitement du sous-sitemap: {sub_sitemap_url}"
-                        )
-
-                        # Requête pour le sous-sitemap
-                        sub_response = self.make_request(sub_sitemap_url)
-                        if sub_response and sub_response.status_code == 200:
-                            try:
-                                sub_root = ET.fromstring(sub_response.content)
-
-                                # Extraire les URLs des éléments <url>
-                                for url_elem in sub_root.findall(
-                                    ".//" + namespace + "url//" + namespace + "loc"
-                                ) or sub_root.findall(".//url//loc"):
-                                    if url_elem.text:
-                                        url = url_elem.text.strip()
-                                        normalized_url = self.normalize_url(url)
-                                        if self.is_valid_url(normalized_url):
-                                            sitemap_urls.add(normalized_url)
-
-                                self.logger.info(
-                                    f"Extrait {len(sitemap_urls)} URLs du sous-sitemap {sub_sitemap_url}"
-                                )
-
-                            except ET.ParseError as e:
-                                self.logger.error(
-                                    f"Erreur de parsing du sous-sitemap {sub_sitemap_url}: {e}"
-                                )
-            else:
-                # C'est un sitemap standard
-                for url_elem in root.findall(
-                    ".//" + namespace + "url//" + namespace + "loc"
-                ) or root.findall(".//url//loc"):
-                    if url_elem.text:
-                        url = url_elem.text.strip()
-                        normalized_url = self.normalize_url(url)
-                        if self.is_valid_url(normalized_url):
-                            sitemap_urls.add(normalized_url)
+            for entry in entries:
+                normalized_url = self.normalize_url(entry.loc)
+                if self.is_valid_url(normalized_url):
+                    yield entry._replace(loc=normalized_url)
+        finally:
+            entries.close()
 
-                self.logger.info(
-                    f"Extrait {len(sitemap_urls)} URLs du sitemap {sitemap_url}"
-                )
-
-        except ET.ParseError as e:
-            self.logger.error(f"Erreur de parsing du sitemap {sitemap_url}: {e}")
-
-        return sitemap_urls
+    def extract_sitemap_urls(self):
+        """Extrait toutes les URLs des sitemaps du site"""
+        return set(self.iter_sitemap_urls())
 
     def scrape(self, progress_callback=None):
         """
@@ -319,45 +377,283 @@ class SiteScraper:
         Args:
             progress_callback (callable, optional): Fonction callback pour la progression
                 Signature: callback(current_progress, max_progress, status_message)
+                Si le callback renvoie True, le crawl est interrompu.
         """
         self.logger.info(f"Début du scraping pour {self.start_url}")
 
-        # Réinitialiser le fichier de sortie
-        with open(self.output_file, "w", encoding="utf-8") as f:
-            f.write("")
+        # Ouvrir les connexions vers le site (sitemaps, puis pages) d'avance
+        opened = self.http_client.prewarm(
+            self.start_url,
+            min(max(4, self.max_concurrency), self.scheduler.max_per_host),
+        )
+        if opened:
+            self.logger.info(f"{opened} connexions préchauffées vers {self.base_url}")
+
+        try:
+            if not (self.resume and self.restore_state()):
+                # Réinitialiser le fichier de sortie
+                self.url_writer.truncate()
+                self.crawl_state.reset(self.start_url)
 
-        # Extraire les URLs du sitemap en premier
+                # Extraire les URLs du sitemap en premier
+                if progress_callback:
+                    progress_callback(0, 1, "Recherche des URLs dans le sitemap...")
+
+                # Ajouter les URLs du sitemap au fur et à mesure de leur lecture,
+                # avec leur <lastmod> et <changefreq> dans un fichier à part
+                sitemap_writer = StreamingCSVWriter(
+                    self.sitemap_metadata_file, SITEMAP_METADATA_FIELDNAMES
+                )
+                with sitemap_writer:
+                    for entry in self.iter_sitemap_entries():
+                        normalized_url = entry.loc
+                        if normalized_url in self.found_urls:
+                            continue
+
+                        if progress_callback:
+                            progress_callback(
+                                len(self.found_urls),
+                                self.max_urls or 0,
+                                f"Enregistrement de l'URL du sitemap: {normalized_url[:50]}...",
+                            )
+
+                        if entry.lastmod or entry.changefreq:
+                            sitemap_writer.write(
+                                {
+                                    "url": normalized_url,
+                                    "lastmod": entry.lastmod,
+                                    "changefreq": entry.changefreq,
+                                }
+                            )
+
+                        if self.save_url(normalized_url):
+                            self.logger.info(
+                                "Limite d'URLs atteinte après traitement du sitemap."
+                            )
+                            return self.found_urls
+
+                        # Ajouter à la liste à visiter si pas déjà visitée
+                        if normalized_url not in self.visited_urls:
+                            self.to_visit.add(normalized_url)
+
+            try:
+                self.checkpoint()
+
+                if self.max_concurrency > 1:
+                    # Moteur asyncio avec plusieurs requêtes en vol
+                    asyncio.run(self._crawl_async(progress_callback))
+                else:
+                    self._crawl_sequential(progress_callback)
+            finally:
+                # Dernier point de sauvegarde, y compris en cas d'interruption
+                self.checkpoint()
+
+        finally:
+            # Écrire les URLs encore en attente, y compris en cas d'interruption
+            self.url_writer.close()
+            if self.http_metadata:
+                self.http_metadata.commit()
+            if self.page_cache:
+                self.page_cache.commit()
+
+        # Mise à jour finale
         if progress_callback:
-            progress_callback(0, 1, "Recherche des URLs dans le sitemap...")
+            progress_callback(
+                len(self.found_urls),
+                len(self.found_urls),
+                f"Terminé! {len(self.found_urls)} URLs trouvées",
+            )
+
+        self.logger.info(
+            f"Scraping terminé. {len(self.found_urls)} URLs trouvées et enregistrées dans {self.output_file}"
+        )
+        if self.unchanged_pages:
+            self.logger.info(
+                f"{self.unchanged_pages} pages inchangées depuis le dernier crawl (304)"
+            )
+        if self.truncated_pages:
+            self.logger.info(
+                f"{self.truncated_pages} pages tronquées à {self.max_page_bytes} octets"
+            )
+        http_stats = self.http_client.stats()
+        self.logger.info(
+            f"Connexions HTTP: {http_stats['new_connections']} ouvertes pour "
+            f"{http_stats['requests']} requêtes ({http_stats['reuse_rate']:.0%} réutilisées)"
+        )
+        return self.found_urls
+
+    def restore_state(self):
+        """
+        Restaure l'état du dernier crawl interrompu.
+
+        Returns:
+            bool: True si un crawl a été repris, False s'il n'y avait rien à reprendre
+        """
+        if not self.crawl_state.can_resume(self.start_url):
+            self.logger.info("Aucun crawl interrompu à reprendre, nouveau crawl")
+            return False
+
+        self.visited_urls, frontier = self.crawl_state.load()
+        self.to_visit = CrawlFrontier(frontier)
+
+        # Le fichier de sortie contient toutes les URLs déjà enregistrées
+        self.found_urls = set()
+        if os.path.exists(self.output_file):
+            with open(self.output_file, "r", encoding="utf-8") as f:
+                self.found_urls = {line.strip() for line in f if line.strip()}
+
+        self.logger.info(
+            f"Reprise du crawl: {len(self.found_urls)} URLs trouvées, {len(self.visited_urls)} visitées, {len(self.to_visit)} à visiter"
+        )
+        return True
+
+    def checkpoint(self):
+        """Sauvegarde l'état du crawl sur disque"""
+        # Le fichier de sortie doit être à jour : il fait foi lors d'une reprise
+        self.url_writer.flush()
+
+        # Les URLs en cours de téléchargement restent à visiter lors d'une reprise
+        visited = []
+        pending = []
+        for url in self._pending_visited:
+            if url in self._in_flight_urls:
+                pending.append(url)
+            else:
+                visited.append(url)
+
+        frontier = list(self._in_flight_urls) + list(self.to_visit)
+        self.crawl_state.checkpoint(visited, frontier)
+
+        self._pending_visited = pending
+        self._last_checkpoint = time.monotonic()
+
+    def _maybe_checkpoint(self):
+        """Sauvegarde l'état si l'intervalle de sauvegarde est écoulé"""
+        if time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
 
-        sitemap_urls = self.extract_sitemap_urls()
+    def _mark_visited(self, url):
+        """Marque une URL comme visitée et en cours de téléchargement"""
+        self.visited_urls.add(url)
+        self._pending_visited.append(url)
+        self._in_flight_urls.add(url)
 
-        # Ajouter les URLs trouvées dans le sitemap
-        for url in sitemap_urls:
+    def fetch_page_links(self, url):
+        """
+        Récupère une page et en extrait les liens.
+
+        Returns:
+            set | None: URLs trouvées dans la page (vide si ce n'est pas du HTML),
+                None si la requête ou le traitement de la page a échoué
+        """
+        try:
+            return self._fetch_page_links(url)
+        except Exception as e:
+            # Lecture interrompue, cache ou métadonnées indisponibles : seule
+            # cette page est comptée en échec, le crawl continue
+            self.logger.error(f"Erreur lors du traitement de {url}: {e}")
+            return None
+
+    def _fetch_page_links(self, url):
+        """Corps de fetch_page_links, dont les exceptions ne sont pas interceptées"""
+        conditional_headers = (
+            self.http_metadata.conditional_headers(url) if self.http_metadata else None
+        )
+        # Corps lu seulement après vérification de Content-Type
+        response = self.make_request(
+            url, stream=True, extra_headers=conditional_headers
+        )
+        if not response:
+            return None
+
+        if response.status_code == 304:
+            # Réponse sans corps : libérer la connexion dans tous les cas
+            response.close()
+
+            # Page inchangée : réutiliser les liens extraits lors du dernier crawl
+            links = self.http_metadata.get_payload(url, "links")
+            if links is not None:
+                with self._unchanged_lock:
+                    self.unchanged_pages += 1
+                if self.page_cache:
+                    self.page_cache.touch(url)
+                return set(links)
+
+            response = self.make_request(url, stream=True)
+            if not response:
+                return None
+
+        # Vérifier si c'est une page HTML avant d'en télécharger le corps
+        content_type = response.headers.get("Content-Type", "")
+        if not is_html_response(response):
+            response.close()
+            if self.page_cache:
+                self.page_cache.put(url, b"", content_type)
+            return set()
+
+        page = read_page(response, self.max_page_bytes)
+        if page.truncated:
+            # Page tronquée : liens extraits, mais pas mise en cache, et
+            # l'ancienne copie éventuelle n'est plus à jour
+            with self._truncated_lock:
+                self.truncated_pages += 1
+            if self.page_cache:
+                self.page_cache.discard(url)
+        elif self.page_cache:
+            self.page_cache.put(url, page.content, content_type, page.encoding)
+
+        links = self.extract_urls_from_html(
+            decode_content(page.content, page.encoding), url
+        )
+
+        if self.http_metadata:
+            self.http_metadata.record(url, response)
+            self.http_metadata.set_payload(url, "links", sorted(links))
+
+        return links
+
+    def enqueue_links(self, page_urls):
+        """Ajoute les nouvelles URLs valides à la liste à visiter"""
+        for url in page_urls:
             normalized_url = self.normalize_url(url)
-            if normalized_url not in self.found_urls:
-                if progress_callback:
-                    progress_callback(
-                        len(self.found_urls),
-                        self.max_urls or len(sitemap_urls),
-                        f"Enregistrement de l'URL du sitemap: {normalized_url[:50]}...",
-                    )
+            if (
+                self.is_valid_url(normalized_url)
+                and normalized_url not in self.visited_urls
+            ):
+                self.to_visit.add(normalized_url)
 
-                if self.save_url(normalized_url):
-                    self.logger.info(
-                        "Limite d'URLs atteinte après traitement du sitemap."
-                    )
-                    return self.found_urls
+    def _log_progress(self, progress_callback, current_url):
+        """
+        Journalise périodiquement la progression et appelle le callback.
 
-                # Ajouter à la liste à visiter si pas déjà visitée
-                if (
-                    normalized_url not in self.visited_urls
-                    and normalized_url not in self.to_visit
-                ):
-                    self.to_visit.append(normalized_url)
+        Returns:
+            bool: True si le callback demande l'interruption du crawl
+        """
+        now = time.monotonic()
+        elapsed = now - self._last_progress_log
+        if elapsed >= self.log_interval:
+            rate = (len(self.found_urls) - self._last_progress_count) / elapsed
+            self.logger.info(
+                f"Progression: {len(self.found_urls)} URLs trouvées ({rate:.1f}/s), {len(self.visited_urls)} visitées, {len(self.to_visit)} à visiter"
+            )
+            self._last_progress_log = now
+            self._last_progress_count = len(self.found_urls)
 
-        # Traiter les URLs une par une avec une simple boucle
+        if progress_callback:
+            return bool(
+                progress_callback(
+                    len(self.found_urls),
+                    self.max_urls or 0,
+                    f"Visite de {current_url[:50]}... ({len(self.found_urls)} trouvées)",
+                )
+            )
+        return False
+
+    def _crawl_sequential(self, progress_callback=None):
+        """Traite les URLs une par une avec une simple boucle"""
         while self.to_visit:
+            self._maybe_checkpoint()
+
             # Vérifier si on a atteint la limite
             if self.max_urls and len(self.found_urls) >= self.max_urls:
                 self.logger.info(
@@ -366,34 +662,24 @@ class SiteScraper:
                 break
 
             # Prendre la première URL à visiter
-            current_url = self.to_visit.pop(0)
+            current_url = self.to_visit.pop()
 
             # Vérifier si déjà visitée
             if current_url in self.visited_urls:
                 continue
 
-            # Marquer comme visitée
-            self.visited_urls.add(current_url)
-
-            # Log et mise à jour de progression
-            if len(self.visited_urls) % 10 == 0:
-                self.logger.info(
-                    f"Progression: {len(self.found_urls)} URLs trouvées, {len(self.visited_urls)} visitées, {len(self.to_visit)} à visiter"
-                )
-
-            if progress_callback:
-                progress_callback(
-                    len(self.found_urls),
-                    self.max_urls or 0,
-                    f"Visite de {current_url[:50]}... ({len(self.found_urls)} trouvées)",
-                )
+            if self._log_progress(progress_callback, current_url):
+                self.logger.info("Interruption demandée.")
+                self.to_visit.add(current_url)
+                break
 
-            # Faire une pause pour ne pas surcharger le serveur
-            time.sleep(random.uniform(0.2, 0.5))
+            # Marquer comme visitée
+            self._mark_visited(current_url)
 
             # Récupérer le contenu de la page
-            response = self.make_request(current_url)
-            if not response:
+            page_urls = self.fetch_page_links(current_url)
+            self._in_flight_urls.discard(current_url)
+            if page_urls is None:
                 continue
 
             # Enregistrer l'URL si pas déjà fait
@@ -402,33 +688,71 @@ class SiteScraper:
                     self.logger.info("Limite d'URLs atteinte.")
                     break
 
-            # Vérifier si c'est une page HTML
-            content_type = response.headers.get("Content-Type", "").lower()
-            if "text/html" not in content_type:
-                continue
-
-            # Extraire les URLs de la page
-            page_urls = self.extract_urls_from_html(response.text, current_url)
+            self.enqueue_links(page_urls)
 
-            # Ajouter les nouvelles URLs à la liste à visiter
-            for url in page_urls:
-                normalized_url = self.normalize_url(url)
-                if (
-                    self.is_valid_url(normalized_url)
-                    and normalized_url not in self.visited_urls
-                    and normalized_url not in self.to_visit
-                ):
-                    self.to_visit.append(normalized_url)
+    async def _crawl_async(self, progress_callback=None):
+        """
+        Explore le site avec plusieurs requêtes en vol.
 
-        # Mise à jour finale
-        if progress_callback:
-            progress_callback(
-                len(self.found_urls),
-                len(self.found_urls),
-                f"Terminé! {len(self.found_urls)} URLs trouvées",
-            )
+        Les requêtes bloquantes sont exécutées dans un pool de threads dimensionné
+        sur max_concurrency, tandis que la boucle asyncio garde seule la main sur
+        l'état du crawl (URLs visitées, trouvées et à visiter) : save_url et
+        progress_callback sont donc toujours appelés depuis le même thread.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency)
+        in_flight = {}
 
         self.logger.info(
-            f"Scraping terminé. {len(self.found_urls)} URLs trouvées et enregistrées dans {self.output_file}"
+            f"Crawl asynchrone avec {self.max_concurrency} requêtes simultanées"
         )
-        return self.found_urls
+
+        try:
+            while self.to_visit or in_flight:
+                # Remplir la fenêtre de requêtes en vol
+                while self.to_visit and len(in_flight) < self.max_concurrency:
+                    current_url = self.to_visit.pop()
+                    if current_url in self.visited_urls:
+                        continue
+
+                    if self._log_progress(progress_callback, current_url):
+                        self.logger.info("Interruption demandée.")
+                        self.to_visit.add(current_url)
+                        return
+
+                    self._mark_visited(current_url)
+
+                    task = loop.run_in_executor(
+                        executor, self.fetch_page_links, current_url
+                    )
+                    in_flight[task] = current_url
+
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    current_url = in_flight.pop(task)
+                    page_urls = task.result()
+                    self._in_flight_urls.discard(current_url)
+                    if page_urls is None:
+                        continue
+
+                    # Enregistrer l'URL si pas déjà fait
+                    if current_url not in self.found_urls:
+                        if self.save_url(current_url):
+                            self.logger.info("Limite d'URLs atteinte.")
+                            return
+
+                    self.enqueue_links(page_urls)
+
+                self._maybe_checkpoint()
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Attendre les pages en cours de traitement : scrape() ferme ensuite
+            # le fichier d'URLs, le cache et les métadonnées qu'elles utilisent
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,230 @@
+"""
+Module contenant la classe SitemapIngester pour lire les sitemaps d'un site en flux.
+"""
+
+import io
+import re
+import gzip
+import queue
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Signature des fichiers gzip (.xml.gz servis sans Content-Encoding)
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Marqueur de fin de traitement d'un sitemap
+_DONE = object()
+
+# Entrée <url> d'un sitemap : adresse, <lastmod> et <changefreq> (None si absents)
+SitemapEntry = namedtuple("SitemapEntry", ["loc", "lastmod", "changefreq"])
+
+# Colonnes du fichier des métadonnées de sitemap enregistré à côté des URLs
+SITEMAP_METADATA_FIELDNAMES = ["url", "lastmod", "changefreq"]
+
+
+class _Stopped(Exception):
+    """Levée dans les workers quand le consommateur a cessé de lire"""
+
+
+class SitemapIngester:
+    def __init__(self, base_url, fetch, max_workers=4, queue_size=10000, logger=None):
+        """
+        Initialise le lecteur de sitemaps.
+
+        Args:
+            base_url (str): URL racine du site (schéma + domaine)
+            fetch (callable): Fonction fetch(url, stream=False) renvoyant une
+                réponse requests ou None en cas d'échec
+            max_workers (int): Nombre de sitemaps téléchargés en parallèle
+            queue_size (int): Nombre maximum d'URLs en attente de lecture
+            logger (logging.Logger, optional): Logger à utiliser
+        """
+        self.base_url = base_url.rstrip("/")
+        self.fetch = fetch
+        self.max_workers = max(1, int(max_workers))
+        self.queue_size = queue_size
+        self.logger = logger or logging.getLogger("SitemapIngester")
+
+    def discover_sitemaps(self):
+        """
+        Liste les sitemaps racines : toutes les entrées Sitemap: de robots.txt
+        ainsi que l'emplacement standard /sitemap.xml.
+        """
+        sitemaps = []
+
+        response = self.fetch(f"{self.base_url}/robots.txt")
+        if response is not None and response.status_code == 200:
+            for sitemap_url in re.findall(
+                r"^\s*Sitemap:\s*(\S+)", response.text, re.IGNORECASE | re.MULTILINE
+            ):
+                if sitemap_url not in sitemaps:
+                    sitemaps.append(sitemap_url)
+            if sitemaps:
+                self.logger.info(f"{len(sitemaps)} sitemap(s) trouvé(s) via robots.txt")
+
+        default_sitemap = f"{self.base_url}/sitemap.xml"
+        if default_sitemap not in sitemaps:
+            sitemaps.append(default_sitemap)
+
+        return sitemaps
+
+    def iter_urls(self, sitemap_urls=None):
+        """
+        Génère les URLs des sitemaps au fur et à mesure de leur lecture.
+
+        Args:
+            sitemap_urls (list, optional): Sitemaps racines (découverts si None)
+
+        Yields:
+            str: URL trouvée dans un élément <url><loc>
+        """
+        entries = self.iter_entries(sitemap_urls)
+        try:
+            for entry in entries:
+                yield entry.loc
+        finally:
+            entries.close()
+
+    def iter_entries(self, sitemap_urls=None):
+        """
+        Génère les entrées des sitemaps au fur et à mesure de leur lecture.
+
+        Les sous-sitemaps des index (y compris imbriqués) sont téléchargés en
+        parallèle ; chaque document est lu en flux avec iterparse, sans être
+        chargé entièrement en mémoire.
+
+        Args:
+            sitemap_urls (list, optional): Sitemaps racines (découverts si None)
+
+        Yields:
+            SitemapEntry: Entrée <url> avec son <lastmod> et son <changefreq>
+        """
+        if sitemap_urls is None:
+            sitemap_urls = self.discover_sitemaps()
+
+        results = queue.Queue(maxsize=self.queue_size)
+        stop_event = threading.Event()
+        seen = set()
+        pending = [0]
+        lock = threading.Lock()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def put(item):
+            while True:
+                if stop_event.is_set():
+                    raise _Stopped()
+                try:
+                    results.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def submit(sitemap_url):
+            with lock:
+                if sitemap_url in seen or stop_event.is_set():
+                    return
+                seen.add(sitemap_url)
+                pending[0] += 1
+            try:
+                executor.submit(worker, sitemap_url)
+            except RuntimeError:
+                # Le pool a été arrêté : le consommateur a cessé de lire
+                pass
+
+        def worker(sitemap_url):
+            try:
+                count = self._parse_sitemap(sitemap_url, put, submit)
+                if count:
+                    self.logger.info(f"Extrait {count} URLs du sitemap {sitemap_url}")
+            except _Stopped:
+                return
+            except Exception as e:
+                self.logger.error(f"Erreur de lecture du sitemap {sitemap_url}: {e}")
+            try:
+                put(_DONE)
+            except _Stopped:
+                pass
+
+        try:
+            for sitemap_url in sitemap_urls:
+                submit(sitemap_url)
+
+            while True:
+                with lock:
+                    if pending[0] == 0:
+                        break
+                item = results.get()
+                if item is _DONE:
+                    with lock:
+                        pending[0] -= 1
+                else:
+                    yield item
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _parse_sitemap(self, sitemap_url, on_url, on_sitemap):
+        """
+        Lit un sitemap en flux.
+
+        Args:
+            sitemap_url (str): URL du sitemap
+            on_url (callable): Appelée avec la SitemapEntry de chaque page trouvée
+            on_sitemap (callable): Appelée pour chaque sous-sitemap d'un index
+
+        Returns:
+            int: Nombre d'URLs de pages trouvées
+        """
+        response = self.fetch(sitemap_url, stream=True)
+        if response is None or response.status_code != 200:
+            self.logger.info(f"Sitemap non trouvé à {sitemap_url}")
+            return 0
+
+        count = 0
+        try:
+            # Décompresser le Content-Encoding éventuel, puis détecter les .xml.gz
+            response.raw.decode_content = True
+            # Laisser le flux ouvert en fin de lecture pour le tampon io
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw)
+            if stream.peek(2)[:2] == GZIP_MAGIC:
+                stream = gzip.GzipFile(fileobj=stream)
+
+            root = None
+            for event, elem in ET.iterparse(stream, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    continue
+
+                tag = elem.tag.rsplit("}", 1)[-1]
+                if tag not in ("url", "sitemap"):
+                    continue
+
+                fields = {}
+                for child in elem:
+                    name = child.tag.rsplit("}", 1)[-1]
+                    if name in ("loc", "lastmod", "changefreq") and child.text:
+                        fields[name] = child.text.strip()
+
+                loc = fields.get("loc")
+                if loc:
+                    if tag == "url":
+                        on_url(
+                            SitemapEntry(
+                                loc, fields.get("lastmod"), fields.get("changefreq")
+                            )
+                        )
+                        count += 1
+                    else:
+                        on_sitemap(loc)
+
+                # Libérer les éléments déjà traités
+                root.clear()
+        finally:
+            response.close()
+
+        return count
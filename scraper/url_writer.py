@@ -0,0 +1,90 @@
+"""
+Module contenant la classe BufferedURLWriter pour écrire les URLs trouvées par lots.
+"""
+
+import os
+import time
+import threading
+
+
+class BufferedURLWriter:
+    def __init__(self, output_file, flush_count=100, flush_interval=2.0):
+        """
+        Initialise l'écrivain d'URLs.
+
+        Le fichier reste ouvert en mode ajout et les URLs sont écrites par lots,
+        dès que flush_count URLs sont en attente ou que flush_interval secondes
+        se sont écoulées depuis la dernière écriture.
+
+        Args:
+            output_file (str): Fichier de sortie
+            flush_count (int): Nombre d'URLs en attente déclenchant une écriture
+            flush_interval (float): Délai maximum en secondes avant écriture
+        """
+        self.output_file = output_file
+        self.flush_count = max(1, int(flush_count))
+        self.flush_interval = flush_interval
+
+        self.buffer = []
+        self.written = 0
+        self.lock = threading.Lock()
+        self._file = None
+        self._last_flush = time.monotonic()
+
+    def truncate(self):
+        """Vide le fichier de sortie et le tampon"""
+        with self.lock:
+            self.buffer = []
+            self._close_file()
+            with open(self.output_file, "w", encoding="utf-8") as f:
+                f.write("")
+            self.written = 0
+            self._last_flush = time.monotonic()
+
+    def write(self, url):
+        """Ajoute une URL au tampon et l'écrit si un seuil est atteint"""
+        with self.lock:
+            self.buffer.append(url)
+            if (
+                len(self.buffer) >= self.flush_count
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush()
+
+    def flush(self):
+        """Écrit immédiatement les URLs en attente"""
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        """Écrit les URLs en attente et ferme le fichier"""
+        with self.lock:
+            self._flush()
+            self._close_file()
+
+    def _flush(self):
+        self._last_flush = time.monotonic()
+        if not self.buffer:
+            return
+
+        if self._file is None:
+            directory = os.path.dirname(self.output_file)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            self._file = open(self.output_file, "a", encoding="utf-8")
+
+        self._file.write("\n".join(self.buffer) + "\n")
+        self._file.flush()
+        self.written += len(self.buffer)
+        self.buffer = []
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,53 @@
+"""
+Tests du DateScanner : formats reconnus et mots ordinaires à ne pas prendre
+pour des mois.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.date_scanner import DateScanner
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return DateScanner()
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Publié le 2024-01-02", "2024-01-02"),
+        ("Publié le 02/01/2024", "2024-01-02"),
+        ("20240102", "2024-01-02"),
+        ("12 janvier 2024", "2024-01-12"),
+        ("1er févr. 2023", "2023-02-01"),
+        ("lundi 3 août 2022", "2022-08-03"),
+        ("5 déc. 2020", "2020-12-05"),
+        ("12 Décembre 2023", "2023-12-12"),
+        ("March 5, 2024", "2024-03-05"),
+        ("Sept. 3, 2021", "2021-09-03"),
+        ("Jan. 2, 2024", "2024-01-02"),
+        ("5 Dec 2020", "2020-12-05"),
+    ],
+)
+def test_recognized_formats(scanner, text, expected):
+    assert scanner.first(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "summary 5, 2024",
+        "Decision 12 2023",
+        "marathon 10 2021",
+        "le 12 mainly 2024",
+        "page 12 decoration 2021",
+    ],
+)
+def test_ordinary_words_are_not_months(scanner, text):
+    assert scanner.scan(text) == []
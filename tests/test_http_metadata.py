@@ -0,0 +1,65 @@
+"""
+Tests du HttpMetadataStore : un changement de validateurs invalide les
+résultats stockés par les autres modules.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.http_metadata import HttpMetadataStore
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = HttpMetadataStore(str(tmp_path / "http_metadata.sqlite"))
+    yield store
+    store.close()
+
+
+URL = "https://example.com/page"
+
+
+def test_same_validators_keep_other_payloads(store):
+    store.record(URL, FakeResponse({"ETag": '"v1"'}))
+    store.set_payload(URL, "links", ["https://example.com/a"])
+
+    store.record(URL, FakeResponse({"ETag": '"v1"'}))
+    store.set_payload(URL, "date", {"date": "2024-01-02", "status": "found"})
+
+    assert store.get_payload(URL, "links") == ["https://example.com/a"]
+
+
+def test_new_validators_drop_other_payloads(store):
+    store.record(URL, FakeResponse({"ETag": '"v1"'}))
+    store.set_payload(URL, "links", ["https://example.com/a"])
+
+    # Le module de dates reçoit une nouvelle version de la page
+    store.record(URL, FakeResponse({"ETag": '"v2"'}))
+    store.set_payload(URL, "date", {"date": "2024-01-02", "status": "found"})
+
+    # Le prochain crawl enverra If-None-Match: v2 et recevra un 304 :
+    # les liens extraits de la v1 ne doivent pas être réutilisés
+    assert store.conditional_headers(URL) == {"If-None-Match": '"v2"'}
+    assert store.get_payload(URL, "links") is None
+    assert store.get_payload(URL, "date") == {
+        "date": "2024-01-02",
+        "status": "found",
+    }
+
+
+def test_new_last_modified_drops_other_payloads(store):
+    store.record(URL, FakeResponse({"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}))
+    store.set_payload(URL, "links", [])
+
+    store.record(URL, FakeResponse({"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}))
+
+    assert store.get_payload(URL, "links") is None
@@ -0,0 +1,49 @@
+"""
+Tests du KeywordSearcher : mise en évidence des occurrences dans les contextes.
+"""
+
+import os
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scraper.keyword_searcher import KeywordSearcher
+
+
+def make_searcher(tmp_path, keywords, **kwargs):
+    input_file = tmp_path / "urls.txt"
+    input_file.write_text("https://example.com/\n", encoding="utf-8")
+    return KeywordSearcher(
+        str(input_file),
+        keywords,
+        temp_dir=str(tmp_path),
+        revalidate=False,
+        use_page_cache=False,
+        **kwargs,
+    )
+
+
+def search(searcher, text):
+    soup = BeautifulSoup(f"<html><body><p>{text}</p></body></html>", "html.parser")
+    return searcher.search_keywords_in_soup(soup, "https://example.com/")
+
+
+def test_whole_word_highlights_only_the_match(tmp_path):
+    searcher = make_searcher(tmp_path, ["art"], whole_word=True)
+    results = search(searcher, "Cet article parle d'art moderne.")
+
+    assert results[0]["matches"] == 1
+    assert results[0]["contexts"] == ["Cet article parle d'**art** moderne."]
+
+
+def test_each_context_highlights_its_own_occurrence(tmp_path):
+    searcher = make_searcher(tmp_path, ["prix"])
+    results = search(searcher, "prix bas, prix haut")
+
+    assert results[0]["contexts"] == [
+        "**prix** bas, prix haut",
+        "prix bas, **prix** haut",
+    ]
@@ -0,0 +1,37 @@
+"""
+Tests du PageCache : une page oubliée n'est plus servie.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Ajouter le répertoire racine du projet au chemin Python
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.page_cache import PageCache
+
+URL = "https://example.com/page"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PageCache(str(tmp_path / "page_cache"))
+
+
+def test_discard_forgets_page(cache):
+    cache.put(URL, b"<html>v1</html>", "text/html", "utf-8")
+    assert cache.get(URL).content == b"<html>v1</html>"
+
+    # Page retéléchargée et tronquée : l'ancienne copie ne doit plus être servie
+    cache.discard(URL)
+    assert cache.get(URL) is None
+
+
+def test_discard_keeps_shared_content(cache):
+    other = "https://example.com/other"
+    cache.put(URL, b"<html>same</html>", "text/html", "utf-8")
+    cache.put(other, b"<html>same</html>", "text/html", "utf-8")
+
+    cache.discard(URL)
+    assert cache.get(other).content == b"<html>same</html>"
@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from scraper.site_scraper import SiteScraper
 from scraper.date_extractor import DateExtractor
+from scraper.page_analyzer import PageAnalyzer
 from organizer.date_organizer import URLDateOrganizer
 from organizer.csv_exporter import URLToCSVExporter, MultiYearURLExporter
 from scraper.keyword_searcher import KeywordSearcher
@@ -645,6 +646,8 @@ class ModernWebScraperApp:
         self.scraper_url = tk.StringVar(value="https://example.com")
         self.scraper_output_file = tk.StringVar(value="urls.txt")
         self.scraper_max_urls = tk.StringVar(value="")
+        self.scraper_concurrency = tk.StringVar(value="1")
+        self.scraper_resume = tk.BooleanVar(value=False)
 
         # Conteneur principal
         main_frame = ttk.Frame(frame, style="TFrame")
@@ -682,6 +685,37 @@ class ModernWebScraperApp:
         )
         max_urls_field.pack(fill="x", pady=10)
 
+        concurrency_field = self.create_field(
+            params_card,
+            "Requêtes simultanées:",
+            self.scraper_concurrency,
+            None,
+            tooltip="1 = exploration page par page. Au-delà, plusieurs pages sont téléchargées en parallèle.",
+        )
+        concurrency_field.pack(fill="x", pady=10)
+
+        # Option de reprise
+        resume_frame = ttk.Frame(params_card, style="Field.TFrame")
+        resume_frame.pack(fill="x", pady=10)
+
+        resume_label = ttk.Label(
+            resume_frame,
+            text="Reprendre le crawl interrompu:",
+            style="Normal.TLabel",
+            width=25,
+            anchor="w",
+        )
+        resume_label.pack(side="left", padx=(0, 10))
+
+        resume_check = ttk.Checkbutton(
+            resume_frame, variable=self.scraper_resume, style="TCheckbutton"
+        )
+        resume_check.pack(side="left")
+        ToolTip(
+            resume_check,
+            "Si coché, le scraping reprend là où il s'était arrêté au lieu de repartir de zéro",
+        )
+
         # Bouton de démarrage
         button_frame = ttk.Frame(params_card, style="TFrame")
         button_frame.pack(fill="x", pady=(20, 10))
@@ -1201,6 +1235,9 @@ class ModernWebScraperApp:
         self.date_input_file = tk.StringVar(value="")
         self.date_output_file = tk.StringVar(value="")
         self.date_max_threads = tk.StringVar(value="10")
+        self.date_cheap_mode = tk.BooleanVar(value=False)
+        self.date_keywords = tk.StringVar(value="")
+        self.date_cache_max_age = tk.StringVar(value="")
 
         # Conteneur principal
         main_frame = ttk.Frame(frame, style="TFrame")
@@ -1238,6 +1275,52 @@ class ModernWebScraperApp:
         )
         threads_field.pack(fill="x", pady=10)
 
+        cache_age_field = self.create_field(
+            params_card,
+            "Âge max. du cache (heures):",
+            self.date_cache_max_age,
+            None,
+            tooltip="Les pages du cache plus anciennes sont retéléchargées. "
+            "Laisser vide pour réutiliser le cache quel que soit son âge.",
+        )
+        cache_age_field.pack(fill="x", pady=10)
+
+        keywords_field = self.create_field(
+            params_card,
+            "Mots-clés (optionnel):",
+            self.date_keywords,
+            None,
+            tooltip="Mots-clés séparés par des virgules : chaque page est téléchargée "
+            "une seule fois pour les dates et les mots-clés (analyse combinée).",
+        )
+        keywords_field.pack(fill="x", pady=10)
+
+        # Mode rapide
+        cheap_frame = ttk.Frame(params_card, style="Field.TFrame")
+        cheap_frame.pack(fill="x", pady=10)
+
+        cheap_label = ttk.Label(
+            cheap_frame,
+            text="Sources:",
+            style="Normal.TLabel",
+            width=25,
+            anchor="w",
+        )
+        cheap_label.pack(side="left", padx=(0, 10))
+
+        cheap_check = ttk.Checkbutton(
+            cheap_frame,
+            text="Mode rapide",
+            variable=self.date_cheap_mode,
+            style="TCheckbutton",
+        )
+        cheap_check.pack(side="left", padx=(0, 15))
+        ToolTip(
+            cheap_check,
+            "Si coché, les dates sont d'abord lues dans le sitemap, l'URL et "
+            "l'en-tête Last-Modified ; seules les pages restées sans date sont téléchargées",
+        )
+
         # Bouton de démarrage
         button_frame = ttk.Frame(params_card, style="TFrame")
         button_frame.pack(fill="x", pady=(20, 10))
@@ -1550,7 +1633,11 @@ class ModernWebScraperApp:
         self.keywords_search_terms = tk.StringVar(value="")
         # Ajouter cette ligne qui manque :
         self.keywords_case_sensitive = tk.BooleanVar(value=False)
+        self.keywords_whole_word = tk.BooleanVar(value=False)
+        self.keywords_fold_accents = tk.BooleanVar(value=False)
+        self.keywords_stemming = tk.BooleanVar(value=False)
         self.keywords_max_threads = tk.StringVar(value="10")
+        self.keywords_cache_max_age = tk.StringVar(value="")
 
         # Conteneur principal
         main_frame = ttk.Frame(frame, style="TFrame")
@@ -1579,6 +1666,42 @@ class ModernWebScraperApp:
         )
         keywords_field.pack(fill="x", pady=10)
 
+        # Modes de correspondance
+        match_frame = ttk.Frame(params_card, style="Field.TFrame")
+        match_frame.pack(fill="x", pady=10)
+
+        match_label = ttk.Label(
+            match_frame,
+            text="Correspondance:",
+            style="Normal.TLabel",
+            width=25,
+            anchor="w",
+        )
+        match_label.pack(side="left", padx=(0, 10))
+
+        for text, variable, tooltip in (
+            (
+                "Mots entiers",
+                self.keywords_whole_word,
+                'Si coché, "prix" ne trouve pas "prixfixe"',
+            ),
+            (
+                "Ignorer les accents",
+                self.keywords_fold_accents,
+                'Si coché, "publie" trouve aussi "publié"',
+            ),
+            (
+                "Pluriels et féminins",
+                self.keywords_stemming,
+                'Si coché, "publié" trouve aussi "publiée" et "publiés" (mots entiers)',
+            ),
+        ):
+            match_check = ttk.Checkbutton(
+                match_frame, text=text, variable=variable, style="TCheckbutton"
+            )
+            match_check.pack(side="left", padx=(0, 15))
+            ToolTip(match_check, tooltip)
+
         output_field = self.create_field(
             params_card,
             "Fichier de sortie (CSV):",
@@ -1597,6 +1720,16 @@ class ModernWebScraperApp:
         )
         threads_field.pack(fill="x", pady=10)
 
+        cache_age_field = self.create_field(
+            params_card,
+            "Âge max. du cache (heures):",
+            self.keywords_cache_max_age,
+            None,
+            tooltip="Les pages du cache plus anciennes sont retéléchargées. "
+            "Laisser vide pour réutiliser le cache quel que soit son âge.",
+        )
+        cache_age_field.pack(fill="x", pady=10)
+
         # Bouton de démarrage
         button_frame = ttk.Frame(params_card, style="TFrame")
         button_frame.pack(fill="x", pady=(20, 10))
@@ -1920,6 +2053,12 @@ class ModernWebScraperApp:
             messagebox.showerror("Erreur", f"Nombre de threads invalide: {str(e)}")
             return
 
+        try:
+            cache_max_age = self._parse_cache_max_age(self.keywords_cache_max_age.get())
+        except ValueError as e:
+            messagebox.showerror("Erreur", f"Âge du cache invalide: {str(e)}")
+            return
+
         # Utiliser le fichier d'entrée pour déterminer le fichier de sortie par défaut si non spécifié
         if not output_file:
             output_file = f"{os.path.splitext(input_file)[0]}-keywords.csv"
@@ -1949,12 +2088,14 @@ class ModernWebScraperApp:
         # Démarrer la recherche dans un thread séparé
         self.current_process = threading.Thread(
             target=self._run_keywords_search,
-            args=(input_file, output_file, keywords, max_threads),
+            args=(input_file, output_file, keywords, max_threads, cache_max_age),
         )
         self.current_process.daemon = True
         self.current_process.start()
 
-    def _run_keywords_search(self, input_file, output_file, keywords, max_threads):
+    def _run_keywords_search(
+        self, input_file, output_file, keywords, max_threads, cache_max_age=None
+    ):
         """Exécute la recherche de mots clés dans un thread séparé."""
         try:
             # Ignorer les avertissements SSL
@@ -1971,7 +2112,14 @@ class ModernWebScraperApp:
 
             keywords_list = [k.strip() for k in keywords.split(",") if k.strip()]
             searcher = KeywordSearcher(
-                input_file, keywords_list, case_sensitive, max_threads=max_threads
+                input_file,
+                keywords_list,
+                case_sensitive,
+                max_threads=max_threads,
+                whole_word=self.keywords_whole_word.get(),
+                fold_accents=self.keywords_fold_accents.get(),
+                stemming=self.keywords_stemming.get(),
+                cache_max_age=cache_max_age,
             )
 
             # Callback pour mettre à jour la progression
@@ -2316,6 +2464,8 @@ class ModernWebScraperApp:
         url = self.scraper_url.get().strip()
         output_file = self.scraper_output_file.get().strip()
         max_urls_str = self.scraper_max_urls.get().strip()
+        concurrency_str = self.scraper_concurrency.get().strip()
+        resume = self.scraper_resume.get()
 
         if not url:
             messagebox.showerror("Erreur", "Veuillez entrer une URL valide.")
@@ -2335,6 +2485,16 @@ class ModernWebScraperApp:
                 messagebox.showerror("Erreur", f"Nombre d'URLs invalide: {str(e)}")
                 return
 
+        try:
+            concurrency = int(concurrency_str) if concurrency_str else 1
+            if concurrency <= 0:
+                raise ValueError("Le nombre de requêtes doit être positif.")
+        except ValueError as e:
+            messagebox.showerror(
+                "Erreur", f"Nombre de requêtes simultanées invalide: {str(e)}"
+            )
+            return
+
         # Désactiver le bouton de démarrage pendant le traitement
         self.scraper_start_button.config(state="disabled")
 
@@ -2352,6 +2512,12 @@ class ModernWebScraperApp:
         else:
             self.add_log_info(self.scraper_log, "Pas de limite d'URLs définie")
 
+        if concurrency > 1:
+            self.add_log_info(self.scraper_log, f"Requêtes simultanées: {concurrency}")
+
+        if resume:
+            self.add_log_info(self.scraper_log, "Reprise du crawl interrompu")
+
         self.add_log_separator(self.scraper_log)
         self.scraper_log.see(tk.END)
 
@@ -2363,7 +2529,8 @@ class ModernWebScraperApp:
 
         # Démarrer le scraper dans un thread séparé
         self.current_process = threading.Thread(
-            target=self._run_scraper, args=(url, output_file, max_urls, self.stop_event)
+            target=self._run_scraper,
+            args=(url, output_file, max_urls, self.stop_event, concurrency, resume),
         )
         self.current_process.daemon = True
         self.current_process.start()
@@ -2380,7 +2547,24 @@ class ModernWebScraperApp:
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
-    def _run_scraper(self, url, output_file, max_urls, stop_event):
+    def _parse_cache_max_age(self, value):
+        """
+        Convertit l'âge maximum du cache saisi en heures.
+
+        Returns:
+            float | None: Âge en secondes, ou None si le champ est vide
+        """
+        value = value.strip().replace(",", ".")
+        if not value:
+            return None
+        hours = float(value)
+        if hours < 0:
+            raise ValueError("L'âge du cache doit être positif.")
+        return hours * 3600
+
+    def _run_scraper(
+        self, url, output_file, max_urls, stop_event, concurrency=1, resume=False
+    ):
         """
         Exécute le scraper dans un thread séparé.
 
@@ -2389,6 +2573,8 @@ class ModernWebScraperApp:
             output_file (str): Fichier où enregistrer les URLs trouvées
             max_urls (int): Nombre maximum d'URLs à scraper (None = illimité)
             stop_event (threading.Event): Événement pour interrompre le scraping
+            concurrency (int): Nombre de requêtes simultanées
+            resume (bool): Reprendre le crawl interrompu
         """
         try:
             # Ignorer les avertissements SSL
@@ -2400,7 +2586,9 @@ class ModernWebScraperApp:
             self.scraper_start_time = time.time()
 
             # Créer et exécuter le scraper
-            scraper = SiteScraper(url, output_file, max_urls)
+            scraper = SiteScraper(
+                url, output_file, max_urls, max_concurrency=concurrency, resume=resume
+            )
 
             # Callback pour mettre à jour la progression
             def update_progress(current, max_val, message):
@@ -2497,6 +2685,12 @@ class ModernWebScraperApp:
             messagebox.showerror("Erreur", f"Nombre de threads invalide: {str(e)}")
             return
 
+        try:
+            cache_max_age = self._parse_cache_max_age(self.date_cache_max_age.get())
+        except ValueError as e:
+            messagebox.showerror("Erreur", f"Âge du cache invalide: {str(e)}")
+            return
+
         # Utiliser le fichier d'entrée pour déterminer le fichier de sortie par défaut si non spécifié
         if not output_file:
             output_file = f"{os.path.splitext(input_file)[0]}-dates.csv"
@@ -2514,6 +2708,14 @@ class ModernWebScraperApp:
         self.add_log_info(self.date_log, f"Fichier d'entrée: {input_file}")
         self.add_log_info(self.date_log, f"Fichier de sortie: {output_file}")
         self.add_log_info(self.date_log, f"Nombre de threads: {max_threads}")
+        keywords = self.date_keywords.get().strip()
+        if keywords:
+            self.add_log_info(self.date_log, f"Analyse combinée, mots-clés: {keywords}")
+            if self.date_cheap_mode.get():
+                self.add_log_warning(
+                    self.date_log,
+                    "Le mode rapide est ignoré : l'analyse combinée télécharge chaque page",
+                )
         self.add_log_separator(self.date_log)
         self.date_log.see(tk.END)
 
@@ -2524,12 +2726,15 @@ class ModernWebScraperApp:
 
         # Démarrer l'extraction dans un thread séparé
         self.current_process = threading.Thread(
-            target=self._run_date_extractor, args=(input_file, output_file, max_threads)
+            target=self._run_date_extractor,
+            args=(input_file, output_file, max_threads, cache_max_age),
         )
         self.current_process.daemon = True
         self.current_process.start()
 
-    def _run_date_extractor(self, input_file, output_file, max_threads):
+    def _run_date_extractor(
+        self, input_file, output_file, max_threads, cache_max_age=None
+    ):
         """Exécute l'extracteur de dates dans un thread séparé."""
         try:
             # Ignorer les avertissements SSL
@@ -2540,8 +2745,11 @@ class ModernWebScraperApp:
             # Stocker le temps de démarrage
             self.date_start_time = time.time()
 
-            # Créer et exécuter l'extracteur
-            extractor = DateExtractor(input_file, output_file, max_threads)
+            # Avec des mots-clés, une seule passe de téléchargement pour les
+            # dates et les mots-clés
+            keywords_list = [
+                k.strip() for k in self.date_keywords.get().split(",") if k.strip()
+            ]
 
             # Callback pour mettre à jour la progression
             def update_progress(current, max_val, message):
@@ -2558,6 +2766,45 @@ class ModernWebScraperApp:
                 enhanced_message = f"{message} | Temps écoulé: {elapsed_formatted} | ETA: {eta_formatted}"
                 self.queue.put(("date_progress", current, max_val, enhanced_message))
 
+            if keywords_list:
+                analyzer = PageAnalyzer(
+                    input_file,
+                    keywords_list,
+                    date_output_file=output_file,
+                    temp_dir=os.path.dirname(os.path.abspath(output_file)),
+                    max_threads=max_threads,
+                    cache_max_age=cache_max_age,
+                )
+                result = analyzer.run(update_progress)
+                if not result:
+                    self.queue.put(
+                        (
+                            "date_error",
+                            "L'analyse n'a pas pu être terminée correctement.",
+                        )
+                    )
+                    return
+
+                self.queue.put(
+                    (
+                        "date_complete",
+                        result["dates_found"],
+                        result["stats"]["total_urls"],
+                        result["dates_file"],
+                        result["output_file"],
+                    )
+                )
+                return
+
+            # Créer et exécuter l'extracteur
+            extractor = DateExtractor(
+                input_file,
+                output_file,
+                max_threads,
+                cheap_mode=self.date_cheap_mode.get(),
+                cache_max_age=cache_max_age,
+            )
+
             # Exécuter l'extraction
             dates_found, total_urls, output_file = extractor.run(update_progress)
 
@@ -2730,8 +2977,11 @@ class ModernWebScraperApp:
                     self._update_date_progress(current, max_val, status)
 
                 elif message[0] == "date_complete":
-                    _, dates_found, total_urls, output_file = message
-                    self._date_complete(dates_found, total_urls, output_file)
+                    # Fichier des mots-clés en plus après une analyse combinée
+                    _, dates_found, total_urls, output_file, *keywords_file = message
+                    self._date_complete(
+                        dates_found, total_urls, output_file, *keywords_file
+                    )
 
                 elif message[0] == "date_error":
                     _, error = message
@@ -3275,7 +3525,7 @@ class ModernWebScraperApp:
         else:
             self.root.destroy()
 
-    def _date_complete(self, dates_found, total_urls, output_file):
+    def _date_complete(self, dates_found, total_urls, output_file, keywords_file=None):
         """Gère la fin du processus d'extraction des dates."""
         self.date_progress["value"] = 100
         self.add_log_separator(self.date_log)
@@ -3288,6 +3538,10 @@ class ModernWebScraperApp:
         self.add_log_info(
             self.date_log, f"Les résultats ont été enregistrés dans {output_file}"
         )
+        if keywords_file:
+            self.add_log_info(
+                self.date_log, f"Les mots-clés ont été enregistrés dans {keywords_file}"
+            )
 
         # Ajouter un bouton pour ouvrir le dossier
         if os.path.exists(output_file):
@@ -5,7 +5,34 @@ Utilitaires communs utilisés dans différents modules du projet.
 import re, os
 import time
 import random
-from fake_useragent import UserAgent
+import itertools
+import threading
+
+try:
+    from fake_useragent import UserAgent
+except ImportError:
+    UserAgent = None
+
+# En-têtes d'un navigateur, complétés par un User-Agent du pool
+BROWSER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "DNT": "1",
+}
+
+# En-têtes utilisés si fake_useragent est absent ou ne peut pas charger ses données
+FALLBACK_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Referer": "https://www.google.com/",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+}
 
 
 def format_time(seconds):
@@ -30,32 +57,64 @@ def sanitize_filename(filename):
     return sanitized
 
 
+class HeaderProfilePool:
+    def __init__(self, size=50, base_headers=None):
+        """
+        Pool de profils d'en-têtes de navigateur.
+
+        Les User-Agents sont tirés une seule fois, au premier appel (charger
+        les données de fake_useragent coûte plusieurs dizaines de
+        millisecondes), puis les profils sont distribués à tour de rôle. Le
+        compteur itertools.count avance de façon atomique sous le GIL : la
+        rotation ne prend aucun verrou.
+
+        Args:
+            size (int): Nombre de User-Agents différents à tirer
+            base_headers (dict, optional): En-têtes communs à tous les profils
+        """
+        self.size = max(1, int(size))
+        self.base_headers = base_headers or BROWSER_HEADERS
+        self._profiles = None
+        self._counter = itertools.count()
+        self._load_lock = threading.Lock()
+
+    def _load(self):
+        with self._load_lock:
+            if self._profiles is not None:
+                return self._profiles
+
+            profiles = []
+            try:
+                ua = UserAgent()
+                agents = list(dict.fromkeys(ua.random for _ in range(self.size)))
+                profiles = [
+                    dict(self.base_headers, **{"User-Agent": agent}) for agent in agents
+                ]
+            except Exception:
+                # fake_useragent absent ou données illisibles
+                profiles = []
+
+            self._profiles = tuple(profiles) or (FALLBACK_HEADERS,)
+            return self._profiles
+
+    def next(self):
+        """
+        Renvoie le profil suivant.
+
+        Returns:
+            dict: Copie des en-têtes, modifiable par l'appelant
+        """
+        profiles = self._profiles or self._load()
+        return dict(profiles[next(self._counter) % len(profiles)])
+
+
+# Pool partagé par les modules de téléchargement
+_header_pool = HeaderProfilePool()
+
+
 def get_random_headers():
-    """Génère des en-têtes HTTP aléatoires qui imitent un navigateur"""
-    try:
-        ua = UserAgent()
-        return {
-            "User-Agent": ua.random,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Cache-Control": "max-age=0",
-            "TE": "Trailers",
-            "DNT": "1",
-        }
-    except:
-        # Fallback
-        return {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "fr,fr-FR;q=0.8,en-US;q=0.5,en;q=0.3",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Referer": "https://www.google.com/",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+    """Génère des en-têtes HTTP qui imitent un navigateur (pool partagé)"""
+    return _header_pool.next()
 
 
 def extract_domain(url):
@@ -0,0 +1,264 @@
+"""
+Ordonnanceur de politesse partagé entre les différents modules de récupération.
+
+Il limite le nombre de requêtes simultanées et le débit par hôte, respecte
+l'en-tête Retry-After et ralentit automatiquement sur les réponses 429/503.
+"""
+
+import time
+import random
+import threading
+import datetime
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# Codes HTTP signalant un serveur surchargé ou un débit trop élevé
+BACKOFF_STATUS_CODES = (429, 503)
+
+# Débit par hôte quand un module ne précise ni débit ni nombre de workers
+DEFAULT_REQUESTS_PER_SECOND = 20.0
+
+# Débit par hôte accordé à chaque worker d'un module (au moins le débit par défaut)
+REQUESTS_PER_SECOND_PER_WORKER = 5.0
+
+
+class _HostState:
+    """État de politesse d'un hôte"""
+
+    def __init__(self, interval):
+        self.condition = threading.Condition()
+        self.active = 0
+        self.lock = threading.Lock()
+        self.interval = interval
+        self.next_time = 0.0
+        self.blocked_until = 0.0
+
+
+class HostScheduler:
+    def __init__(
+        self,
+        max_per_host=16,
+        requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+        max_interval=30.0,
+        max_retry_after=300.0,
+    ):
+        """
+        Initialise l'ordonnanceur.
+
+        Args:
+            max_per_host (int): Nombre maximum de requêtes simultanées par hôte
+            requests_per_second (float): Débit maximum par hôte quand tout va bien
+            max_interval (float): Intervalle maximum (s) entre deux requêtes après ralentissement
+            max_retry_after (float): Attente maximum (s) acceptée depuis Retry-After
+        """
+        self.max_per_host = max(1, int(max_per_host))
+        self.base_interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.max_interval = max_interval
+        self.max_retry_after = max_retry_after
+
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+
+    def _get_state(self, url):
+        """Renvoie l'état de l'hôte de l'URL, en le créant si besoin"""
+        host = urlparse(url).netloc.lower()
+        state = self._hosts.get(host)
+        if state is None:
+            with self._hosts_lock:
+                state = self._hosts.get(host)
+                if state is None:
+                    state = _HostState(self.base_interval)
+                    self._hosts[host] = state
+        return state
+
+    @contextmanager
+    def slot(self, url):
+        """
+        Réserve un créneau de requête pour l'hôte de l'URL.
+
+        Bloque tant que l'hôte a atteint sa limite de requêtes simultanées,
+        puis attend le prochain créneau autorisé par son débit.
+        """
+        state = self._get_state(url)
+        with state.condition:
+            # Limite relue à chaque réveil : configure() peut l'avoir changée
+            while state.active >= self.max_per_host:
+                state.condition.wait()
+            state.active += 1
+        try:
+            with state.lock:
+                now = time.monotonic()
+                start = max(now, state.next_time, state.blocked_until)
+                state.next_time = start + state.interval
+
+            if start > now:
+                time.sleep(start - now)
+
+            yield
+        finally:
+            with state.condition:
+                state.active -= 1
+                state.condition.notify()
+
+    def configure(self, max_per_host=None, requests_per_second=None):
+        """
+        Change les limites par hôte, y compris pour les hôtes déjà contactés.
+
+        Args:
+            max_per_host (int, optional): Nombre maximum de requêtes simultanées par hôte
+            requests_per_second (float, optional): Débit maximum par hôte (0 pour
+                ne pas limiter le débit)
+        """
+        if max_per_host:
+            self.max_per_host = max(1, int(max_per_host))
+        if requests_per_second is not None:
+            old_interval = self.base_interval
+            self.base_interval = (
+                1.0 / requests_per_second if requests_per_second else 0.0
+            )
+
+        with self._hosts_lock:
+            states = list(self._hosts.values())
+        for state in states:
+            if requests_per_second is not None:
+                with state.lock:
+                    # Un hôte ralenti (429/503) le reste jusqu'à son rétablissement
+                    if state.interval <= old_interval:
+                        state.interval = self.base_interval
+                    else:
+                        state.interval = max(self.base_interval, state.interval)
+            with state.condition:
+                state.condition.notify_all()
+
+    def report(self, url, status_code=None, headers=None):
+        """
+        Adapte le débit de l'hôte selon le résultat d'une requête.
+
+        Args:
+            url (str): URL demandée
+            status_code (int, optional): Code HTTP reçu (None en cas d'erreur réseau)
+            headers (dict, optional): En-têtes de la réponse
+
+        Returns:
+            float: Délai imposé avant la prochaine requête vers cet hôte (0 si aucun)
+        """
+        state = self._get_state(url)
+
+        with state.lock:
+            if status_code in BACKOFF_STATUS_CODES:
+                # Ralentissement multiplicatif
+                state.interval = min(
+                    self.max_interval, max(state.interval * 2, self.base_interval, 0.5)
+                )
+                delay = self._parse_retry_after(headers)
+                if delay is None:
+                    delay = state.interval * random.uniform(1.0, 2.0)
+                state.blocked_until = max(state.blocked_until, time.monotonic() + delay)
+                return delay
+
+            if status_code is None:
+                # Erreur réseau : on ralentit sans bloquer l'hôte
+                state.interval = min(
+                    self.max_interval, max(state.interval * 1.5, self.base_interval)
+                )
+                return 0.0
+
+            # Succès : retour progressif vers le débit nominal
+            if state.interval > self.base_interval:
+                state.interval = max(self.base_interval, state.interval * 0.9)
+            return 0.0
+
+    def fetch(self, url, send, max_retries=2):
+        """
+        Exécute une requête en respectant la politesse de l'hôte.
+
+        Les réponses 429/503 sont réessayées après l'attente imposée.
+
+        Args:
+            url (str): URL demandée
+            send (callable): Fonction sans argument effectuant la requête et renvoyant la réponse
+            max_retries (int): Nombre de nouvelles tentatives sur 429/503
+
+        Returns:
+            La réponse renvoyée par send
+        """
+        for attempt in range(max_retries + 1):
+            with self.slot(url):
+                try:
+                    response = send()
+                except Exception:
+                    self.report(url)
+                    raise
+
+            self.report(url, response.status_code, response.headers)
+            if (
+                response.status_code not in BACKOFF_STATUS_CODES
+                or attempt == max_retries
+            ):
+                return response
+
+            # Libérer la connexion avant de réessayer
+            response.close()
+
+        return response
+
+    def _parse_retry_after(self, headers):
+        """Convertit l'en-tête Retry-After en nombre de secondes"""
+        if not headers:
+            return None
+
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_date = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_date.tzinfo is None:
+                retry_date = retry_date.replace(tzinfo=datetime.timezone.utc)
+            now = datetime.datetime.now(datetime.timezone.utc)
+            delay = (retry_date - now).total_seconds()
+
+        return min(max(delay, 0.0), self.max_retry_after)
+
+
+_shared_scheduler = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_shared_scheduler(workers=None, max_per_host=None, requests_per_second=None):
+    """
+    Renvoie l'ordonnanceur partagé par tous les modules du projet.
+
+    Les limites sont celles du dernier module qui les a fixées : sans valeur
+    explicite, elles sont calculées à partir de son nombre de workers.
+
+    Args:
+        workers (int, optional): Nombre de workers du module appelant
+        max_per_host (int, optional): Requêtes simultanées par hôte (workers par défaut)
+        requests_per_second (float, optional): Débit par hôte (par défaut
+            REQUESTS_PER_SECOND_PER_WORKER par worker, au moins
+            DEFAULT_REQUESTS_PER_SECOND)
+    """
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_scheduler_lock:
+            if _shared_scheduler is None:
+                _shared_scheduler = HostScheduler()
+
+    if workers:
+        if max_per_host is None:
+            max_per_host = workers
+        if requests_per_second is None:
+            requests_per_second = max(
+                DEFAULT_REQUESTS_PER_SECOND, workers * REQUESTS_PER_SECOND_PER_WORKER
+            )
+    if max_per_host or requests_per_second is not None:
+        _shared_scheduler.configure(max_per_host, requests_per_second)
+    return _shared_scheduler
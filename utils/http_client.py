@@ -0,0 +1,702 @@
+"""
+Client HTTP partagé par le scraper, l'extracteur de dates et la recherche de mots-clés.
+
+Une seule requests.Session dont les pools de connexions par hôte sont
+dimensionnés sur le nombre de workers : les connexions restent ouvertes
+(keep-alive) et sont réutilisées d'une requête à l'autre au lieu d'être
+rouvertes pour chaque page. Les erreurs de connexion et les réponses
+500/502/504 sont réessayées par urllib3 ; les 429/503 restent gérées par
+l'ordonnanceur de politesse (host_scheduler), qui respecte Retry-After.
+
+Les adresses des hôtes sont gardées en cache pendant DNS_CACHE_TTL secondes :
+chaque nouvelle connexion (pool agrandi, connexion fermée par le serveur)
+évite une résolution DNS. prewarm() ouvre les connexions vers le site cible
+avant le début du travail, pour que les premières requêtes n'attendent ni
+le DNS ni la poignée de main TCP/TLS.
+
+Avec httpx et h2 installés (pip install "httpx[http2]"), un client HTTP/2
+optionnel multiplexe les requêtes simultanées vers un hôte sur une seule
+connexion ; ses réponses imitent celles de requests pour les appelants.
+
+read_page() lit le corps d'une réponse ouverte avec stream=True dans la
+limite d'un budget d'octets : les appelants vérifient Content-Type avant de
+télécharger quoi que ce soit, et une page démesurée est tronquée au lieu
+d'occuper la bande passante et la mémoire.
+"""
+
+import io
+import sys
+import time
+import socket
+import logging
+import threading
+import ipaddress
+import requests
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util import connection
+from urllib3.util.retry import Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError as Urllib3HTTPError,
+    NameResolutionError,
+    NewConnectionError,
+)
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+    import h2  # noqa: F401 (requis par httpx pour HTTP/2)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+logger = logging.getLogger("HttpClient")
+
+# Délai maximum (s) de connexion et de lecture d'une réponse
+DEFAULT_TIMEOUT = 10
+
+# Réponses réessayées par urllib3 (429/503 : voir host_scheduler)
+RETRY_STATUS_CODES = (500, 502, 504)
+
+# Durée (s) de conservation des adresses résolues
+DNS_CACHE_TTL = 300
+
+# Délai maximum (s) d'ouverture des connexions préchauffées
+PREWARM_TIMEOUT = 5
+
+# Taille maximum (octets) d'une page lue ; au-delà, le corps est tronqué
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+
+# Taille des blocs lus par read_page
+READ_CHUNK_SIZE = 64 * 1024
+
+# Corps lu par read_page : octets, encodage et indicateur de troncature
+PageBody = namedtuple("PageBody", ["content", "encoding", "truncated"])
+
+
+def is_html_response(response):
+    """Indique si les en-têtes d'une réponse annoncent une page HTML"""
+    return "text/html" in response.headers.get("Content-Type", "").lower()
+
+
+def read_page(response, max_bytes=MAX_PAGE_BYTES):
+    """
+    Lit le corps d'une réponse ouverte avec stream=True, puis la ferme.
+
+    La lecture s'arrête dès que max_bytes octets sont dépassés ; la connexion
+    d'une réponse tronquée est fermée plutôt que vidée.
+
+    Args:
+        response (requests.Response): Réponse dont le corps n'a pas été lu
+        max_bytes (int): Budget d'octets (0 ou None pour lire tout le corps)
+
+    Returns:
+        PageBody: Corps lu, encodage (en-têtes, sinon détecté) et troncature
+    """
+    body = bytearray()
+    truncated = False
+    try:
+        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
+            body += chunk
+            if max_bytes and len(body) > max_bytes:
+                truncated = True
+                del body[max_bytes:]
+                break
+    finally:
+        response.close()
+
+    content = bytes(body)
+    encoding = response.encoding or requests.compat.chardet.detect(content)["encoding"]
+    return PageBody(content, encoding, truncated)
+
+
+class DnsCache:
+    """Cache des résolutions DNS (socket.getaddrinfo) partagé par les connexions"""
+
+    def __init__(self, ttl=DNS_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host, port):
+        """
+        Renvoie les adresses (sockaddr) de l'hôte, depuis le cache si possible.
+
+        Raises:
+            socket.gaierror: Si l'hôte ne peut pas être résolu
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+
+        family = connection.allowed_gai_family()
+        addresses = [
+            info[4]
+            for info in socket.getaddrinfo(host, port, family, socket.SOCK_STREAM)
+        ]
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (now + self.ttl, addresses)
+        return addresses
+
+    def invalidate(self, host, port):
+        """Oublie les adresses d'un hôte (aucune n'a répondu)"""
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+def _is_ip_address(host):
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+def _cached_dns_connection_class(base, dns_cache):
+    """Connexion urllib3 qui résout son hôte via le cache DNS"""
+
+    class CachedDnsConnection(base):
+        def _new_conn(self):
+            # Même traitement des erreurs que HTTPConnection._new_conn
+            host = self._dns_host
+            if _is_ip_address(host):
+                return super()._new_conn()
+            try:
+                addresses = dns_cache.resolve(host, self.port)
+            except socket.gaierror as e:
+                raise NameResolutionError(self.host, self, e) from e
+
+            error = None
+            for sockaddr in addresses:
+                try:
+                    sock = connection.create_connection(
+                        sockaddr[:2],
+                        self.timeout,
+                        source_address=self.source_address,
+                        socket_options=self.socket_options,
+                    )
+                except OSError as e:
+                    error = e
+                    continue
+                sys.audit("http.client.connect", self, self.host, self.port)
+                return sock
+
+            # Adresses périmées ou injoignables : résoudre à nouveau la prochaine fois
+            dns_cache.invalidate(host, self.port)
+            if isinstance(error, socket.timeout):
+                raise ConnectTimeoutError(
+                    self,
+                    f"Connection to {self.host} timed out. (connect timeout={self.timeout})",
+                ) from error
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {error}"
+            ) from error
+
+    return CachedDnsConnection
+
+
+class _ConnectionStats:
+    """Compteurs de requêtes et de connexions ouvertes"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.errors = 0
+
+
+def _counting_pool_class(base, stats, dns_cache):
+    """Pool urllib3 qui compte les connexions qu'il ouvre"""
+
+    class CountingConnectionPool(base):
+        ConnectionCls = _cached_dns_connection_class(base.ConnectionCls, dns_cache)
+
+        def _new_conn(self):
+            with stats.lock:
+                stats.new_connections += 1
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class _CountingAdapter(HTTPAdapter):
+    """Adaptateur qui compte les requêtes envoyées (redirections et nouvelles tentatives comprises)"""
+
+    def __init__(self, stats, pool_classes, **kwargs):
+        self._stats = stats
+        self._pool_classes = pool_classes
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    def send(self, request, **kwargs):
+        with self._stats.lock:
+            self._stats.requests += 1
+        try:
+            return super().send(request, **kwargs)
+        except requests.RequestException:
+            with self._stats.lock:
+                self._stats.errors += 1
+            raise
+
+
+class HttpClient:
+    def __init__(
+        self,
+        pool_maxsize=10,
+        pool_connections=32,
+        retries=2,
+        backoff_factor=0.5,
+        timeout=DEFAULT_TIMEOUT,
+        verify=False,
+    ):
+        """
+        Initialise le client.
+
+        Args:
+            pool_maxsize (int): Connexions gardées ouvertes par hôte (nombre de workers)
+            pool_connections (int): Nombre d'hôtes dont le pool est conservé
+            retries (int): Nouvelles tentatives sur erreur de connexion ou 500/502/504
+            backoff_factor (float): Base de l'attente exponentielle entre deux tentatives
+            timeout (float | tuple): Délai par défaut (connexion, lecture)
+            verify (bool): Vérifier les certificats SSL
+        """
+        self.timeout = timeout
+        self.verify = verify
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self._lock = threading.Lock()
+        self._stats = _ConnectionStats()
+        self.dns_cache = DnsCache()
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            backoff_factor=backoff_factor,
+            raise_on_status=False,
+            respect_retry_after_header=False,
+        )
+        self.adapter = _CountingAdapter(
+            self._stats,
+            {
+                "http": _counting_pool_class(
+                    HTTPConnectionPool, self._stats, self.dns_cache
+                ),
+                "https": _counting_pool_class(
+                    HTTPSConnectionPool, self._stats, self.dns_cache
+                ),
+            },
+            pool_connections=pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retry,
+        )
+
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+
+    def ensure_pool_size(self, workers):
+        """
+        Agrandit les pools de connexions pour au moins `workers` requêtes
+        simultanées par hôte. Les pools déjà ouverts sont remplacés au fil des
+        requêtes (la taille fait partie de leur clé dans urllib3).
+        """
+        workers = int(workers or 0)
+        with self._lock:
+            if workers <= self.pool_maxsize:
+                return
+            self.pool_maxsize = workers
+            self.adapter._pool_maxsize = workers
+            self.adapter.poolmanager.connection_pool_kw["maxsize"] = workers
+
+    def prewarm(self, url, connections):
+        """
+        Ouvre à l'avance des connexions vers l'hôte de l'URL et les dépose
+        dans son pool, où les premières requêtes les trouveront prêtes.
+
+        Args:
+            url (str): URL du site cible
+            connections (int): Nombre de connexions à ouvrir (borné par la
+                taille du pool)
+
+        Returns:
+            int: Nombre de connexions ouvertes
+        """
+        if hasattr(self.adapter, "get_connection_with_tls_context"):
+            request = requests.Request("GET", url).prepare()
+            pool = self.adapter.get_connection_with_tls_context(request, self.verify)
+        else:
+            # requests < 2.32.2
+            pool = self.adapter.get_connection(url)
+
+        count = max(0, min(int(connections or 0), self.pool_maxsize))
+        if not count:
+            return 0
+
+        # Retirer les connexions du pool, les ouvrir en parallèle, puis les rendre
+        conns = [pool._get_conn() for _ in range(count)]
+
+        def open_connection(conn):
+            if conn.sock is not None:
+                return False
+            conn.timeout = PREWARM_TIMEOUT
+            try:
+                conn.connect()
+                return True
+            except (OSError, Urllib3HTTPError) as e:
+                logger.warning(
+                    f"Préchauffage d'une connexion vers {url} impossible: {e}"
+                )
+                conn.close()
+                return False
+
+        try:
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                opened = sum(executor.map(open_connection, conns))
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        return opened
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        stream=False,
+        allow_redirects=True,
+        timeout=None,
+    ):
+        """
+        Envoie une requête HTTP.
+
+        Returns:
+            requests.Response: Réponse (les erreurs HTTP ne lèvent pas d'exception)
+        """
+        return self.session.request(
+            method,
+            url,
+            headers=headers,
+            stream=stream,
+            allow_redirects=allow_redirects,
+            timeout=timeout or self.timeout,
+            verify=self.verify,
+        )
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def stats(self):
+        """
+        Statistiques de réutilisation des connexions depuis la création du
+        client (cumulées pour tous les modules qui le partagent).
+
+        Returns:
+            dict: Requêtes envoyées, connexions ouvertes, requêtes servies par
+                une connexion déjà ouverte et taux de réutilisation
+        """
+        with self._stats.lock:
+            sent = self._stats.requests
+            opened = self._stats.new_connections
+            errors = self._stats.errors
+        reused = max(0, sent - opened)
+        return {
+            "requests": sent,
+            "new_connections": opened,
+            "reused_connections": reused,
+            "reuse_rate": reused / sent if sent else 0.0,
+            "errors": errors,
+            "pool_maxsize": self.pool_maxsize,
+            "dns_cache_hits": self.dns_cache.hits,
+            "dns_lookups": self.dns_cache.misses,
+        }
+
+
+class _StreamReader(io.RawIOBase):
+    """Flux binaire lisible (comme response.raw) sur le corps d'une réponse httpx"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+        # Attributs positionnés par les appelants sur un flux urllib3
+        self.decode_content = True
+        self.auto_close = True
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class Http2Response:
+    """Réponse httpx présentée avec l'interface de requests.Response utilisée par le projet"""
+
+    def __init__(self, response):
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.http_version = response.http_version
+        self.encoding = get_encoding_from_headers(response.headers)
+        self._raw = None
+
+    @property
+    def content(self):
+        return self._response.read()
+
+    @property
+    def apparent_encoding(self):
+        return requests.compat.chardet.detect(self.content)["encoding"]
+
+    @property
+    def text(self):
+        encoding = self.encoding or self.apparent_encoding or "utf-8"
+        try:
+            return self.content.decode(encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+    @property
+    def raw(self):
+        # Un seul lecteur par réponse : le corps ne peut être parcouru qu'une fois
+        if self._raw is None:
+            self._raw = _StreamReader(self._response.iter_bytes())
+        return self._raw
+
+    def iter_content(self, chunk_size=1):
+        return self._response.iter_bytes(chunk_size)
+
+    def raise_for_status(self):
+        if 400 <= self.status_code < 600:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+    def close(self):
+        self._response.close()
+
+
+class Http2Client:
+    def __init__(
+        self,
+        pool_maxsize=10,
+        pool_connections=32,
+        retries=2,
+        backoff_factor=0.5,
+        timeout=DEFAULT_TIMEOUT,
+        verify=False,
+    ):
+        """
+        Initialise le client HTTP/2 (httpx). Mêmes paramètres et même
+        interface que HttpClient ; les requêtes simultanées vers un même hôte
+        partagent une connexion au lieu d'en ouvrir une par worker.
+
+        Args:
+            pool_maxsize (int): Requêtes simultanées attendues par hôte
+            pool_connections (int): Nombre de connexions gardées ouvertes
+            retries (int): Nouvelles tentatives sur erreur de connexion ou 500/502/504
+            backoff_factor (float): Base de l'attente exponentielle entre deux tentatives
+            timeout (float | tuple): Délai par défaut (connexion, lecture)
+            verify (bool): Vérifier les certificats SSL
+        """
+        if not HTTP2_AVAILABLE:
+            raise ImportError(
+                'HTTP/2 nécessite httpx et h2 (pip install "httpx[http2]")'
+            )
+
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = max(1, int(pool_maxsize))
+        self._stats = _ConnectionStats()
+        self._http2_responses = 0
+
+        # httpx ignore limits et verify du client quand un transport est
+        # fourni : ils sont donc passés au transport
+        self.client = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                verify=verify,
+                retries=retries,
+                limits=httpx.Limits(
+                    max_connections=None, max_keepalive_connections=pool_connections
+                ),
+            ),
+        )
+
+    def _trace(self, event_name, info):
+        # Appelée par httpcore à chaque étape ; compter les connexions ouvertes
+        if event_name == "connection.connect_tcp.complete":
+            with self._stats.lock:
+                self._stats.new_connections += 1
+
+    def ensure_pool_size(self, workers):
+        """Les flux HTTP/2 d'une connexion ne sont pas limités par le pool"""
+        self.pool_maxsize = max(self.pool_maxsize, int(workers or 0))
+
+    def prewarm(self, url, connections):
+        """
+        Ouvre la connexion vers l'hôte de l'URL avant le début du travail :
+        une seule suffit, les requêtes y sont multiplexées.
+
+        Returns:
+            int: Nombre de connexions ouvertes
+        """
+        try:
+            self.request("HEAD", url, timeout=PREWARM_TIMEOUT).close()
+            return 1
+        except requests.RequestException as e:
+            logger.warning(f"Préchauffage de la connexion vers {url} impossible: {e}")
+            return 0
+
+    def _send(self, method, url, headers, allow_redirects, timeout):
+        request = self.client.build_request(
+            method,
+            url,
+            headers=headers,
+            timeout=timeout or self.timeout,
+            extensions={"trace": self._trace},
+        )
+        with self._stats.lock:
+            self._stats.requests += 1
+        try:
+            return self.client.send(
+                request, stream=True, follow_redirects=allow_redirects
+            )
+        except httpx.TimeoutException as e:
+            self._count_error()
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            self._count_error()
+            raise requests.ConnectionError(str(e)) from e
+        except httpx.HTTPError as e:
+            self._count_error()
+            raise requests.RequestException(str(e)) from e
+
+    def _count_error(self):
+        with self._stats.lock:
+            self._stats.errors += 1
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        stream=False,
+        allow_redirects=True,
+        timeout=None,
+    ):
+        """
+        Envoie une requête HTTP/2 (HTTP/1.1 si le serveur ne le propose pas).
+
+        Returns:
+            Http2Response: Réponse (les erreurs HTTP ne lèvent pas d'exception)
+        """
+        for attempt in range(self.retries + 1):
+            response = self._send(method, url, headers, allow_redirects, timeout)
+            if (
+                response.status_code not in RETRY_STATUS_CODES
+                or attempt == self.retries
+            ):
+                break
+            response.close()
+            time.sleep(self.backoff_factor * (2**attempt))
+
+        if response.http_version == "HTTP/2":
+            with self._stats.lock:
+                self._http2_responses += 1
+
+        if not stream:
+            try:
+                response.read()
+            except httpx.HTTPError as e:
+                self._count_error()
+                raise requests.ConnectionError(str(e)) from e
+            finally:
+                response.close()
+        return Http2Response(response)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def stats(self):
+        """Statistiques de réutilisation des connexions (voir HttpClient.stats)"""
+        with self._stats.lock:
+            sent = self._stats.requests
+            opened = self._stats.new_connections
+            errors = self._stats.errors
+            http2_responses = self._http2_responses
+        reused = max(0, sent - opened)
+        return {
+            "requests": sent,
+            "new_connections": opened,
+            "reused_connections": reused,
+            "reuse_rate": reused / sent if sent else 0.0,
+            "errors": errors,
+            "pool_maxsize": self.pool_maxsize,
+            "http2_responses": http2_responses,
+        }
+
+
+_shared_clients = {}
+_shared_client_lock = threading.Lock()
+
+
+def get_shared_client(max_workers=None, http2=False):
+    """
+    Renvoie le client HTTP partagé par tous les modules du projet.
+
+    Args:
+        max_workers (int, optional): Nombre de workers de l'appelant ; les
+            pools de connexions sont agrandis si nécessaire
+        http2 (bool, optional): Client HTTP/2 (httpx) ; le client HTTP/1.1
+            est renvoyé si httpx ou h2 n'est pas installé
+    """
+    if http2 and not HTTP2_AVAILABLE:
+        logger.warning(
+            'HTTP/2 indisponible (pip install "httpx[http2]"), utilisation de HTTP/1.1'
+        )
+        http2 = False
+
+    client = _shared_clients.get(http2)
+    if client is None:
+        with _shared_client_lock:
+            client = _shared_clients.get(http2)
+            if client is None:
+                client = Http2Client() if http2 else HttpClient()
+                _shared_clients[http2] = client
+    if max_workers:
+        client.ensure_pool_size(max_workers)
+    return client
@@ -0,0 +1,143 @@
+"""
+Stockage local des métadonnées HTTP (ETag / Last-Modified) pour les recrawls.
+
+Pour chaque URL, le stockage conserve les validateurs renvoyés par le serveur
+ainsi que les résultats déjà extraits par chaque module (liens, date,
+mots-clés). Lors d'un recrawl, les requêtes sont conditionnelles
+(If-None-Match / If-Modified-Since) : une réponse 304 signifie que la page n'a
+pas changé et que ses résultats précédents peuvent être réutilisés.
+"""
+
+import os
+import json
+import zlib
+import sqlite3
+import threading
+import datetime
+
+HTTP_METADATA_FILENAME = "http_metadata.sqlite"
+
+
+class HttpMetadataStore:
+    def __init__(self, db_path, commit_every=200):
+        """
+        Initialise le stockage.
+
+        Args:
+            db_path (str): Chemin du fichier SQLite
+            commit_every (int): Nombre d'écritures entre deux commits
+        """
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.commit_every = max(1, int(commit_every))
+        self._writes = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS validators ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, updated_at TEXT)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS payloads ("
+                "url TEXT, stage TEXT, value BLOB, PRIMARY KEY (url, stage))"
+            )
+
+    @classmethod
+    def for_directory(cls, directory):
+        """Ouvre le stockage partagé d'un répertoire de domaine (data/<domaine>/)"""
+        return cls(os.path.join(directory, HTTP_METADATA_FILENAME))
+
+    def conditional_headers(self, url):
+        """
+        Renvoie les en-têtes de requête conditionnelle connus pour une URL.
+
+        Returns:
+            dict: If-None-Match et/ou If-Modified-Since (vide si l'URL est inconnue)
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+
+        headers = {}
+        if row:
+            etag, last_modified = row
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def record(self, url, response):
+        """
+        Enregistre les validateurs d'une réponse 200.
+
+        Si les validateurs changent, les résultats stockés pour cette URL par
+        les autres modules décrivent l'ancienne version de la page : ils sont
+        supprimés pour qu'une prochaine réponse 304 ne les réutilise pas.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified FROM validators WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None and row != (etag, last_modified):
+                self.conn.execute("DELETE FROM payloads WHERE url = ?", (url,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO validators (url, etag, last_modified, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, datetime.datetime.now().isoformat()),
+            )
+            self._after_write()
+
+    def get_payload(self, url, stage):
+        """
+        Renvoie le résultat précédemment extrait pour une URL et un module.
+
+        Returns:
+            Valeur JSON stockée, ou None si absente
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value FROM payloads WHERE url = ? AND stage = ?", (url, stage)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def set_payload(self, url, stage, value):
+        """Enregistre le résultat extrait pour une URL et un module (compressé)"""
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO payloads (url, stage, value) VALUES (?, ?, ?)",
+                (url, stage, blob),
+            )
+            self._after_write()
+
+    def _after_write(self):
+        self._writes += 1
+        if self._writes >= self.commit_every:
+            self.conn.commit()
+            self._writes = 0
+
+    def commit(self):
+        """Valide les écritures en attente"""
+        with self.lock:
+            self.conn.commit()
+            self._writes = 0
+
+    def close(self):
+        """Valide les écritures en attente et ferme la connexion"""
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
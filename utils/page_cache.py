@@ -0,0 +1,234 @@
+"""
+Cache disque des pages téléchargées, partagé entre les étapes du pipeline.
+
+Le scraper y dépose chaque page visitée ; l'extracteur de dates et le
+chercheur de mots-clés le consultent avant d'aller sur le réseau. Les corps
+sont stockés compressés et adressés par leur contenu (SHA-256) : deux URLs
+servant la même page partagent un seul fichier. Un index SQLite associe les
+URLs aux contenus et permet d'évincer les plus anciens quand la taille
+maximale est dépassée.
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+PAGE_CACHE_DIRNAME = "page_cache"
+
+# Taille maximale par défaut du cache (octets compressés)
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+class CachedPage:
+    """Page lue depuis le cache"""
+
+    def __init__(self, url, content, content_type, encoding, fetched_at):
+        self.url = url
+        self.content = content
+        self.content_type = content_type or ""
+        self.encoding = encoding
+        self.fetched_at = fetched_at
+
+    @property
+    def is_html(self):
+        return "text/html" in self.content_type.lower()
+
+    @property
+    def text(self):
+        """Contenu décodé avec l'encodage de la réponse d'origine"""
+        try:
+            return self.content.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+class PageCache:
+    def __init__(
+        self, directory, max_bytes=DEFAULT_MAX_BYTES, max_age=None, commit_every=200
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            directory (str): Répertoire du cache
+            max_bytes (int): Taille maximale des contenus compressés
+            max_age (float, optional): Âge maximum en secondes d'une page servie
+                par get (None = pas de limite)
+            commit_every (int): Nombre d'écritures de l'index entre deux commits
+        """
+        self.directory = directory
+        self.objects_dir = os.path.join(directory, "objects")
+        if not os.path.exists(self.objects_dir):
+            os.makedirs(self.objects_dir)
+
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.commit_every = max(1, int(commit_every))
+        self._writes = 0
+
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            os.path.join(directory, "index.sqlite"), check_same_thread=False
+        )
+        with self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, digest TEXT, content_type TEXT, "
+                "encoding TEXT, fetched_at REAL)"
+            )
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                "digest TEXT PRIMARY KEY, size INTEGER, last_access REAL)"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS objects_last_access ON objects (last_access)"
+            )
+
+        row = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()
+        self.total_bytes = row[0]
+
+    @classmethod
+    def for_directory(cls, directory, **kwargs):
+        """Ouvre le cache partagé d'un répertoire de domaine (data/<domaine>/)"""
+        return cls(os.path.join(directory, PAGE_CACHE_DIRNAME), **kwargs)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:] + ".z")
+
+    def put(self, url, content, content_type="", encoding=None):
+        """
+        Enregistre le corps d'une réponse.
+
+        Args:
+            url (str): URL de la page
+            content (bytes): Corps brut de la réponse (vide pour une ressource non HTML)
+            content_type (str): En-tête Content-Type de la réponse
+            encoding (str, optional): Encodage du texte
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        now = time.time()
+
+        with self.lock:
+            known = self.conn.execute(
+                "SELECT 1 FROM objects WHERE digest = ?", (digest,)
+            ).fetchone()
+
+            if known:
+                self.conn.execute(
+                    "UPDATE objects SET last_access = ? WHERE digest = ?", (now, digest)
+                )
+            else:
+                path = self._object_path(digest)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                compressed = zlib.compress(content)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(compressed)
+                os.replace(tmp_path, path)
+
+                self.conn.execute(
+                    "INSERT INTO objects (digest, size, last_access) VALUES (?, ?, ?)",
+                    (digest, len(compressed), now),
+                )
+                self.total_bytes += len(compressed)
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (url, digest, content_type, encoding, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, digest, content_type, encoding, now),
+            )
+            self._after_write()
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def touch(self, url):
+        """Marque une page comme revalidée (réponse 304)"""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self._after_write()
+
+    def discard(self, url):
+        """
+        Oublie la page en cache d'une URL (page retéléchargée mais non
+        enregistrée, par exemple tronquée) pour ne plus servir l'ancienne copie.
+        Le contenu lui-même reste soumis à l'éviction habituelle.
+        """
+        with self.lock:
+            self.conn.execute("DELETE FROM pages WHERE url = ?", (url,))
+            self._after_write()
+
+    def get(self, url):
+        """
+        Renvoie la page en cache pour une URL.
+
+        Returns:
+            CachedPage | None: Page en cache, ou None si absente, trop ancienne
+                ou évincée
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT digest, content_type, encoding, fetched_at FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        digest, content_type, encoding, fetched_at = row
+        if self.max_age is not None and time.time() - fetched_at > self.max_age:
+            return None
+
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                content = zlib.decompress(f.read())
+        except (OSError, zlib.error):
+            return None
+
+        with self.lock:
+            self.conn.execute(
+                "UPDATE objects SET last_access = ? WHERE digest = ?",
+                (time.time(), digest),
+            )
+            self._after_write()
+
+        return CachedPage(url, content, content_type, encoding, fetched_at)
+
+    def _evict(self):
+        """Supprime les contenus les moins récemment utilisés (verrou déjà pris)"""
+        target = self.max_bytes * 0.9
+        evicted = []
+        for digest, size in self.conn.execute(
+            "SELECT digest, size FROM objects ORDER BY last_access"
+        ).fetchall():
+            if self.total_bytes <= target:
+                break
+            evicted.append(digest)
+            self.total_bytes -= size
+
+        for digest in evicted:
+            self.conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+            self.conn.execute("DELETE FROM pages WHERE digest = ?", (digest,))
+            try:
+                os.remove(self._object_path(digest))
+            except OSError:
+                pass
+        self.conn.commit()
+        self._writes = 0
+
+    def _after_write(self):
+        self._writes += 1
+        if self._writes >= self.commit_every:
+            self.conn.commit()
+            self._writes = 0
+
+    def commit(self):
+        """Valide les écritures en attente de l'index"""
+        with self.lock:
+            self.conn.commit()
+            self._writes = 0
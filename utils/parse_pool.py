@@ -0,0 +1,71 @@
+"""
+Pool de processus pour l'analyse des pages HTML.
+
+L'analyse (BeautifulSoup, expressions régulières) est limitée par le CPU :
+sous le GIL, ajouter des threads n'apporte plus rien une fois le réseau
+rapide. Les threads continuent de télécharger les pages et confient leur
+corps brut à ce pool. Chaque processus reçoit une seule fois, à son
+démarrage, une copie de l'objet chargé de l'analyse (DateExtractor,
+KeywordSearcher) ; seuls les pages et les résultats transitent ensuite entre
+processus.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Objet d'analyse installé dans chaque processus par _init_worker
+_worker_target = None
+
+
+def _init_worker(target):
+    global _worker_target
+    _worker_target = target
+
+
+def _call_worker(method_name, args):
+    return getattr(_worker_target, method_name)(*args)
+
+
+def decode_content(content, encoding):
+    """Décode un corps de réponse, en UTF-8 si l'encodage est absent ou inconnu"""
+    try:
+        return content.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
+def workers_for(workers_per_core):
+    """Nombre de processus correspondant à un nombre par cœur (au moins 1)"""
+    return max(1, int(round((os.cpu_count() or 1) * workers_per_core)))
+
+
+class ParsePool:
+    def __init__(self, target, workers_per_core=1.0):
+        """
+        Démarre le pool de processus.
+
+        Args:
+            target (object): Objet d'analyse copié dans chaque processus (doit
+                pouvoir être sérialisé avec pickle)
+            workers_per_core (float): Nombre de processus par cœur
+        """
+        self.max_workers = workers_for(workers_per_core)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(target,),
+        )
+
+    def call(self, method_name, *args):
+        """Exécute target.method_name(*args) dans un processus et renvoie le résultat"""
+        return self.executor.submit(_call_worker, method_name, args).result()
+
+    def shutdown(self):
+        """Arrête les processus"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
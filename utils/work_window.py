@@ -0,0 +1,125 @@
+"""
+Soumission de tâches à un pool de threads par fenêtre glissante.
+
+Au lieu de soumettre toutes les tâches d'un coup (un Future gardé en mémoire
+par élément) ou par lots synchrones (le pool attend la tâche la plus lente de
+chaque lot), une nouvelle tâche est soumise dès qu'une place se libère dans
+la fenêtre. Le nombre de tâches terminées est tenu à jour par des callbacks
+de fin de tâche, ce qui rend le suivi de la progression O(1).
+"""
+
+import time
+import threading
+
+
+class WorkWindow:
+    def __init__(self, executor, max_pending):
+        """
+        Initialise la fenêtre.
+
+        Args:
+            executor (concurrent.futures.Executor): Pool d'exécution
+            max_pending (int): Nombre maximum de tâches soumises non terminées
+        """
+        self.executor = executor
+        self.max_pending = max(1, int(max_pending))
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+        self._slots = threading.Semaphore(self.max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+
+    def submit(self, fn, *args, timeout=None):
+        """
+        Soumet une tâche dès qu'une place est libre dans la fenêtre.
+
+        Args:
+            fn (callable): Fonction à exécuter
+            timeout (float, optional): Attente maximale d'une place en secondes
+
+        Returns:
+            bool: True si la tâche a été soumise, False si le délai a expiré
+        """
+        if not self._slots.acquire(timeout=timeout):
+            return False
+
+        with self._lock:
+            self.submitted += 1
+        try:
+            future = self.executor.submit(fn, *args)
+        except Exception:
+            with self._lock:
+                self.submitted -= 1
+            self._slots.release()
+            raise
+        future.add_done_callback(self._on_done)
+        return True
+
+    def _on_done(self, future):
+        with self._idle:
+            self.completed += 1
+            if not future.cancelled() and future.exception() is not None:
+                self.failed += 1
+            self._idle.notify_all()
+        self._slots.release()
+
+    @property
+    def pending(self):
+        """Nombre de tâches soumises et non terminées"""
+        with self._lock:
+            return self.submitted - self.completed
+
+    def wait(self, timeout=None):
+        """
+        Attend la fin de toutes les tâches soumises.
+
+        Returns:
+            bool: True si toutes les tâches sont terminées
+        """
+        with self._idle:
+            return self._idle.wait_for(
+                lambda: self.completed >= self.submitted, timeout=timeout
+            )
+
+
+def run_in_window(
+    executor, fn, items, max_pending, on_progress=None, progress_interval=0.5
+):
+    """
+    Applique fn à chaque élément en gardant au plus max_pending tâches en vol.
+
+    Args:
+        executor (concurrent.futures.Executor): Pool d'exécution
+        fn (callable): Fonction appelée avec chaque élément
+        items (iterable): Éléments à traiter, lus au fur et à mesure
+        max_pending (int): Taille de la fenêtre de tâches en vol
+        on_progress (callable, optional): Appelée avec le nombre de tâches
+            terminées au plus toutes les progress_interval secondes, puis une
+            dernière fois à la fin
+        progress_interval (float): Intervalle en secondes entre deux appels
+
+    Returns:
+        WorkWindow: Fenêtre utilisée (compteurs submitted, completed, failed)
+    """
+    window = WorkWindow(executor, max_pending)
+    last_progress = time.monotonic()
+
+    def tick():
+        nonlocal last_progress
+        if on_progress and time.monotonic() - last_progress >= progress_interval:
+            last_progress = time.monotonic()
+            on_progress(window.completed)
+
+    for item in items:
+        while not window.submit(fn, item, timeout=progress_interval):
+            tick()
+        tick()
+
+    while not window.wait(timeout=progress_interval):
+        tick()
+
+    if on_progress:
+        on_progress(window.completed)
+    return window